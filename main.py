@@ -1,21 +1,47 @@
+import contextlib
+import os
+
 import dotenv
 import fastapi
+from dependency_injector import providers
 
 dotenv.load_dotenv()
-from orthant.datasets import DatasetsContainer
+from orthant.core.documents import DefaultContentLoader, TextDocumentReader
+from orthant.core.ingestion import DocumentIngestionPipeline
+from orthant.datasets import DatasetsContainer, DatasetSpec
 from orthant.datasets.rest import datasets_router
+from orthant.haystack import HaystackChunkingStrategy
+from orthant.lance import LanceVectorStore
+from orthant.mistral import MistralEmbeddingModel
 from orthant.runtime import initialize_logging, initialize_storage, load_orthant_config
 
+# Dimension of the embeddings of the `mistral-embed` model
+MISTRAL_EMBEDDING_DIM = 1024
+
 
 initialize_logging()
 orthant_config = load_orthant_config()
 initialize_storage(orthant_config)
 
 
-app = fastapi.FastAPI()
-app.include_router(datasets_router, prefix="/api")
+def create_ingestion_pipeline(dataset_spec: DatasetSpec) -> DocumentIngestionPipeline:
+    """Pipeline ingesting a dataset into a Lance table of its own under the storage directory."""
+    if dataset_spec.storage_format != "lance":
+        raise ValueError(f"Unsupported storage format '{dataset_spec.storage_format}'")
+    storage_dir = os.path.expanduser(orthant_config.storage_dir)
+    return DocumentIngestionPipeline(
+        reader=TextDocumentReader(DefaultContentLoader()),
+        chunker=HaystackChunkingStrategy.sentence_splitter(),
+        embedder=MistralEmbeddingModel(),
+        vector_store=LanceVectorStore(
+            os.path.join(storage_dir, dataset_spec.dataset_id, "lance"), embedding_dim=MISTRAL_EMBEDDING_DIM
+        ),
+    )
+
 
 dataset_container = DatasetsContainer()
+dataset_container.pipeline_factory.override(providers.Object(create_ingestion_pipeline))
+dataset_container.storage_dir.override(providers.Object(orthant_config.storage_dir))
 
 import orthant.datasets as orthant_datasets
 import orthant.datasets.rest.rest_api as orthant_datasets_rest
@@ -27,6 +53,16 @@ dataset_container.wire(packages=
 )
 
 
+@contextlib.asynccontextmanager
+async def lifespan(app: fastapi.FastAPI):
+    yield
+    await dataset_container.ingestion_job_runner().shutdown()
+
+
+app = fastapi.FastAPI(lifespan=lifespan)
+app.include_router(datasets_router, prefix="/api")
+
+
 def main():
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1 +1,4 @@
 from .chunking import ChunkingStrategy
+from .regex_chunking import RegexChunkingStrategy
+from .token_chunking import TokenBudgetChunkingStrategy
+from .tokens import estimate_tokens
@@ -0,0 +1,113 @@
+import re
+from collections.abc import Iterable, Iterator
+
+from .chunking import ChunkingStrategy
+from ..documents import OrthantDocument, OrthantDocumentNodeChunk
+
+
+class RegexChunkingStrategy(ChunkingStrategy):
+    """
+    Chunks node text into windows of units matched by a regular expression, e.g. sentences or words.
+
+    Units are found in a single pass over the node text and tracked as (start, end) offsets; each chunk
+    is one slice of the original text from its first unit to its last, so the text between units is
+    kept as-is and nothing else is copied.
+    """
+
+    # A sentence runs up to terminal punctuation followed by whitespace, a blank line, or the end of the text
+    SENTENCE_PATTERN = re.compile(
+        r"""\S.*?(?:[.!?]+["')\]]*(?=\s)|(?=[ \t]*\n[ \t]*\n)|(?=\s*\Z))""",
+        re.DOTALL,
+    )
+    WORD_PATTERN = re.compile(r"\S+")
+
+    def __init__(self, unit_pattern: str | re.Pattern, units_per_chunk: int, overlap: int = 0):
+        """
+        Args:
+            unit_pattern: Regular expression matching one unit (sentence, word, ...)
+            units_per_chunk: Number of units per chunk
+            overlap: Number of units shared by consecutive chunks
+        """
+        if units_per_chunk < 1:
+            raise ValueError(f"units_per_chunk must be at least 1, got {units_per_chunk}")
+        if not 0 <= overlap < units_per_chunk:
+            raise ValueError(f"overlap must be between 0 and units_per_chunk - 1, got {overlap}")
+        self._unit_pattern = re.compile(unit_pattern)
+        self._byte_pattern: re.Pattern | None = None
+        self._units_per_chunk = units_per_chunk
+        self._overlap = overlap
+
+    def chunk_document(self, document: OrthantDocument) -> list[OrthantDocumentNodeChunk]:
+        all_chunks = []
+        for node in document.nodes:
+            for idx, (start, end) in enumerate(self.iter_spans(node.content)):
+                chunk = OrthantDocumentNodeChunk(
+                    document_id=document.document_id,
+                    node_path=node.node_path,
+                    node_chunk_index=idx,
+                    content=node.content[start:end]
+                )
+                all_chunks.append(chunk)
+        return all_chunks
+
+    def iter_spans(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield the (start, end) offsets of each chunk of `text`."""
+        return self._group_units(self._unit_pattern.finditer(text))
+
+    def iter_buffer_spans(self, buffer) -> Iterator[tuple[int, int]]:
+        """
+        Yield the (start, end) byte offsets of each chunk of UTF-8 encoded bytes, without decoding them.
+
+        `buffer` can be any bytes-like object, e.g. `MappedFile.buffer`. The unit pattern is matched as a bytes
+        pattern, so it must be ASCII-only, and its whitespace classes only match ASCII whitespace.
+        Multi-byte characters are never split, so each span can be decoded on its own.
+        """
+        if self._byte_pattern is None:
+            try:
+                source = self._unit_pattern.pattern.encode("ascii")
+            except UnicodeEncodeError:
+                raise ValueError("Only ASCII unit patterns can be matched against bytes") from None
+            self._byte_pattern = re.compile(source, self._unit_pattern.flags & ~re.UNICODE)
+        return self._group_units(self._byte_pattern.finditer(buffer))
+
+    def chunk_buffer(
+        self, document_id: str, node_path: str, buffer, encoding: str = "utf-8"
+    ) -> Iterator[OrthantDocumentNodeChunk]:
+        """
+        Lazily chunk one node's content from a buffer, decoding only the bytes of each chunk.
+        Args:
+            document_id: Document id of the chunks
+            node_path: Node path of the chunks
+            buffer: Bytes-like content of the node, e.g. `MappedFile.buffer`
+            encoding: Encoding of the buffer; must be ASCII-compatible, e.g. UTF-8
+        """
+        view = memoryview(buffer)
+        for idx, (start, end) in enumerate(self.iter_buffer_spans(view)):
+            yield OrthantDocumentNodeChunk(
+                document_id=document_id,
+                node_path=node_path,
+                node_chunk_index=idx,
+                content=str(view[start:end], encoding),
+            )
+
+    def _group_units(self, matches: Iterable[re.Match]) -> Iterator[tuple[int, int]]:
+        window: list[tuple[int, int]] = []
+        has_new_units = False
+        for match in matches:
+            window.append(match.span())
+            has_new_units = True
+            if len(window) == self._units_per_chunk:
+                yield window[0][0], window[-1][1]
+                window = window[len(window) - self._overlap:] if self._overlap else []
+                has_new_units = False
+        # The last partial window only counts if it adds units beyond the previous chunk's overlap
+        if has_new_units:
+            yield window[0][0], window[-1][1]
+
+    @staticmethod
+    def sentence_splitter(n_sentences: int = 6, overlap: int = 2):
+        return RegexChunkingStrategy(RegexChunkingStrategy.SENTENCE_PATTERN, n_sentences, overlap)
+
+    @staticmethod
+    def word_splitter(n_words: int = 200, overlap: int = 20):
+        return RegexChunkingStrategy(RegexChunkingStrategy.WORD_PATTERN, n_words, overlap)
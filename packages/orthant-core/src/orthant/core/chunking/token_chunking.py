@@ -0,0 +1,132 @@
+import functools
+import re
+from collections.abc import Callable, Iterator
+
+from .chunking import ChunkingStrategy
+from .regex_chunking import RegexChunkingStrategy
+from .tokens import estimate_tokens
+from ..documents import OrthantDocument, OrthantDocumentNodeChunk
+
+
+class TokenBudgetChunkingStrategy(ChunkingStrategy):
+    """
+    Chunks node text into runs of whole sentences that fit a token budget, e.g. an embedding model's context limit.
+
+    Each sentence is tokenized once; chunk sizes and overlap windows are computed from those counts, and
+    counts for repeated sentences are served from an LRU cache. A chunk's size is the sum of its sentence
+    counts, so leave some headroom below the model's hard limit for tokenizers that are not additive.
+    Sentences over the budget on their own are split at word boundaries, and single words over the budget
+    are cut into pieces.
+    """
+
+    WORD_PATTERN = re.compile(r"\S+")
+
+    def __init__(
+        self,
+        max_tokens: int,
+        overlap_tokens: int = 0,
+        tokenizer: Callable[[str], int] = estimate_tokens,
+        sentence_pattern: str | re.Pattern = RegexChunkingStrategy.SENTENCE_PATTERN,
+        cache_size: int = 65536,
+    ):
+        """
+        Args:
+            max_tokens: Maximum number of tokens per chunk
+            overlap_tokens: Maximum number of tokens of trailing sentences repeated at the start of the next chunk
+            tokenizer: Function returning the number of tokens in a text (default: `estimate_tokens`)
+            sentence_pattern: Regular expression matching one sentence
+            cache_size: Number of sentence token counts kept in the LRU cache
+        """
+        if max_tokens < 1:
+            raise ValueError(f"max_tokens must be at least 1, got {max_tokens}")
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError(f"overlap_tokens must be between 0 and max_tokens - 1, got {overlap_tokens}")
+        self._max_tokens = max_tokens
+        self._overlap_tokens = overlap_tokens
+        self._tokenizer = tokenizer
+        self._sentence_pattern = re.compile(sentence_pattern)
+        self._cache_size = cache_size
+        self._count_tokens = functools.lru_cache(maxsize=cache_size)(tokenizer)
+
+    def __getstate__(self):
+        # The cache wrapper cannot be pickled; copies start with an empty cache
+        state = self.__dict__.copy()
+        del state["_count_tokens"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._count_tokens = functools.lru_cache(maxsize=self._cache_size)(self._tokenizer)
+
+    def chunk_document(self, document: OrthantDocument) -> list[OrthantDocumentNodeChunk]:
+        all_chunks = []
+        for node in document.nodes:
+            for idx, (start, end) in enumerate(self.iter_spans(node.content)):
+                chunk = OrthantDocumentNodeChunk(
+                    document_id=document.document_id,
+                    node_path=node.node_path,
+                    node_chunk_index=idx,
+                    content=node.content[start:end]
+                )
+                all_chunks.append(chunk)
+        return all_chunks
+
+    def iter_spans(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield the (start, end) offsets of each chunk of `text`."""
+        units = list(self._iter_units(text))
+        i = 0
+        while i < len(units):
+            # Take as many whole units as fit the budget, always at least one
+            j, total = i + 1, units[i][2]
+            while j < len(units) and total + units[j][2] <= self._max_tokens:
+                total += units[j][2]
+                j += 1
+            yield units[i][0], units[j - 1][1]
+            if j == len(units):
+                return
+            # Start the next chunk with the trailing units that fit the overlap budget, leaving room for
+            # the next new unit so no chunk is made of overlap only
+            budget = min(self._overlap_tokens, self._max_tokens - units[j][2])
+            k, overlap = j, 0
+            while k - 1 > i and overlap + units[k - 1][2] <= budget:
+                k -= 1
+                overlap += units[k][2]
+            i = k
+
+    def _iter_units(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield (start, end, tokens) for each sentence, splitting sentences over the budget."""
+        for match in self._sentence_pattern.finditer(text):
+            start, end = match.span()
+            tokens = self._count_tokens(match.group())
+            if tokens <= self._max_tokens:
+                yield start, end, tokens
+            else:
+                yield from self._split_long_sentence(text, start, end)
+
+    def _split_long_sentence(self, text: str, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+        piece: tuple[int, int] | None = None
+        piece_tokens = 0
+        for match in self.WORD_PATTERN.finditer(text, start, end):
+            word_tokens = self._count_tokens(match.group())
+            if piece is not None and piece_tokens + word_tokens > self._max_tokens:
+                yield *piece, piece_tokens
+                piece, piece_tokens = None, 0
+            if word_tokens > self._max_tokens:
+                yield from self._split_long_word(text, *match.span(), word_tokens)
+                continue
+            piece = (piece[0] if piece else match.start(), match.end())
+            piece_tokens += word_tokens
+        if piece is not None:
+            yield *piece, piece_tokens
+
+    def _split_long_word(self, text: str, start: int, end: int, tokens: int) -> Iterator[tuple[int, int, int]]:
+        # Cut into equal slices sized from the word's average characters per token
+        size = max(1, (end - start) * self._max_tokens // tokens)
+        while start < end:
+            piece_end = min(start + size, end)
+            piece_tokens = self._tokenizer(text[start:piece_end])
+            if piece_tokens > self._max_tokens and piece_end - start > 1:
+                size = max(1, size // 2)
+                continue
+            yield start, piece_end, piece_tokens
+            start = piece_end
@@ -1,4 +1,6 @@
 from .content_loader import ContentLoader, DefaultContentLoader
+from .filesystem_pool import FileSystemPool, FileSystemPoolStats
+from .mapped import MappedFile
 from .contracts import *
 from .text_reader import TextDocumentReader
 from .dispatcher import DocumentReaderDispatcher
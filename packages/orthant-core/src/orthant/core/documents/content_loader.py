@@ -1,6 +1,15 @@
-import fsspec
+import asyncio
+import io
+from collections.abc import Iterator
 from typing import runtime_checkable, Protocol
 
+import fsspec
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.local import LocalFileSystem
+
+from .filesystem_pool import FileSystemPool
+from .mapped import MappedFile
+
 
 @runtime_checkable
 class ContentLoader(Protocol):
@@ -9,21 +18,220 @@ class ContentLoader(Protocol):
     async def load_text_async(self, uri: str, *, encoding: str = "utf-8") -> str: ...
     async def load_bytes_async(self, uri: str) -> bytes: ...
 
+    def iter_text(self, uri: str, *, encoding: str = "utf-8", block_size: int = 1 << 20) -> Iterator[str]:
+        """Load text from a URI in blocks of at most `block_size` characters."""
+        text = self.load_text(uri, encoding=encoding)
+        for start in range(0, len(text), block_size):
+            yield text[start:start + block_size]
+
+    def load_many_bytes(self, uris: list[str]) -> list[bytes | Exception]:
+        """Load several URIs. Returns the bytes of each URI in input order, or the exception that URI raised."""
+        return [_capture(self.load_bytes, uri) for uri in uris]
+
+    def load_many_text(self, uris: list[str], *, encoding: str = "utf-8") -> list[str | Exception]:
+        """Load several URIs as text. Returns the text of each URI in input order, or the exception that URI raised."""
+        return [_capture(self.load_text, uri, encoding=encoding) for uri in uris]
+
+    async def load_many_bytes_async(self, uris: list[str]) -> list[bytes | Exception]:
+        return list(await asyncio.gather(*(self.load_bytes_async(uri) for uri in uris), return_exceptions=True))
+
+    async def load_many_text_async(self, uris: list[str], *, encoding: str = "utf-8") -> list[str | Exception]:
+        return list(await asyncio.gather(
+            *(self.load_text_async(uri, encoding=encoding) for uri in uris), return_exceptions=True
+        ))
+
 class DefaultContentLoader(ContentLoader):
+    def __init__(self, max_concurrency: int | None = None, filesystem_pool: FileSystemPool | None = None):
+        """
+        Args:
+            max_concurrency: Maximum number of concurrent requests per filesystem in bulk loads
+                (default: the filesystem's own batch size)
+            filesystem_pool: Pool of filesystem instances to reuse across calls (default: a new pool)
+        """
+        self._max_concurrency = max_concurrency
+        self._filesystem_pool = filesystem_pool if filesystem_pool is not None else FileSystemPool()
+
+    @property
+    def filesystem_pool(self) -> FileSystemPool:
+        return self._filesystem_pool
+
     def load_text(self, uri: str, *, encoding: str = "utf-8") -> str:
         """Load text from a URI"""
-        with fsspec.open(uri, "r", encoding=encoding) as f:
+        if "::" in uri:
+            with fsspec.open(uri, "r", encoding=encoding) as f:
+                return f.read()
+        fs, path = self._filesystem_pool.get(uri)
+        with fs.open(path, "r", encoding=encoding) as f:
             return f.read()
 
     def load_bytes(self, uri: str) -> bytes:
         """Load bytes from a URI"""
-        with fsspec.open(uri, "rb") as f:
+        if "::" in uri:
+            with fsspec.open(uri, "rb") as f:
+                return f.read()
+        fs, path = self._filesystem_pool.get(uri)
+        with fs.open(path, "rb") as f:
             return f.read()
 
+    def iter_text(self, uri: str, *, encoding: str = "utf-8", block_size: int = 1 << 20) -> Iterator[str]:
+        """Read text from a URI in blocks of at most `block_size` characters, without loading the whole file."""
+        if "::" in uri:
+            opened = fsspec.open(uri, "r", encoding=encoding)
+        else:
+            fs, path = self._filesystem_pool.get(uri)
+            opened = fs.open(path, "r", encoding=encoding)
+        with opened as f:
+            while block := f.read(block_size):
+                yield block
+
+    def open_mapped(self, uri: str, *, encoding: str = "utf-8") -> MappedFile:
+        """
+        Memory-map a local file instead of reading it into memory.
+        Args:
+            uri: Local path or file:// URI
+            encoding: Encoding used to decode ranges of the file
+        Returns:
+            MappedFile to use as a context manager
+        """
+        fs, path = (None, uri) if "::" in uri else self._filesystem_pool.get(uri)
+        if not isinstance(fs, LocalFileSystem):
+            raise ValueError(f"Only local files can be memory-mapped, got {uri!r}")
+        return MappedFile(path, encoding=encoding)
+
     async def load_text_async(self, uri: str, *, encoding: str = "utf-8") -> str:
         """Load text from a URI asynchronously"""
-        return self.load_text(uri, encoding=encoding)
+        fs, path = self._async_filesystem(uri)
+        if fs is None:
+            return await asyncio.to_thread(self.load_text, uri, encoding=encoding)
+        return _decode_text(await fs._cat_file(path), encoding)
 
     async def load_bytes_async(self, uri: str) -> bytes:
-        """Load bytes from a URI asynchronously"""
-        return self.load_bytes(uri)
+        """
+        Load bytes from a URI asynchronously.
+
+        Filesystems with an async implementation (s3fs, gcsfs, http, ...) are read natively on the event loop;
+        other filesystems are read on a worker thread.
+        """
+        fs, path = self._async_filesystem(uri)
+        if fs is None:
+            return await asyncio.to_thread(self.load_bytes, uri)
+        return await fs._cat_file(path)
+
+    def load_many_bytes(self, uris: list[str]) -> list[bytes | Exception]:
+        """
+        Load several URIs, batched per filesystem.
+
+        URIs are grouped by filesystem instance and each group is fetched with one `cat_ranges` call,
+        which async filesystems (s3fs, gcsfs, http, ...) run concurrently. Errors are returned in place
+        of the failed URI's bytes instead of aborting the batch.
+        """
+        results: list[bytes | Exception | None] = [None] * len(uris)
+        for fs, group in self._group_by_filesystem(uris, results).values():
+            paths = [path for _, path in group]
+            kwargs = {"batch_size": self._max_concurrency} if isinstance(fs, AsyncFileSystem) else {}
+            for (idx, _), data in zip(group, _cat_all(fs, paths, **kwargs)):
+                results[idx] = data
+        return results
+
+    def load_many_text(self, uris: list[str], *, encoding: str = "utf-8") -> list[str | Exception]:
+        """Load several URIs as text, batched per filesystem. Errors are returned in place of the text."""
+        return [_decode_result(data, encoding) for data in self.load_many_bytes(uris)]
+
+    async def load_many_bytes_async(self, uris: list[str]) -> list[bytes | Exception]:
+        """
+        Load several URIs asynchronously, batched per filesystem.
+
+        Groups on async filesystems are fetched on the event loop with bounded concurrency; groups on
+        sync-only filesystems are fetched on worker threads. All groups are fetched at the same time.
+        """
+        results: list[bytes | Exception | None] = [None] * len(uris)
+        async_groups: dict[int, tuple[AsyncFileSystem, list[tuple[int, str]]]] = {}
+        sync_uris: list[tuple[int, str]] = []
+        for idx, uri in enumerate(uris):
+            try:
+                fs, path = self._async_filesystem(uri)
+            except Exception as e:
+                results[idx] = e
+                continue
+            if fs is None:
+                sync_uris.append((idx, uri))
+            else:
+                async_groups.setdefault(id(fs), (fs, []))[1].append((idx, path))
+
+        async def fetch_async(fs: AsyncFileSystem, group: list[tuple[int, str]]) -> None:
+            paths = [path for _, path in group]
+            data = await fs._cat_ranges(paths, None, None, batch_size=self._max_concurrency, on_error="return")
+            for (idx, _), item in zip(group, data):
+                results[idx] = item
+
+        async def fetch_sync(group: list[tuple[int, str]]) -> None:
+            data = await asyncio.to_thread(self.load_many_bytes, [uri for _, uri in group])
+            for (idx, _), item in zip(group, data):
+                results[idx] = item
+
+        coroutines = [fetch_async(fs, group) for fs, group in async_groups.values()]
+        if sync_uris:
+            coroutines.append(fetch_sync(sync_uris))
+        await asyncio.gather(*coroutines)
+        return results
+
+    async def load_many_text_async(self, uris: list[str], *, encoding: str = "utf-8") -> list[str | Exception]:
+        """Load several URIs as text asynchronously. Errors are returned in place of the text."""
+        return [_decode_result(data, encoding) for data in await self.load_many_bytes_async(uris)]
+
+    def _group_by_filesystem(
+        self, uris: list[str], results: list
+    ) -> dict[int, tuple[fsspec.AbstractFileSystem, list[tuple[int, str]]]]:
+        """Group (index, path) pairs by filesystem instance. URIs that cannot be resolved get their error in `results`."""
+        groups: dict[int, tuple[fsspec.AbstractFileSystem, list[tuple[int, str]]]] = {}
+        for idx, uri in enumerate(uris):
+            try:
+                fs, path = fsspec.core.url_to_fs(uri) if "::" in uri else self._filesystem_pool.get(uri)
+            except Exception as e:
+                results[idx] = e
+                continue
+            groups.setdefault(id(fs), (fs, []))[1].append((idx, path))
+        return groups
+
+    def _async_filesystem(self, uri: str) -> tuple[AsyncFileSystem | None, str]:
+        """Returns a pooled async filesystem bound to the running loop, or None if the URI's filesystem is sync-only."""
+        if "::" in uri:
+            # Chained URIs go through fsspec.open on a worker thread
+            return None, uri
+        protocol = fsspec.core.split_protocol(uri)[0] or "file"
+        try:
+            cls = fsspec.get_filesystem_class(protocol)
+        except (ImportError, ValueError):
+            # Let the sync path raise the usual error
+            return None, uri
+        if not (issubclass(cls, AsyncFileSystem) and cls.async_impl):
+            return None, uri
+        return self._filesystem_pool.get(uri, asynchronous=True)
+
+
+def _cat_all(fs: fsspec.AbstractFileSystem, paths: list[str], **kwargs) -> list[bytes | Exception]:
+    try:
+        return fs.cat_ranges(paths, None, None, on_error="return", **kwargs)
+    except Exception as e:
+        return [e] * len(paths)
+
+
+def _capture(load, uri: str, **kwargs):
+    try:
+        return load(uri, **kwargs)
+    except Exception as e:
+        return e
+
+
+def _decode_result(data: bytes | Exception, encoding: str) -> str | Exception:
+    if isinstance(data, Exception):
+        return data
+    try:
+        return _decode_text(data, encoding)
+    except Exception as e:
+        return e
+
+
+def _decode_text(data: bytes, encoding: str) -> str:
+    """Decode bytes the way a text-mode fsspec file does, including newline translation."""
+    return io.TextIOWrapper(io.BytesIO(data), encoding=encoding).read()
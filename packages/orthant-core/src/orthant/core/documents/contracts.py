@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 from pydantic import BaseModel, Field
 from typing import runtime_checkable, Protocol
 
@@ -20,6 +21,32 @@ class OrthantDocumentNodeChunk(BaseModel):
     node_chunk_index: int
     content: str
 
+class StreamingDocument:
+    """
+    Represents a document whose nodes are produced lazily, e.g. while the file is still being read.
+    Nodes can only be iterated once; use `to_document` to get an `OrthantDocument` holding all of them.
+    """
+
+    def __init__(self, document_id: str, source_uri: str, nodes: Iterable[OrthantDocumentNode]):
+        self.document_id = document_id
+        self.source_uri = source_uri
+        self._nodes = nodes
+        self._consumed = False
+
+    @classmethod
+    def from_document(cls, document: OrthantDocument) -> "StreamingDocument":
+        return cls(document.document_id, document.source_uri, document.nodes)
+
+    def iter_nodes(self) -> Iterator[OrthantDocumentNode]:
+        if self._consumed:
+            raise RuntimeError(f"Nodes of document {self.document_id} were already iterated")
+        self._consumed = True
+        yield from self._nodes
+
+    def to_document(self) -> OrthantDocument:
+        """Read all remaining nodes into an `OrthantDocument`."""
+        return OrthantDocument(document_id=self.document_id, source_uri=self.source_uri, nodes=list(self.iter_nodes()))
+
 @runtime_checkable
 class DocumentReader(Protocol):
     """Document reader protocol"""
@@ -29,3 +56,7 @@ class DocumentReader(Protocol):
 
     def read_file(self, file_uri: str) -> OrthantDocument:
         ...
+
+    def read_file_streaming(self, file_uri: str) -> StreamingDocument:
+        """Read a document whose nodes are produced as they are read. By default wraps `read_file`."""
+        return StreamingDocument.from_document(self.read_file(file_uri))
@@ -1,4 +1,4 @@
-from .contracts import DocumentReader, OrthantDocument
+from .contracts import DocumentReader, OrthantDocument, StreamingDocument
 
 
 class DocumentReaderDispatcher(DocumentReader):
@@ -70,3 +70,22 @@ class DocumentReaderDispatcher(DocumentReader):
                 return reader.read_file(file_uri)
 
         raise ValueError(f"No registered reader can handle URI: {file_uri}")
+
+    def read_file_streaming(self, file_uri: str) -> StreamingDocument:
+        """
+        Read a streaming document using the first reader that can handle the URI.
+
+        Args:
+            file_uri: URI of the document to read
+
+        Returns:
+            StreamingDocument produced by the appropriate reader
+
+        Raises:
+            ValueError: If no reader can handle the given URI
+        """
+        for reader in self._readers:
+            if reader.can_read(file_uri):
+                return reader.read_file_streaming(file_uri)
+
+        raise ValueError(f"No registered reader can handle URI: {file_uri}")
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import fsspec
+from fsspec.asyn import AsyncFileSystem
+
+
+@dataclass
+class FileSystemPoolStats:
+    """Counters of a filesystem pool"""
+    created: int = 0
+    reused: int = 0
+    evicted: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+
+@dataclass
+class _PooledFileSystem:
+    fs: fsspec.AbstractFileSystem
+    last_used: float
+    # Event loop an async instance is bound to
+    loop: weakref.ref | None = None
+
+    def loop_is_gone(self) -> bool:
+        if self.loop is None:
+            return False
+        loop = self.loop()
+        return loop is None or loop.is_closed()
+
+
+class FileSystemPool:
+    """
+    Keyed pool of fsspec filesystem instances.
+
+    Instances are keyed on protocol, bucket (or host) and storage options, so requests to the same bucket
+    with the same credentials share one client and its connection pool. Async instances are also keyed on
+    the event loop they are bound to, and dropped once that loop is closed or garbage-collected. Instances
+    unused for `idle_timeout` seconds are dropped.
+    """
+
+    def __init__(
+        self,
+        storage_options: dict[str, dict] | None = None,
+        max_connections: int | None = None,
+        idle_timeout: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            storage_options: Options passed to the filesystem, keyed by protocol (e.g. "s3") or by
+                protocol and bucket (e.g. "s3://my-bucket"); bucket options override protocol options
+            max_connections: Connection pool size of each instance, for filesystems that expose one (s3)
+            idle_timeout: Seconds after which an unused instance is dropped, or None to keep instances
+            clock: Time source used for idle eviction
+        """
+        self._storage_options = storage_options or {}
+        self._max_connections = max_connections
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._instances: dict[tuple, _PooledFileSystem] = {}
+        self._lock = threading.Lock()
+        self.stats = FileSystemPoolStats()
+
+    def __getstate__(self):
+        # Filesystem clients and locks stay in the process that created them
+        state = self.__dict__.copy()
+        state["_instances"] = {}
+        state["stats"] = FileSystemPoolStats()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get(self, uri: str, *, asynchronous: bool = False) -> tuple[fsspec.AbstractFileSystem, str]:
+        """
+        Returns the pooled filesystem instance for a URI and the path of the URI on that filesystem.
+        Args:
+            uri: URI to resolve; chained URIs (with "::") are not supported
+            asynchronous: Return an instance bound to the running event loop; the filesystem must be async
+        """
+        protocol = fsspec.core.split_protocol(uri)[0] or "file"
+        cls = fsspec.get_filesystem_class(protocol)
+        bucket = urlsplit(uri).netloc if "://" in uri else ""
+        options = {**cls._get_kwargs_from_urls(uri), **self._options_for(protocol, bucket)}
+        loop = None
+        if asynchronous:
+            if not issubclass(cls, AsyncFileSystem):
+                raise ValueError(f"Filesystem for protocol {protocol!r} is not async")
+            loop = asyncio.get_running_loop()
+        key = (protocol, bucket, json.dumps(options, sort_keys=True, default=repr), id(loop) if loop else None)
+        path = cls._strip_protocol(uri)
+        now = self._clock()
+        with self._lock:
+            self._evict_idle(now)
+            pooled = self._instances.get(key)
+            if pooled is not None:
+                pooled.last_used = now
+                self.stats.reused += 1
+                return pooled.fs, path
+        # Create outside the lock; client setup may be slow. A concurrent miss creates a duplicate, which is dropped.
+        extra = {"asynchronous": True, "loop": loop} if asynchronous else {}
+        fs = cls(**options, **extra, skip_instance_cache=True)
+        with self._lock:
+            pooled = self._instances.setdefault(key, _PooledFileSystem(fs, now, weakref.ref(loop) if loop else None))
+            if pooled.fs is fs:
+                self.stats.created += 1
+            else:
+                pooled.last_used = now
+                self.stats.reused += 1
+            return pooled.fs, path
+
+    def evict_idle(self) -> int:
+        """
+        Drop instances unused for longer than the idle timeout, and async instances whose event loop is gone.
+        Returns the number of instances dropped.
+        """
+        with self._lock:
+            return self._evict_idle(self._clock())
+
+    def clear(self) -> None:
+        """Drop all pooled instances."""
+        with self._lock:
+            self.stats.evicted += len(self._instances)
+            self._instances.clear()
+
+    def _options_for(self, protocol: str, bucket: str) -> dict:
+        options = dict(self._storage_options.get(protocol, {}))
+        options.update(self._storage_options.get(f"{protocol}://{bucket}", {}))
+        if self._max_connections is not None and protocol in ("s3", "s3a"):
+            config_kwargs = {"max_pool_connections": self._max_connections, **options.get("config_kwargs", {})}
+            options["config_kwargs"] = config_kwargs
+        return options
+
+    def _evict_idle(self, now: float) -> int:
+        # The id of a dead loop, part of the key, can be reused by a new loop, so its instances go first
+        idle = [
+            key for key, pooled in self._instances.items()
+            if pooled.loop_is_gone()
+            or (self._idle_timeout is not None and now - pooled.last_used > self._idle_timeout)
+        ]
+        for key in idle:
+            del self._instances[key]
+        self.stats.evicted += len(idle)
+        return len(idle)
@@ -0,0 +1,78 @@
+import codecs
+import mmap
+import os
+from collections.abc import Iterator
+
+
+class MappedFile:
+    """
+    Read-only memory map of a local file.
+
+    The file is paged in by the OS as it is accessed rather than read into memory, so `buffer` can be
+    scanned (e.g. with a bytes regular expression) and only the ranges that are needed get decoded.
+    Offsets are byte offsets into the file; newlines are not translated.
+
+    Views taken from `buffer` (slices, or the chunks of a lazy `chunk_buffer` iterator) stay valid after the
+    file is closed: the mapping is then released once the last of them is.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        """
+        Args:
+            path: Local path of the file
+            encoding: Encoding used by `decode` and `iter_text` (default: "utf-8")
+        """
+        self.path = path
+        self.encoding = encoding
+        with open(path, "rb") as f:
+            # Empty files cannot be mapped
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else None
+        self._buffer = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def buffer(self) -> memoryview:
+        """Zero-copy view of the file's bytes; views taken from it outlive `close()`."""
+        return self._buffer
+
+    def decode(self, start: int = 0, end: int | None = None) -> str:
+        """Decode the bytes between two offsets, which must fall on character boundaries."""
+        return str(self._buffer[start:end], self.encoding)
+
+    def iter_text(self, block_size: int = 1 << 20) -> Iterator[tuple[int, str]]:
+        """
+        Decode the file incrementally.
+        Args:
+            block_size: Number of bytes decoded at a time
+        Returns:
+            Iterator of (byte offset, text) blocks; a character split across blocks is decoded with the next block
+        """
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        offset = 0
+        for start in range(0, len(self._buffer), block_size):
+            chunk = self._buffer[start:start + block_size]
+            final = start + block_size >= len(self._buffer)
+            text = decoder.decode(chunk, final=final)
+            # Bytes held back by the decoder belong to the next block
+            pending = len(decoder.getstate()[0])
+            if text:
+                yield offset, text
+            offset = start + len(chunk) - pending
+
+    def close(self) -> None:
+        self._buffer.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views exported from the buffer still use the mapping; it is unmapped when they are released
+                pass
+            self._mmap = None
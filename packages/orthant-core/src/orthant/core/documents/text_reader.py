@@ -1,19 +1,44 @@
+import re
+from collections.abc import Iterator
 from uuid import uuid4
 from pathlib import Path
 from urllib.parse import urlparse
 
 from .content_loader import ContentLoader
-from .contracts import OrthantDocument, OrthantDocumentNode, DocumentReader
+from .contracts import OrthantDocument, OrthantDocumentNode, DocumentReader, StreamingDocument
 
 
 class TextDocumentReader(DocumentReader):
-    """Loads a text file into a `Document`"""
+    """
+    Loads a text file into a `Document`.
+
+    By default the whole file becomes node "1". With a `block_size`, the file is streamed in blocks and
+    split into nodes "1", "2", ... of roughly `block_size` characters, cut at a paragraph break, line
+    break or space near the end of each block so no word is split across nodes.
+    """
 
     # Default extensions this reader can handle
     DEFAULT_EXTENSIONS = {".txt", ".text"}
 
-    def __init__(self, content_loader: ContentLoader, extensions: set[str] | None = None):
+    # Preferred node boundaries, from best to worst
+    _BOUNDARY_PATTERNS = (re.compile(r"\n[ \t]*\n\s*"), re.compile(r"\n"), re.compile(r"\s"))
+
+    def __init__(
+        self,
+        content_loader: ContentLoader,
+        extensions: set[str] | None = None,
+        block_size: int | None = None,
+    ):
+        """
+        Args:
+            content_loader: ContentLoader used to load files
+            extensions: File extensions this reader handles (default: `DEFAULT_EXTENSIONS`)
+            block_size: Approximate number of characters per node when streaming, or None for a single node
+        """
+        if block_size is not None and block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
         self._content_loader = content_loader
+        self._block_size = block_size
         if extensions is None:
             self._extensions = self.DEFAULT_EXTENSIONS
         else:
@@ -57,15 +82,47 @@ class TextDocumentReader(DocumentReader):
 
 
     def read_file(self, file_uri: str) -> OrthantDocument:
-        text_content = self._content_loader.load_text(file_uri)
         doc_id = str(uuid4())
         return OrthantDocument(
             document_id=doc_id,
             source_uri=file_uri,
-            nodes=[
-                OrthantDocumentNode(
-                    node_path="1",
-                    content=text_content
-                )
-            ]
+            nodes=list(self.iter_nodes(file_uri))
         )
+
+    def read_file_streaming(self, file_uri: str) -> StreamingDocument:
+        return StreamingDocument(document_id=str(uuid4()), source_uri=file_uri, nodes=self.iter_nodes(file_uri))
+
+    def iter_nodes(self, file_uri: str) -> Iterator[OrthantDocumentNode]:
+        """
+        Yield the nodes of a file as it is read.
+
+        With a `block_size`, only about one block of text is held at a time, so nodes can be chunked
+        and embedded before the rest of the file is read.
+        """
+        if self._block_size is None:
+            yield OrthantDocumentNode(node_path="1", content=self._content_loader.load_text(file_uri))
+            return
+        n_nodes = 0
+        pending = ""
+        for block in self._content_loader.iter_text(file_uri, block_size=self._block_size):
+            pending += block
+            while len(pending) >= self._block_size:
+                cut = self._find_boundary(pending, self._block_size)
+                n_nodes += 1
+                yield OrthantDocumentNode(node_path=str(n_nodes), content=pending[:cut])
+                pending = pending[cut:]
+        if pending or n_nodes == 0:
+            yield OrthantDocumentNode(node_path=str(n_nodes + 1), content=pending)
+
+    @classmethod
+    def _find_boundary(cls, text: str, block_size: int) -> int:
+        """Offset at which to end a node: after the last boundary in the second half of the first block."""
+        window_start = block_size // 2
+        for pattern in cls._BOUNDARY_PATTERNS:
+            cut = None
+            for match in pattern.finditer(text, window_start, block_size):
+                cut = match.end()
+            if cut is not None:
+                return cut
+        # No boundary nearby, e.g. one very long token: cut at the block size
+        return block_size
@@ -0,0 +1,2 @@
+from .embedding import EmbeddingModel
+from .cache import CachingEmbeddingModel, EmbeddingCacheStats, EmbeddingCacheStore, SqliteEmbeddingCacheStore
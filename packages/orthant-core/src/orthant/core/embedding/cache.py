@@ -0,0 +1,244 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol, runtime_checkable
+
+from .embedding import EmbeddingModel
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Hit and miss counters of a caching embedding model"""
+    memory_hits: int = 0
+    store_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.store_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@runtime_checkable
+class EmbeddingCacheStore(Protocol):
+    """Persistent storage for cached embeddings"""
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]: ...
+    def put_many(self, items: dict[str, list[float]]) -> None: ...
+
+
+class SqliteEmbeddingCacheStore(EmbeddingCacheStore):
+    """
+    Embedding cache stored in a local SQLite database.
+
+    Entries record when they were last used; once the stored vectors exceed `max_bytes`, the least
+    recently used entries are evicted down to `evict_to` of the limit.
+    """
+
+    def __init__(self, path: str, max_bytes: int | None = None, evict_to: float = 0.9):
+        """
+        Args:
+            path: Path of the SQLite database file
+            max_bytes: Maximum total size of the stored vectors, or None for no limit
+            evict_to: Fraction of `max_bytes` kept after an eviction (default: 0.9)
+        """
+        self._max_bytes = max_bytes
+        self._evict_to = evict_to
+        self._lock = threading.Lock()
+        self.evictions = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        if not keys:
+            return {}
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's limit on bound parameters
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+                if rows:
+                    self._conn.execute(
+                        f"UPDATE embeddings SET last_used = ? WHERE key IN ({placeholders})", [time.time(), *batch]
+                    )
+            self._conn.commit()
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        if not items:
+            return
+        now = time.time()
+        rows = [(key, array("d", vector).tobytes()) for key, vector in items.items()]
+        with self._lock:
+            for key, blob in rows:
+                previous = self._conn.execute("SELECT size FROM embeddings WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, blob, len(blob), now),
+                )
+                self._total_bytes += len(blob) - (previous[0] if previous else 0)
+            if self._max_bytes is not None and self._total_bytes > self._max_bytes:
+                self._evict(int(self._max_bytes * self._evict_to))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, target_bytes: int) -> None:
+        """Delete least recently used entries until the stored vectors fit `target_bytes`."""
+        cursor = self._conn.execute("SELECT key, size FROM embeddings ORDER BY last_used")
+        evicted = []
+        for key, size in cursor:
+            if self._total_bytes <= target_bytes:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM embeddings WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+
+class CachingEmbeddingModel(EmbeddingModel):
+    """
+    Embedding model wrapper that only embeds texts it has not seen before.
+
+    Vectors are keyed on the model name and a hash of the normalized text, and looked up in an in-memory
+    LRU first, then in the optional persistent store. Only the misses are sent to the wrapped model,
+    with duplicate texts within a batch embedded once.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingModel,
+        model_name: str | None = None,
+        store: EmbeddingCacheStore | None = None,
+        memory_size: int = 10000,
+    ):
+        """
+        Args:
+            embedder: EmbeddingModel used for cache misses
+            model_name: Name of the embedding model, part of the cache key (default: `embedder.model_name`)
+            store: Persistent cache store, or None to only cache in memory
+            memory_size: Maximum number of vectors kept in the in-memory LRU
+        """
+        model_name = model_name or getattr(embedder, "model_name", None)
+        if not model_name:
+            raise ValueError("model_name is required when the embedder has no model_name attribute")
+        self._embedder = embedder
+        self._model_name = model_name
+        self._store = store
+        self._memory_size = memory_size
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = EmbeddingCacheStats()
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    def encode(self, text: str) -> list[float]:
+        return self.encode_batch([text])[0]
+
+    async def encode_async(self, text: str) -> list[float]:
+        embeddings = await self.encode_batch_async([text])
+        return embeddings[0]
+
+    def encode_batch(self, batch: list[str]) -> list[list[float]]:
+        keys, found, missing = self._lookup(batch)
+        if missing:
+            self._save(missing, self._embedder.encode_batch(list(missing.values())), found)
+        return [found[key] for key in keys]
+
+    async def encode_batch_async(self, batch: list[str]) -> list[list[float]]:
+        keys, found, missing = await self._off_loop(self._lookup, batch)
+        if missing:
+            embeddings = await self._embedder.encode_batch_async(list(missing.values()))
+            await self._off_loop(self._save, missing, embeddings, found)
+        return [found[key] for key in keys]
+
+    def cache_key(self, text: str) -> str:
+        """Cache key of a text: hash of the model name and the NFC-normalized, whitespace-collapsed text."""
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        return hashlib.sha256(f"{self._model_name}\0{normalized}".encode("utf-8")).hexdigest()
+
+    async def _off_loop(self, func, *args):
+        """Run a cache operation on a worker thread if it reads or writes the store, which blocks on SQLite I/O."""
+        if self._store is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def _lookup(self, batch: list[str]) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+        """Returns the key of each text, the cached vectors found, and the texts to embed keyed by cache key."""
+        keys = [self.cache_key(text) for text in batch]
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+        in_memory = set(found)
+        if self._store is not None:
+            unresolved = [key for key in dict.fromkeys(keys) if key not in found]
+            stored = self._store.get_many(unresolved)
+            self._remember(stored)
+            found.update(stored)
+        missing = {}
+        for key, text in zip(keys, batch):
+            if key not in found:
+                missing.setdefault(key, text)
+        with self._lock:
+            for key in keys:
+                if key in in_memory:
+                    self.stats.memory_hits += 1
+                elif key in found:
+                    self.stats.store_hits += 1
+                else:
+                    self.stats.misses += 1
+        return keys, found, missing
+
+    def _save(self, missing: dict[str, str], embeddings: list[list[float]], found: dict[str, list[float]]) -> None:
+        if len(embeddings) != len(missing):
+            raise ValueError(f"Embedding model returned {len(embeddings)} vectors for {len(missing)} texts")
+        computed = dict(zip(missing, embeddings))
+        if self._store is not None:
+            self._store.put_many(computed)
+        self._remember(computed)
+        found.update(computed)
+
+    def _remember(self, vectors: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
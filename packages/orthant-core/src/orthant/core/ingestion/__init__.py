@@ -1 +1,13 @@
-from .pipeline import DocumentIngestionPipeline, EmbeddedDocumentChunk
+from .pipeline import DocumentIngestionPipeline, EmbeddedDocumentChunk, IngestionResult, StageLimits
+from .batching import EmbeddingBatchCoalescer, estimate_tokens
+from .engine import EngineConfig, StagedIngestionEngine
+from .incremental import (
+    IncrementalIngestionPipeline,
+    IncrementalIngestionResult,
+    IngestionStateStore,
+    InMemoryIngestionStateStore,
+    SourceFingerprint,
+    SourceState,
+    fingerprint_uri,
+)
+from .manifest import ManifestEntry, SqliteIngestionManifest
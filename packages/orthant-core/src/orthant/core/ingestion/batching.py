@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from ..chunking import estimate_tokens
+from ..embedding import EmbeddingModel
+
+
+class EmbeddingBatchCoalescer(EmbeddingModel):
+    """
+    Embedding model wrapper that packs texts from many documents into provider-sized batches.
+
+    Concurrent `encode_batch_async` calls are queued together and sent as one request once the
+    batch is full (by text count or token budget) or `max_wait` seconds after the first queued text,
+    whichever comes first. Each caller gets back the vectors for its own texts, in order.
+    Synchronous `encode_batch` calls from several threads, such as a thread-pool executor, are coalesced
+    the same way into `encode_batch` requests; the thread that opened a batch sends it.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingModel,
+        max_batch_size: int = 64,
+        max_batch_tokens: int | None = None,
+        max_wait: float = 0.05,
+        token_counter: Callable[[str], int] = estimate_tokens,
+    ):
+        """
+        Initialize the coalescer.
+        Args:
+            embedder: EmbeddingModel that receives the packed batches
+            max_batch_size: Maximum number of texts per request (default: 64)
+            max_batch_tokens: Maximum number of tokens per request, or None for no token budget
+            max_wait: Seconds a partial batch waits for more texts before it is sent (default: 0.05)
+            token_counter: Function used to count the tokens of a text (default: `estimate_tokens`)
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self._embedder = embedder
+        self._max_batch_size = max_batch_size
+        self._max_batch_tokens = max_batch_tokens
+        self._max_wait = max_wait
+        self._token_counter = token_counter
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._pending_tokens = 0
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task] = set()
+        self._sync_lock = threading.Condition()
+        self._sync_batch: _SyncBatch | None = None
+
+    def encode(self, text: str) -> list[float]:
+        return self._embedder.encode(text)
+
+    async def encode_async(self, text: str) -> list[float]:
+        embeddings = await self.encode_batch_async([text])
+        return embeddings[0]
+
+    def encode_batch(self, batch: list[str]) -> list[list[float]]:
+        if not batch:
+            return []
+        slots: list[tuple[_SyncBatch, int]] = []
+        opened: list[_SyncBatch] = []
+        with self._sync_lock:
+            for text in batch:
+                tokens = self._token_counter(text)
+                pending = self._sync_batch
+                if pending is not None and self._exceeds_budget(len(pending.texts) + 1, pending.tokens + tokens):
+                    self._seal(pending)
+                    pending = None
+                if pending is None:
+                    pending = self._sync_batch = _SyncBatch(deadline=time.monotonic() + self._max_wait)
+                    opened.append(pending)
+                slots.append((pending, len(pending.texts)))
+                pending.texts.append(text)
+                pending.tokens += tokens
+                if len(pending.texts) >= self._max_batch_size:
+                    self._seal(pending)
+        for pending in opened:
+            with self._sync_lock:
+                # Let other threads fill the batch until it is full or max_wait has passed
+                while not pending.sealed and (remaining := pending.deadline - time.monotonic()) > 0:
+                    self._sync_lock.wait(remaining)
+                self._seal(pending)
+            self._encode_sync(pending)
+        embeddings = []
+        for pending, idx in slots:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            embeddings.append(pending.embeddings[idx])
+        return embeddings
+
+    async def encode_batch_async(self, batch: list[str]) -> list[list[float]]:
+        if not batch:
+            return []
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in batch:
+            tokens = self._token_counter(text)
+            if self._pending and self._exceeds_budget(len(self._pending) + 1, self._pending_tokens + tokens):
+                self._dispatch()
+            future = loop.create_future()
+            self._pending.append((text, future))
+            self._pending_tokens += tokens
+            futures.append(future)
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+        if self._pending and self._flush_timer is None:
+            self._flush_timer = loop.call_later(self._max_wait, self._dispatch)
+        return list(await asyncio.gather(*futures))
+
+    async def flush(self) -> None:
+        """Send any partially filled batch now and wait for all outstanding requests."""
+        self._dispatch()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _exceeds_budget(self, n_texts: int, n_tokens: int) -> bool:
+        if n_texts > self._max_batch_size:
+            return True
+        return self._max_batch_tokens is not None and n_tokens > self._max_batch_tokens
+
+    def _seal(self, pending: "_SyncBatch") -> None:
+        """Close a synchronous batch to new texts. Must be called with the lock held."""
+        pending.sealed = True
+        if self._sync_batch is pending:
+            self._sync_batch = None
+        self._sync_lock.notify_all()
+
+    def _encode_sync(self, pending: "_SyncBatch") -> None:
+        try:
+            embeddings = self._embedder.encode_batch(pending.texts)
+            if len(embeddings) != len(pending.texts):
+                raise ValueError(f"Embedding model returned {len(embeddings)} vectors for {len(pending.texts)} texts")
+            pending.embeddings = embeddings
+        except Exception as e:
+            pending.error = e
+        finally:
+            if pending.embeddings is None and pending.error is None:
+                # Interrupted while sending: fail the batch rather than leave the other threads waiting
+                pending.error = RuntimeError("Embedding request was interrupted")
+            pending.done.set()
+
+    def _dispatch(self) -> None:
+        """Send the pending texts as one request."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        pending, self._pending, self._pending_tokens = self._pending, [], 0
+        task = asyncio.get_running_loop().create_task(self._encode_pending(pending))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _encode_pending(self, pending: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            embeddings = await self._embedder.encode_batch_async([text for text, _ in pending])
+            if len(embeddings) != len(pending):
+                raise ValueError(f"Embedding model returned {len(embeddings)} vectors for {len(pending)} texts")
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), embedding in zip(pending, embeddings):
+            # Callers that were cancelled no longer wait for their vectors
+            if not future.done():
+                future.set_result(embedding)
+
+
+@dataclass
+class _SyncBatch:
+    """Texts of synchronous callers waiting to be sent together"""
+    deadline: float
+    texts: list[str] = field(default_factory=list)
+    tokens: int = 0
+    sealed: bool = False
+    done: threading.Event = field(default_factory=threading.Event)
+    embeddings: list[list[float]] | None = None
+    error: Exception | None = None
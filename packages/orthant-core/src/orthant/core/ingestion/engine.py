@@ -0,0 +1,237 @@
+import asyncio
+import datetime as dt
+import functools
+import multiprocessing
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from ..documents import DocumentReader, OrthantDocument, OrthantDocumentNodeChunk
+from ..chunking import ChunkingStrategy
+from ..embedding import EmbeddingModel
+from ..storage import VectorStore
+from .pipeline import IngestionResult, batch_chunk, create_embedded_chunks, flush_vector_store_async
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+@dataclass
+class EngineConfig:
+    """
+    Worker pool sizes and queue bounds for the staged ingestion engine.
+    Every stage has its own workers; stages are joined by queues holding at most `queue_size`
+    documents, so a fast stage blocks instead of running ahead of a slow one. A chunk worker takes
+    up to `chunk_window` of the documents waiting in its queue and chunks them with one
+    `chunk_documents` call.
+    """
+    read_workers: int = 4
+    chunk_workers: int = 1
+    embed_workers: int = 4
+    store_workers: int = 1
+    queue_size: int = 8
+    chunk_window: int = 8
+    chunk_executor: Literal["thread", "process"] = "thread"
+
+
+class StagedIngestionEngine:
+    """
+    Producer/consumer ingestion engine.
+
+    Reading, chunking, embedding and storing run as separate worker pools connected by bounded
+    queues: reads run on a thread pool, chunking on a thread or process pool, and embedding and
+    storing as asyncio tasks. Results are yielded in completion order.
+    """
+
+    def __init__(
+        self,
+        reader: DocumentReader,
+        chunker: ChunkingStrategy,
+        embedder: EmbeddingModel,
+        vector_store: VectorStore,
+        modality: str = "text",
+        config: EngineConfig | None = None,
+    ):
+        """
+        Initialize the engine.
+        Args:
+            reader: DocumentReader to load documents from URIs
+            chunker: ChunkingStrategy to split documents into chunks; must be picklable for process-pool chunking
+            embedder: EmbeddingModel to create vector embeddings
+            vector_store: VectorStore for persisting chunks
+            modality: Content modality (default: "text")
+            config: Worker and queue configuration (default: EngineConfig())
+        """
+        self._reader = reader
+        self._chunker = chunker
+        self._embedder = embedder
+        self._vector_store = vector_store
+        self._modality = modality
+        self._config = config or EngineConfig()
+
+    async def run(self, file_uris: Iterable[str], include_chunks: bool = False) -> AsyncIterator[IngestionResult]:
+        """
+        Ingest documents through the staged workers.
+        Args:
+            file_uris: URIs to ingest; consumed lazily as the read stage has room
+            include_chunks: Attach the stored chunks to each result (default: False)
+        Returns:
+            Async iterator of per-document ingestion results, in completion order; chunks a buffering
+            vector store still holds are flushed once the run ends
+        """
+        config = self._config
+        io_executor = ThreadPoolExecutor(max_workers=config.read_workers + 1, thread_name_prefix="orthant-io")
+        chunk_executor = self._make_chunk_executor()
+        results: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        stages = asyncio.create_task(
+            self._run_stages(iter(file_uris), results, io_executor, chunk_executor, include_chunks)
+        )
+        try:
+            while (result := await results.get()) is not _DONE:
+                yield result
+            try:
+                await stages
+            except ExceptionGroup as eg:
+                raise _first_error(eg) from eg
+        finally:
+            stages.cancel()
+            await asyncio.gather(stages, return_exceptions=True)
+            await flush_vector_store_async(self._vector_store)
+            io_executor.shutdown(wait=False, cancel_futures=True)
+            chunk_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _make_chunk_executor(self) -> Executor:
+        config = self._config
+        if config.chunk_executor == "process":
+            # The engine always runs alongside its I/O threads, which makes fork() unsafe
+            return ProcessPoolExecutor(
+                max_workers=config.chunk_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_chunk_worker,
+                initargs=(self._chunker,),
+            )
+        if config.chunk_executor == "thread":
+            return ThreadPoolExecutor(max_workers=config.chunk_workers, thread_name_prefix="orthant-chunk")
+        raise ValueError(f"Unknown chunk executor: {config.chunk_executor}")
+
+    async def _run_stages(
+        self,
+        file_uris,
+        results: asyncio.Queue,
+        io_executor: Executor,
+        chunk_executor: Executor,
+        include_chunks: bool,
+    ) -> None:
+        config = self._config
+        loop = asyncio.get_running_loop()
+        read_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        chunk_fn = _chunk_in_worker if config.chunk_executor == "process" else functools.partial(batch_chunk, self._chunker)
+
+        async def feed():
+            # The URI iterator may itself block (e.g. a remote listing), so advance it off the loop
+            while (uri := await loop.run_in_executor(io_executor, next, file_uris, _DONE)) is not _DONE:
+                await read_queue.put(uri)
+            await read_queue.put(_DONE)
+
+        async def read(uri: str):
+            document = await loop.run_in_executor(io_executor, self._reader.read_file, uri)
+            return uri, document
+
+        async def chunk(items: list[tuple[str, OrthantDocument]]):
+            chunks = await loop.run_in_executor(chunk_executor, chunk_fn, [document for _, document in items])
+            return [(uri, document_chunks) for (uri, _), document_chunks in zip(items, chunks)]
+
+        async def embed(item: tuple[str, list[OrthantDocumentNodeChunk]]):
+            uri, chunks = item
+            embeddings = await self._embedder.encode_batch_async([c.content for c in chunks])
+            created_at = dt.datetime.now(dt.timezone.utc)
+            return uri, create_embedded_chunks(uri, chunks, embeddings, self._modality, created_at)
+
+        async def store(item):
+            uri, embedded_chunks = item
+            await self._vector_store.store_chunks_async(embedded_chunks)
+            return IngestionResult(
+                source_uri=uri,
+                chunk_count=len(embedded_chunks),
+                chunks=embedded_chunks if include_chunks else None,
+            )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(feed())
+                tg.create_task(_run_stage(config.read_workers, read_queue, chunk_queue, read))
+                tg.create_task(
+                    _run_stage(config.chunk_workers, chunk_queue, embed_queue, chunk, max_batch=config.chunk_window)
+                )
+                tg.create_task(_run_stage(config.embed_workers, embed_queue, store_queue, embed))
+                tg.create_task(_run_stage(config.store_workers, store_queue, results, store))
+        except Exception:
+            # The consumer is still waiting on the results queue; wake it so it can pick up the error
+            await results.put(_DONE)
+            raise
+
+
+async def _run_stage(
+    n_workers: int,
+    inbox: asyncio.Queue,
+    outbox: asyncio.Queue,
+    handle: Callable[[Any], Any],
+    max_batch: int | None = None,
+) -> None:
+    """
+    Run `n_workers` workers moving items from inbox to outbox, then signal the end downstream.
+    With `max_batch`, a worker takes up to that many of the items waiting in its inbox and `handle`
+    maps the list of them to a list of results.
+    """
+    if n_workers < 1:
+        raise ValueError(f"Every stage needs at least one worker, got {n_workers}")
+    if max_batch is not None and max_batch < 1:
+        raise ValueError(f"Batches need room for at least one item, got {max_batch}")
+
+    async def worker():
+        while (item := await inbox.get()) is not _DONE:
+            if max_batch is None:
+                await outbox.put(await handle(item))
+                continue
+            batch = [item]
+            while len(batch) < max_batch and not inbox.empty():
+                if (item := inbox.get_nowait()) is _DONE:
+                    # Leave the end marker for the next get
+                    inbox.put_nowait(_DONE)
+                    break
+                batch.append(item)
+            for result in await handle(batch):
+                await outbox.put(result)
+        # Pass the end marker on to the sibling workers
+        inbox.put_nowait(_DONE)
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(n_workers):
+            tg.create_task(worker())
+    await outbox.put(_DONE)
+
+
+def _first_error(eg: BaseExceptionGroup) -> BaseException:
+    """Unwrap nested task groups to the exception that failed the first stage."""
+    error = eg
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
+_worker_chunker: ChunkingStrategy | None = None
+
+
+def _init_chunk_worker(chunker: ChunkingStrategy) -> None:
+    """Process-pool initializer: unpickle the chunker once per worker."""
+    global _worker_chunker
+    _worker_chunker = chunker
+
+
+def _chunk_in_worker(documents: list[OrthantDocument]) -> list[list[OrthantDocumentNodeChunk]]:
+    return batch_chunk(_worker_chunker, documents)
@@ -0,0 +1,18 @@
+import hashlib
+
+from ..documents import OrthantDocument
+
+
+def hash_document(document: OrthantDocument) -> str:
+    """Content hash over the node paths and contents of a document."""
+    digest = hashlib.sha256()
+    for node in document.nodes:
+        digest.update(node.node_path.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(node.content.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,348 @@
+import datetime as dt
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Literal, Protocol, runtime_checkable
+
+import fsspec
+
+from ..chunking import ChunkingStrategy
+from ..documents import DocumentReader
+from ..embedding import EmbeddingModel
+from ..storage import VectorStore
+from .hashing import hash_document, hash_text
+from .pipeline import DocumentIngestionPipeline, create_embedded_chunks
+
+
+@dataclass
+class SourceFingerprint:
+    """File metadata used to detect changes without reading the file"""
+    size: int | None = None
+    mtime: str | None = None
+    etag: str | None = None
+
+    def matches(self, other: "SourceFingerprint") -> bool:
+        """True when both fingerprints identify the same file version."""
+        if self.size is None or self.size != other.size:
+            return False
+        if self.etag is not None and other.etag is not None:
+            return self.etag == other.etag
+        return self.mtime is not None and self.mtime == other.mtime
+
+
+@dataclass
+class SourceState:
+    """What was last ingested from a source URI"""
+    source_uri: str
+    document_id: str
+    content_hash: str
+    fingerprint: SourceFingerprint | None = None
+    # Content hash of each stored chunk, by node path, in chunk index order
+    chunk_hashes: dict[str, list[str]] = field(default_factory=dict)
+
+
+@runtime_checkable
+class IngestionStateStore(Protocol):
+    """
+    Keeps the state of ingested sources between runs.
+
+    `put_state` must persist the state before it returns: the incremental pipeline records where moved
+    chunks are before it writes to the vector store again, and a deferred write would let a run after a
+    crash move them a second time.
+    """
+
+    def get_state(self, source_uri: str) -> SourceState | None: ...
+    def put_state(self, state: SourceState) -> None: ...
+
+
+class InMemoryIngestionStateStore(IngestionStateStore):
+    """
+    In-memory ingestion state store, for tests and single-process runs.
+
+    The state is lost when the process exits, so the next run re-ingests everything; use a persistent store
+    such as `SqliteIngestionManifest` for runs that are days apart.
+    """
+
+    def __init__(self):
+        self._states: dict[str, SourceState] = {}
+        self._lock = threading.Lock()
+
+    def get_state(self, source_uri: str) -> SourceState | None:
+        with self._lock:
+            return self._states.get(source_uri)
+
+    def put_state(self, state: SourceState) -> None:
+        with self._lock:
+            self._states[state.source_uri] = state
+
+
+@dataclass
+class IncrementalIngestionResult:
+    """Outcome of incrementally ingesting one source"""
+    source_uri: str
+    status: Literal["added", "updated", "unchanged"]
+    chunk_count: int = 0
+    embedded_count: int = 0
+    deleted_count: int = 0
+    moved_count: int = 0
+
+
+def fingerprint_uri(file_uri: str) -> SourceFingerprint | None:
+    """Read the size, modification time and ETag of a file through fsspec, or None if unavailable."""
+    try:
+        fs, path = fsspec.core.url_to_fs(file_uri)
+        info = fs.info(path)
+    except Exception:
+        return None
+    mtime = next(
+        (info[key] for key in ("mtime", "LastModified", "last_modified", "updated", "created") if info.get(key) is not None),
+        None,
+    )
+    etag = info.get("ETag") or info.get("etag")
+    return SourceFingerprint(
+        size=info.get("size"),
+        mtime=str(mtime) if mtime is not None else None,
+        etag=str(etag).strip('"') if etag else None,
+    )
+
+
+class IncrementalIngestionPipeline(DocumentIngestionPipeline):
+    """
+    Ingestion pipeline that only processes what changed since the previous run.
+
+    A source whose size and modification time (or ETag) are unchanged is skipped without being read;
+    a source whose content hash is unchanged is skipped after reading. For changed sources, chunks are
+    matched by content hash within each node: a chunk whose content is already stored keeps its embedding
+    and is only moved to its new index, so inserting a sentence does not re-embed everything after it.
+    Only new content is embedded, and chunks whose content is gone are deleted. Sources keep their
+    document id across runs.
+
+    The state of ingested sources must outlive the process for this to help between runs: pass a
+    persistent `state_store` such as `SqliteIngestionManifest`. The in-memory default is meant for tests.
+    """
+
+    def __init__(
+        self,
+        reader: DocumentReader,
+        chunker: ChunkingStrategy,
+        embedder: EmbeddingModel,
+        vector_store: VectorStore,
+        state_store: IngestionStateStore | None = None,
+        modality: str = "text",
+    ):
+        """
+        Initialize the incremental pipeline.
+        Args:
+            reader: DocumentReader to load documents from URIs
+            chunker: ChunkingStrategy to split documents into chunks
+            embedder: EmbeddingModel to create vector embeddings
+            vector_store: VectorStore for persisting chunks; must support `delete_chunks`. Stores without
+                `reindex_chunks` re-embed chunks that moved instead of moving them
+            state_store: Store for the state of ingested sources (default: in-memory, lost on exit)
+            modality: Content modality (default: "text")
+        """
+        super().__init__(reader, chunker, embedder, vector_store, modality)
+        self._state_store = state_store or InMemoryIngestionStateStore()
+
+    def ingest_incremental(self, file_uri: str) -> IncrementalIngestionResult:
+        """
+        Ingest a source if it changed since it was last ingested.
+        Args:
+            file_uri: URI of the document to ingest
+        Returns:
+            What was done for the source
+        """
+        plan = self._plan(file_uri)
+        if isinstance(plan, IncrementalIngestionResult):
+            return plan
+        embeddings = self._embedder.encode_batch([chunk.content for chunk in plan.changed])
+        result = self._apply(plan, embeddings)
+        self._record_states([plan.state])
+        return result
+
+    async def ingest_incremental_async(self, file_uri: str) -> IncrementalIngestionResult:
+        """
+        Ingest a source asynchronously if it changed since it was last ingested.
+        Args:
+            file_uri: URI of the document to ingest
+        Returns:
+            What was done for the source
+        """
+        plan = self._plan(file_uri)
+        if isinstance(plan, IncrementalIngestionResult):
+            return plan
+        embeddings = await self._embedder.encode_batch_async([chunk.content for chunk in plan.changed])
+        result = self._apply(plan, embeddings)
+        await self.flush_async()
+        self._put_states([plan.state])
+        return result
+
+    def iter_ingest_incremental(
+        self, file_uris: Iterable[str], checkpoint_every: int = 64
+    ) -> Iterator[IncrementalIngestionResult]:
+        """
+        Incrementally ingest sources one at a time.
+        The vector store is flushed, and the state of the sources ingested since the last flush is saved,
+        every `checkpoint_every` changed sources and when the iterator stops.
+        Args:
+            file_uris: URIs to ingest
+            checkpoint_every: Number of changed sources between flushes of the vector store (default: 64)
+        Returns:
+            Iterator of per-source results
+        """
+        if checkpoint_every < 1:
+            raise ValueError(f"checkpoint_every must be at least 1, got {checkpoint_every}")
+        # States are saved once the vector store has written the chunks they describe, which a buffering
+        # store may only do on flush; otherwise a crash would leave sources recorded as ingested without chunks
+        pending: list[SourceState] = []
+        try:
+            for uri in file_uris:
+                if any(state.source_uri == uri for state in pending):
+                    # Plan a repeated source against the state of its previous ingestion
+                    self._record_states(pending)
+                plan = self._plan(uri)
+                if isinstance(plan, IncrementalIngestionResult):
+                    yield plan
+                    continue
+                embeddings = self._embedder.encode_batch([chunk.content for chunk in plan.changed])
+                result = self._apply(plan, embeddings)
+                pending.append(plan.state)
+                if len(pending) >= checkpoint_every:
+                    self._record_states(pending)
+                yield result
+        finally:
+            self._record_states(pending)
+
+    def _plan(self, file_uri: str) -> "_ChangePlan | IncrementalIngestionResult":
+        previous = self._state_store.get_state(file_uri)
+        fingerprint = fingerprint_uri(file_uri)
+        if (
+            previous is not None
+            and previous.fingerprint is not None
+            and fingerprint is not None
+            and fingerprint.matches(previous.fingerprint)
+        ):
+            return IncrementalIngestionResult(source_uri=file_uri, status="unchanged")
+
+        document = self._reader.read_file(file_uri)
+        content_hash = hash_document(document)
+        if previous is not None and previous.content_hash == content_hash:
+            previous.fingerprint = fingerprint
+            self._state_store.put_state(previous)
+            return IncrementalIngestionResult(source_uri=file_uri, status="unchanged")
+
+        if previous is not None:
+            # Keep the stored chunks of this source under the same id
+            document = document.model_copy(update={"document_id": previous.document_id})
+        chunks = self._chunker.chunk_document(document)
+        can_move = callable(getattr(self._vector_store, "reindex_chunks", None))
+        stored = _stored_positions(previous)
+        chunk_hashes: dict[str, list[str]] = {}
+        changed = []
+        moves: dict[tuple[str, int], int] = {}
+        for chunk in chunks:
+            chunk_hash = hash_text(chunk.content)
+            chunk_hashes.setdefault(chunk.node_path, []).append(chunk_hash)
+            positions = stored[chunk.node_path][chunk_hash]
+            # Prefer the stored chunk at the same index, then the first one with the same content
+            if chunk.node_chunk_index in positions:
+                positions.remove(chunk.node_chunk_index)
+            elif positions and can_move:
+                moves[(chunk.node_path, positions.popleft())] = chunk.node_chunk_index
+            else:
+                changed.append(chunk)
+        stale = [
+            (node_path, idx)
+            for node_path, by_hash in stored.items()
+            for positions in by_hash.values()
+            for idx in positions
+        ]
+        state = SourceState(
+            source_uri=file_uri,
+            document_id=document.document_id,
+            content_hash=content_hash,
+            fingerprint=fingerprint,
+            chunk_hashes=chunk_hashes,
+        )
+        return _ChangePlan(
+            state=state,
+            is_new=previous is None,
+            chunk_count=len(chunks),
+            changed=changed,
+            stale=stale,
+            moves=moves,
+        )
+
+    def _apply(self, plan: "_ChangePlan", embeddings: list[list[float]]) -> IncrementalIngestionResult:
+        # Delete and move before writing. If the run stops before the moves, the saved state still
+        # describes the old layout and the next run redoes this source; once chunks were moved, an
+        # intermediate state records where they are, so a retry neither moves them twice nor keeps
+        # chunks that were never written. The state store persists it before returning
+        document_id = plan.state.document_id
+        if plan.stale:
+            self._vector_store.delete_chunks(document_id, plan.stale)
+        if plan.moves:
+            self._vector_store.reindex_chunks(document_id, plan.moves)
+            self._state_store.put_state(_without_changed(plan.state, plan.changed))
+        created_at = dt.datetime.now(dt.timezone.utc)
+        embedded_chunks = create_embedded_chunks(
+            plan.state.source_uri, plan.changed, embeddings, self._modality, created_at
+        )
+        if embedded_chunks:
+            self._vector_store.store_chunks(embedded_chunks)
+        # The final state is saved by the caller, after the vector store is flushed
+        return IncrementalIngestionResult(
+            source_uri=plan.state.source_uri,
+            status="added" if plan.is_new else "updated",
+            chunk_count=plan.chunk_count,
+            embedded_count=len(embedded_chunks),
+            deleted_count=len(plan.stale),
+            moved_count=len(plan.moves),
+        )
+
+    def _record_states(self, states: list[SourceState]) -> None:
+        """Flush the vector store, if it buffers writes, then save the given source states."""
+        self.flush()
+        self._put_states(states)
+
+    def _put_states(self, states: list[SourceState]) -> None:
+        for state in states:
+            self._state_store.put_state(state)
+        states.clear()
+
+
+@dataclass
+class _ChangePlan:
+    state: SourceState
+    is_new: bool
+    chunk_count: int
+    changed: list
+    stale: list[tuple[str, int]]
+    moves: dict[tuple[str, int], int]
+
+
+# Hash recorded for an index whose chunk is not written yet; it matches no content
+_PENDING_HASH = ""
+
+
+def _stored_positions(previous: SourceState | None) -> defaultdict[str, defaultdict[str, deque[int]]]:
+    """Stored chunk indexes of a source, by node path and content hash."""
+    positions: defaultdict[str, defaultdict[str, deque[int]]] = defaultdict(lambda: defaultdict(deque))
+    if previous is not None:
+        for node_path, hashes in previous.chunk_hashes.items():
+            for idx, chunk_hash in enumerate(hashes):
+                positions[node_path][chunk_hash].append(idx)
+    return positions
+
+
+def _without_changed(state: SourceState, changed: list) -> SourceState:
+    """State where the chunks still to be written are pending, and the content hash matches nothing."""
+    chunk_hashes = {node_path: list(hashes) for node_path, hashes in state.chunk_hashes.items()}
+    for chunk in changed:
+        chunk_hashes[chunk.node_path][chunk.node_chunk_index] = _PENDING_HASH
+    return SourceState(
+        source_uri=state.source_uri,
+        document_id=state.document_id,
+        content_hash=_PENDING_HASH,
+        chunk_hashes=chunk_hashes,
+    )
@@ -0,0 +1,193 @@
+import dataclasses
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Literal
+from uuid import uuid4
+
+from .incremental import IngestionStateStore, SourceFingerprint, SourceState
+
+
+ManifestStatus = Literal["in_progress", "done", "failed"]
+
+
+@dataclass
+class ManifestEntry:
+    """Ingestion record of one source URI"""
+    source_uri: str
+    status: ManifestStatus
+    document_id: str
+    attempts: int = 1
+    content_hash: str | None = None
+    chunk_count: int | None = None
+    error: str | None = None
+    updated_at: float = 0.0
+
+
+class SqliteIngestionManifest(IngestionStateStore):
+    """
+    Persistent record of which source URIs were ingested, stored in a local SQLite database.
+
+    URIs are claimed in batches before they are processed, and the claim is committed right away with the
+    document id their chunks will be stored under. Completions are committed at checkpoints, every
+    `checkpoint_every` updates or `checkpoint_interval` seconds. After a crash, a claimed URI without a
+    committed completion is ingested again under the same document id, once its partial chunks are deleted,
+    so a resumed run neither skips nor duplicates sources.
+
+    The manifest is also an `IngestionStateStore` for `IncrementalIngestionPipeline`. Source states are
+    committed as soon as they are put, like claims: the pipeline relies on them being durable before it
+    changes the vector store again.
+    """
+
+    def __init__(self, path: str, checkpoint_every: int = 100, checkpoint_interval: float = 30.0):
+        """
+        Args:
+            path: Path of the SQLite database file
+            checkpoint_every: Number of completed URIs between checkpoints, and size of claimed batches
+            checkpoint_interval: Maximum number of seconds between checkpoints
+        """
+        if checkpoint_every < 1:
+            raise ValueError(f"checkpoint_every must be at least 1, got {checkpoint_every}")
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self._checkpoint_interval = checkpoint_interval
+        self._lock = threading.Lock()
+        self._uncommitted = 0
+        self._last_checkpoint = time.monotonic()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sources ("
+            "source_uri TEXT PRIMARY KEY, status TEXT NOT NULL, document_id TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL, content_hash TEXT, chunk_count INTEGER, error TEXT, "
+            "updated_at REAL NOT NULL, state TEXT)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def for_dataset(cls, storage_dir: str, dataset_id: str, **kwargs) -> "SqliteIngestionManifest":
+        """Manifest of a dataset, stored as `<storage_dir>/<dataset_id>/ingestion_manifest.sqlite`."""
+        path = os.path.join(os.path.expanduser(storage_dir), dataset_id, "ingestion_manifest.sqlite")
+        return cls(path, **kwargs)
+
+    def __enter__(self) -> "SqliteIngestionManifest":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def get_entry(self, source_uri: str) -> ManifestEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source_uri, status, document_id, attempts, content_hash, chunk_count, error, updated_at "
+                "FROM sources WHERE source_uri = ?",
+                (source_uri,),
+            ).fetchone()
+        return ManifestEntry(*row) if row else None
+
+    def claim(self, source_uris: list[str]) -> dict[str, ManifestEntry]:
+        """
+        Mark URIs as in progress and commit immediately.
+        Args:
+            source_uris: URIs about to be ingested
+        Returns:
+            Entries of the URIs to ingest, keyed by URI; URIs already done are left out. An entry with
+            more than one attempt may have partially stored chunks under its document id.
+        """
+        now = time.time()
+        claimed = {}
+        with self._lock:
+            for uri in dict.fromkeys(source_uris):
+                row = self._conn.execute(
+                    "SELECT status, document_id, attempts FROM sources WHERE source_uri = ?", (uri,)
+                ).fetchone()
+                if row is None:
+                    entry = ManifestEntry(uri, "in_progress", str(uuid4()), updated_at=now)
+                elif row[0] == "done":
+                    continue
+                else:
+                    entry = ManifestEntry(uri, "in_progress", row[1], attempts=row[2] + 1, updated_at=now)
+                self._conn.execute(
+                    "INSERT INTO sources (source_uri, status, document_id, attempts, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (source_uri) DO UPDATE SET "
+                    "status = excluded.status, attempts = excluded.attempts, error = NULL, "
+                    "updated_at = excluded.updated_at",
+                    (uri, entry.status, entry.document_id, entry.attempts, now),
+                )
+                claimed[uri] = entry
+            self._commit()
+        return claimed
+
+    def mark_done(self, source_uri: str, content_hash: str | None, chunk_count: int) -> None:
+        self._update(
+            "UPDATE sources SET status = 'done', content_hash = ?, chunk_count = ?, error = NULL, updated_at = ? "
+            "WHERE source_uri = ?",
+            (content_hash, chunk_count, time.time(), source_uri),
+        )
+
+    def mark_failed(self, source_uri: str, error: str) -> None:
+        self._update(
+            "UPDATE sources SET status = 'failed', error = ?, updated_at = ? WHERE source_uri = ?",
+            (error, time.time(), source_uri),
+        )
+
+    def status_counts(self) -> dict[str, int]:
+        """Number of URIs per status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM sources GROUP BY status").fetchall()
+        return dict(rows)
+
+    def checkpoint(self) -> None:
+        """Commit all pending updates."""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    def get_state(self, source_uri: str) -> SourceState | None:
+        with self._lock:
+            row = self._conn.execute("SELECT state FROM sources WHERE source_uri = ?", (source_uri,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        data = json.loads(row[0])
+        fingerprint = data.pop("fingerprint")
+        return SourceState(**data, fingerprint=SourceFingerprint(**fingerprint) if fingerprint else None)
+
+    def put_state(self, state: SourceState) -> None:
+        """Save the state of a source and commit immediately."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sources (source_uri, status, document_id, attempts, content_hash, chunk_count, updated_at, state) "
+                "VALUES (?, 'done', ?, 1, ?, ?, ?, ?) ON CONFLICT (source_uri) DO UPDATE SET "
+                "status = 'done', document_id = excluded.document_id, content_hash = excluded.content_hash, "
+                "chunk_count = excluded.chunk_count, error = NULL, updated_at = excluded.updated_at, state = excluded.state",
+                (
+                    state.source_uri,
+                    state.document_id,
+                    state.content_hash,
+                    sum(len(hashes) for hashes in state.chunk_hashes.values()),
+                    time.time(),
+                    json.dumps(dataclasses.asdict(state)),
+                ),
+            )
+            self._commit()
+
+    def _update(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._uncommitted += 1
+            due = time.monotonic() - self._last_checkpoint >= self._checkpoint_interval
+            if self._uncommitted >= self.checkpoint_every or due:
+                self._commit()
+
+    def _commit(self) -> None:
+        self._conn.commit()
+        self._uncommitted = 0
+        self._last_checkpoint = time.monotonic()
@@ -1,14 +1,26 @@
+import asyncio
+import contextlib
 import datetime as dt
+import itertools
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from dataclasses import dataclass
-from ..documents import DocumentReader
+from typing import TYPE_CHECKING
+from ..documents import DocumentReader, OrthantDocument, OrthantDocumentNodeChunk, StreamingDocument
 from ..chunking import ChunkingStrategy
 from ..embedding import EmbeddingModel
 from ..storage import VectorStore
+from .hashing import hash_document
+
+if TYPE_CHECKING:
+    from .manifest import SqliteIngestionManifest
 
 
 @dataclass
 class EmbeddedDocumentChunk:
-    """A document chunk with its embedding vector"""
+    """
+    A document chunk with its embedding vector.
+    Stores key chunks by `document_id`, which defaults to the source URI.
+    """
     source_uri: str
     node_path: str
     node_chunk_index: int
@@ -16,6 +28,30 @@ class EmbeddedDocumentChunk:
     embedding: list[float]
     modality: str = "text"
     created_at: dt.datetime | None = None
+    document_id: str | None = None
+
+    def __post_init__(self):
+        if self.document_id is None:
+            self.document_id = self.source_uri
+
+
+@dataclass
+class IngestionResult:
+    """Outcome of ingesting one document"""
+    source_uri: str
+    chunk_count: int
+    chunks: list[EmbeddedDocumentChunk] | None = None
+
+
+@dataclass
+class StageLimits:
+    """
+    Per-stage concurrency limits for concurrent batch ingestion.
+    A limit of None leaves the stage bounded only by `max_in_flight`.
+    """
+    read: int | None = None
+    embed: int | None = None
+    store: int | None = None
 
 
 class DocumentIngestionPipeline:
@@ -30,6 +66,7 @@ class DocumentIngestionPipeline:
         embedder: EmbeddingModel,
         vector_store: VectorStore,
         modality: str = "text",
+        chunk_window: int = 1,
     ):
         """
         Initialize the ingestion pipeline.
@@ -39,12 +76,17 @@ class DocumentIngestionPipeline:
             embedder: EmbeddingModel to create vector embeddings
             vector_store: VectorStore for persisting chunks
             modality: Content modality (default: "text")
+            chunk_window: Number of documents `iter_ingest` reads ahead and chunks with one `chunk_documents`
+                call, so a chunker can spread them over its workers (default: 1)
         """
+        if chunk_window < 1:
+            raise ValueError(f"chunk_window must be at least 1, got {chunk_window}")
         self._reader = reader
         self._chunker = chunker
         self._embedder = embedder
         self._vector_store = vector_store
         self._modality = modality
+        self._chunk_window = chunk_window
 
     def ingest(self, file_uri: str) -> list[EmbeddedDocumentChunk]:
         """
@@ -55,11 +97,13 @@ class DocumentIngestionPipeline:
             List of embedded document chunks that were stored
         """
         document = self._reader.read_file(file_uri)
-        chunks = self._chunker.chunk_document(document)
+        return self._embed_and_store(file_uri, self._chunker.chunk_document(document))
+
+    def _embed_and_store(self, file_uri: str, chunks: list[OrthantDocumentNodeChunk]) -> list[EmbeddedDocumentChunk]:
         texts = [chunk.content for chunk in chunks]
         embeddings = self._embedder.encode_batch(texts)
         created_at = dt.datetime.now(dt.timezone.utc)
-        embedded_chunks = self._create_embedded_chunks(chunks, embeddings, created_at)
+        embedded_chunks = self._create_embedded_chunks(file_uri, chunks, embeddings, created_at)
         self._vector_store.store_chunks(embedded_chunks)
         return embedded_chunks
 
@@ -71,14 +115,31 @@ class DocumentIngestionPipeline:
         Returns:
             List of embedded document chunks that were stored
         """
-        document = self._reader.read_file(file_uri)
-        chunks = self._chunker.chunk_document(document)
-        texts = [chunk.content for chunk in chunks]
-        embeddings = await self._embedder.encode_batch_async(texts)
-        created_at = dt.datetime.now(dt.timezone.utc)
-        embedded_chunks = self._create_embedded_chunks(chunks, embeddings, created_at)
-        await self._vector_store.store_chunks_async(embedded_chunks)
-        return embedded_chunks
+        ungated = contextlib.nullcontext()
+        chunk_window = _ChunkWindow(self._chunker, threaded=False)
+        return await self._ingest_gated_async(file_uri, ungated, chunk_window, ungated, ungated, threaded_reads=False)
+
+    def ingest_streaming(self, file_uri: str, batch_size: int = 64) -> IngestionResult:
+        """
+        Ingest a document node by node, embedding and storing chunks in batches as they are produced.
+        Only about one batch of chunks is held at a time, so documents larger than memory can be ingested
+        with a streaming reader.
+        Args:
+            file_uri: URI of the document to ingest
+            batch_size: Number of chunks embedded and stored together (default: 64)
+        Returns:
+            Result with the number of chunks stored; chunks are not kept
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        document = self._reader.read_file_streaming(file_uri)
+        chunk_count = 0
+        for chunks in itertools.batched(iter_chunks(self._chunker, document), batch_size):
+            embeddings = self._embedder.encode_batch([chunk.content for chunk in chunks])
+            created_at = dt.datetime.now(dt.timezone.utc)
+            self._vector_store.store_chunks(self._create_embedded_chunks(file_uri, list(chunks), embeddings, created_at))
+            chunk_count += len(chunks)
+        return IngestionResult(source_uri=file_uri, chunk_count=chunk_count)
 
     def ingest_batch(self, file_uris: list[str]) -> list[EmbeddedDocumentChunk]:
         """
@@ -89,42 +150,384 @@ class DocumentIngestionPipeline:
             Flat list of all embedded chunks from all documents
         """
         all_chunks = []
-        for uri in file_uris:
-            chunks = self.ingest(uri)
-            all_chunks.extend(chunks)
+        for result in self.iter_ingest(file_uris):
+            all_chunks.extend(result.chunks)
         return all_chunks
 
-    async def ingest_batch_async(self, file_uris: list[str]) -> list[EmbeddedDocumentChunk]:
+    async def ingest_batch_async(
+        self,
+        file_uris: list[str],
+        max_in_flight: int = 1,
+        ordered: bool = True,
+        stage_limits: StageLimits | None = None,
+    ) -> list[EmbeddedDocumentChunk]:
         """
         Ingest multiple documents asynchronously into the vector store.
         Args:
             file_uris: List of URIs to ingest
+            max_in_flight: Maximum number of documents being ingested concurrently (default: 1)
+            ordered: Return chunks in input order (True) or in completion order (False)
+            stage_limits: Optional per-stage limits for reading, embedding and storing
         Returns:
             Flat list of all embedded chunks from all documents
         """
         all_chunks = []
-        for uri in file_uris:
-            chunks = await self.ingest_async(uri)
-            all_chunks.extend(chunks)
+        async for result in self.aiter_ingest(file_uris, max_in_flight, ordered, stage_limits):
+            all_chunks.extend(result.chunks)
         return all_chunks
 
+    def iter_ingest(self, file_uris: Iterable[str], include_chunks: bool = True) -> Iterator[IngestionResult]:
+        """
+        Ingest documents one at a time, yielding a result as each document is stored.
+        URIs are consumed lazily, `chunk_window` documents at a time, and nothing is retained between
+        windows, so memory use does not grow with the size of the corpus.
+        Args:
+            file_uris: URIs to ingest, e.g. a generator over a directory listing
+            include_chunks: Attach the stored chunks to each result; set to False to only get counts
+        Returns:
+            Iterator of per-document ingestion results
+        """
+        try:
+            for uris in itertools.batched(file_uris, self._chunk_window):
+                documents = [self._reader.read_file(uri) for uri in uris]
+                for uri, chunks in zip(uris, batch_chunk(self._chunker, documents)):
+                    yield self._make_result(uri, self._embed_and_store(uri, chunks), include_chunks)
+        finally:
+            self.flush()
+
+    def iter_ingest_resumable(
+        self,
+        file_uris: Iterable[str],
+        manifest: "SqliteIngestionManifest",
+        include_chunks: bool = False,
+        skip_failed: bool = False,
+        on_failure: Callable[[str, Exception], None] | None = None,
+    ) -> Iterator[IngestionResult]:
+        """
+        Ingest documents, recording progress in a manifest so an interrupted run can be resumed.
+        URIs already done in the manifest are skipped. A URI that was claimed but not completed by an
+        earlier run has its partially stored chunks deleted before it is ingested again.
+        Args:
+            file_uris: URIs to ingest; pass the same URIs again to resume
+            manifest: Manifest recording the status of each URI
+            include_chunks: Attach the stored chunks to each result (default: False)
+            skip_failed: Record failures and continue instead of raising
+            on_failure: Called with the URI and the error of each URI that fails
+        Returns:
+            Iterator of per-document results for the URIs ingested by this run
+        """
+        # Completions are recorded once the vector store has written their chunks, which a buffering store
+        # may only do on flush
+        completed: list[tuple[str, str, int]] = []
+        try:
+            for batch in itertools.batched(file_uris, manifest.checkpoint_every):
+                claimed = manifest.claim(list(batch))
+                for uri, entry in claimed.items():
+                    try:
+                        if entry.attempts > 1:
+                            self._vector_store.delete_chunks(entry.document_id)
+                        document = self._reader.read_file(uri).model_copy(update={"document_id": entry.document_id})
+                        chunks = self._chunker.chunk_document(document)
+                        embeddings = self._embedder.encode_batch([chunk.content for chunk in chunks])
+                        created_at = dt.datetime.now(dt.timezone.utc)
+                        embedded_chunks = self._create_embedded_chunks(uri, chunks, embeddings, created_at)
+                        self._vector_store.store_chunks(embedded_chunks)
+                    except Exception as e:
+                        manifest.mark_failed(uri, f"{type(e).__name__}: {e}")
+                        if on_failure is not None:
+                            on_failure(uri, e)
+                        if skip_failed:
+                            continue
+                        raise
+                    completed.append((uri, hash_document(document), len(embedded_chunks)))
+                    yield self._make_result(uri, embedded_chunks, include_chunks)
+                self._record_completed(manifest, completed)
+        finally:
+            self._record_completed(manifest, completed)
+            manifest.checkpoint()
+
+    def _record_completed(self, manifest: "SqliteIngestionManifest", completed: list[tuple[str, str, int]]) -> None:
+        """Flush the vector store, if it buffers writes, then mark the completed URIs done."""
+        if not completed:
+            return
+        self.flush()
+        for uri, content_hash, chunk_count in completed:
+            manifest.mark_done(uri, content_hash, chunk_count)
+        completed.clear()
+
+    async def aiter_ingest(
+        self,
+        file_uris: Iterable[str],
+        max_in_flight: int = 1,
+        ordered: bool = True,
+        stage_limits: StageLimits | None = None,
+        include_chunks: bool = True,
+    ) -> AsyncIterator[IngestionResult]:
+        """
+        Ingest documents asynchronously, yielding a result as each document is stored.
+        URIs are consumed lazily, at most `max_in_flight` documents are held at once.
+        Args:
+            file_uris: URIs to ingest, e.g. a generator over a directory listing
+            max_in_flight: Maximum number of documents being ingested concurrently (default: 1)
+            ordered: Yield results in input order (True) or in completion order (False)
+            stage_limits: Optional per-stage limits for reading, embedding and storing
+            include_chunks: Attach the stored chunks to each result; set to False to only get counts
+        Returns:
+            Async iterator of per-document ingestion results
+        """
+        try:
+            async for uri, chunks in self._ingest_concurrently_async(file_uris, max_in_flight, ordered, stage_limits):
+                yield self._make_result(uri, chunks, include_chunks)
+        finally:
+            await self.flush_async()
+
+    def flush(self) -> None:
+        """Write out chunks the vector store still buffers; a no-op for stores that write right away."""
+        flush_vector_store(self._vector_store)
+
+    async def flush_async(self) -> None:
+        """Asynchronous version of `flush`."""
+        await flush_vector_store_async(self._vector_store)
+
+    def close(self) -> None:
+        """Flush the vector store, then close it if it holds resources such as a flush timer."""
+        close = getattr(self._vector_store, "close", None)
+        if callable(close):
+            close()
+        else:
+            self.flush()
+
+    async def _ingest_concurrently_async(
+        self,
+        file_uris: Iterable[str],
+        max_in_flight: int,
+        ordered: bool,
+        stage_limits: StageLimits | None,
+    ) -> AsyncIterator[tuple[str, list[EmbeddedDocumentChunk]]]:
+        """
+        Ingest documents with at most `max_in_flight` of them in progress at once.
+        Yields (uri, chunks) pairs, in input order when `ordered` is set. In ordered mode, finished
+        documents waiting for an earlier one still count against `max_in_flight`, so the reorder
+        buffer stays bounded. Documents read while others are being chunked are chunked together.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        limits = stage_limits or StageLimits()
+        read_gate = _stage_gate(limits.read)
+        embed_gate = _stage_gate(limits.embed)
+        store_gate = _stage_gate(limits.store)
+        # Offload blocking reads and chunking only when documents actually overlap
+        threaded_reads = max_in_flight > 1
+        chunk_window = _ChunkWindow(self._chunker, threaded=threaded_reads)
+
+        pending_uris = enumerate(file_uris)
+        running: dict[asyncio.Task, tuple[int, str]] = {}
+        finished: dict[int, tuple[str, list[EmbeddedDocumentChunk]]] = {}
+        next_index = 0
+
+        def schedule():
+            while len(running) + len(finished) < max_in_flight:
+                item = next(pending_uris, None)
+                if item is None:
+                    return
+                index, uri = item
+                task = asyncio.create_task(
+                    self._ingest_gated_async(uri, read_gate, chunk_window, embed_gate, store_gate, threaded_reads)
+                )
+                running[task] = (index, uri)
+
+        try:
+            schedule()
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: running[t][0]):
+                    index, uri = running.pop(task)
+                    finished[index] = (uri, task.result())
+                if ordered:
+                    while next_index in finished:
+                        yield finished.pop(next_index)
+                        next_index += 1
+                else:
+                    for index in sorted(finished):
+                        yield finished.pop(index)
+                schedule()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _ingest_gated_async(
+        self,
+        file_uri: str,
+        read_gate: contextlib.AbstractAsyncContextManager,
+        chunk_window: "_ChunkWindow",
+        embed_gate: contextlib.AbstractAsyncContextManager,
+        store_gate: contextlib.AbstractAsyncContextManager,
+        threaded_reads: bool,
+    ) -> list[EmbeddedDocumentChunk]:
+        """Same as `ingest_async`, with each stage guarded by its concurrency gate and chunking shared."""
+        async with read_gate:
+            if threaded_reads:
+                document = await asyncio.to_thread(self._reader.read_file, file_uri)
+            else:
+                document = self._reader.read_file(file_uri)
+        chunks = await chunk_window.chunk(document)
+        texts = [chunk.content for chunk in chunks]
+        async with embed_gate:
+            embeddings = await self._embedder.encode_batch_async(texts)
+        created_at = dt.datetime.now(dt.timezone.utc)
+        embedded_chunks = self._create_embedded_chunks(file_uri, chunks, embeddings, created_at)
+        async with store_gate:
+            await self._vector_store.store_chunks_async(embedded_chunks)
+        return embedded_chunks
+
+    @staticmethod
+    def _make_result(uri: str, chunks: list[EmbeddedDocumentChunk], include_chunks: bool) -> IngestionResult:
+        return IngestionResult(source_uri=uri, chunk_count=len(chunks), chunks=chunks if include_chunks else None)
+
     def _create_embedded_chunks(
         self,
+        source_uri: str,
         chunks: list,
         embeddings: list[list[float]],
         created_at: dt.datetime,
     ) -> list[EmbeddedDocumentChunk]:
         """Convert chunks and embeddings into EmbeddedDocumentChunk objects."""
-        embedded_chunks = []
-        for chunk, embedding in zip(chunks, embeddings):
-            embedded_chunk = EmbeddedDocumentChunk(
-                source_uri=chunk.document_id,
-                node_path=chunk.node_path,
-                node_chunk_index=chunk.node_chunk_index,
-                content=chunk.content,
-                embedding=embedding,
-                modality=self._modality,
-                created_at=created_at,
-            )
-            embedded_chunks.append(embedded_chunk)
-        return embedded_chunks
+        return create_embedded_chunks(source_uri, chunks, embeddings, self._modality, created_at)
+
+
+def create_embedded_chunks(
+    source_uri: str,
+    chunks: list,
+    embeddings: list[list[float]],
+    modality: str,
+    created_at: dt.datetime,
+) -> list[EmbeddedDocumentChunk]:
+    """Convert the chunks of the document read from `source_uri`, and their embeddings, into EmbeddedDocumentChunk objects."""
+    embedded_chunks = []
+    for chunk, embedding in zip(chunks, embeddings):
+        embedded_chunk = EmbeddedDocumentChunk(
+            source_uri=source_uri,
+            node_path=chunk.node_path,
+            node_chunk_index=chunk.node_chunk_index,
+            content=chunk.content,
+            embedding=embedding,
+            modality=modality,
+            created_at=created_at,
+            document_id=chunk.document_id,
+        )
+        embedded_chunks.append(embedded_chunk)
+    return embedded_chunks
+
+
+def batch_chunk(chunker: ChunkingStrategy, documents: list[OrthantDocument]) -> list[list[OrthantDocumentNodeChunk]]:
+    """Chunk documents with one `chunk_documents` call, or one at a time if the chunker only has `chunk_document`."""
+    # Looked up on the class: chunkers need not subclass ChunkingStrategy, and a Mock would answer any attribute
+    if callable(getattr(type(chunker), "chunk_documents", None)):
+        return chunker.chunk_documents(documents)
+    return [chunker.chunk_document(document) for document in documents]
+
+
+def iter_chunks(chunker: ChunkingStrategy, document: StreamingDocument) -> Iterator[OrthantDocumentNodeChunk]:
+    """Chunk a streaming document with `iter_chunks`, or node by node if the chunker only has `chunk_document`."""
+    if callable(getattr(type(chunker), "iter_chunks", None)):
+        return chunker.iter_chunks(document)
+    # Each node is chunked as soon as it is read, so only one node is held at a time
+    return (
+        chunk
+        for node in document.iter_nodes()
+        for chunk in chunker.chunk_document(
+            OrthantDocument(document_id=document.document_id, source_uri=document.source_uri, nodes=[node])
+        )
+    )
+
+
+def flush_vector_store(vector_store: VectorStore) -> None:
+    """Flush a vector store that buffers writes."""
+    flush = getattr(vector_store, "flush", None)
+    if callable(flush):
+        flush()
+
+
+async def flush_vector_store_async(vector_store: VectorStore) -> None:
+    """Flush a vector store that buffers writes, asynchronously if it supports it."""
+    flush_async = getattr(vector_store, "flush_async", None)
+    if callable(flush_async):
+        await flush_async()
+    else:
+        flush = getattr(vector_store, "flush", None)
+        if callable(flush):
+            await asyncio.to_thread(flush)
+
+
+class _ChunkWindow:
+    """
+    Chunks the documents of concurrent ingestions together.
+    Documents queued while a `chunk_documents` call runs go into the next call, so the window grows with
+    the number of documents in flight. When a call fails, its documents are chunked again one at a time,
+    so a document that cannot be chunked does not fail the others.
+    """
+
+    def __init__(self, chunker: ChunkingStrategy, threaded: bool):
+        self._chunker = chunker
+        self._threaded = threaded
+        self._pending: list[tuple[OrthantDocument, asyncio.Future]] = []
+        self._task: asyncio.Task | None = None
+
+    async def chunk(self, document: OrthantDocument) -> list[OrthantDocumentNodeChunk]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((document, future))
+        if self._task is None:
+            self._task = loop.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        try:
+            # Let documents read in the same loop iteration join the first window
+            await asyncio.sleep(0)
+            while self._pending:
+                pending, self._pending = self._pending, []
+                try:
+                    chunks = await self._chunk([document for document, _ in pending])
+                except Exception as e:
+                    if len(pending) == 1:
+                        _settle(pending[0][1], exception=e)
+                        continue
+                    # Chunk the documents of the failed window one at a time, so only the bad ones fail
+                    for document, future in pending:
+                        try:
+                            [document_chunks] = await self._chunk([document])
+                        except Exception as document_error:
+                            _settle(future, exception=document_error)
+                        else:
+                            _settle(future, document_chunks)
+                    continue
+                for (_, future), document_chunks in zip(pending, chunks):
+                    _settle(future, document_chunks)
+        finally:
+            self._task = None
+
+    async def _chunk(self, documents: list[OrthantDocument]) -> list[list[OrthantDocumentNodeChunk]]:
+        if self._threaded:
+            return await asyncio.to_thread(batch_chunk, self._chunker, documents)
+        return batch_chunk(self._chunker, documents)
+
+
+def _settle(future: asyncio.Future, result=None, exception: Exception | None = None) -> None:
+    """Resolve a future unless its waiter already gave up on it."""
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+def _stage_gate(limit: int | None) -> contextlib.AbstractAsyncContextManager:
+    """Semaphore bounding a pipeline stage, or a no-op gate when the stage is unbounded."""
+    if limit is None:
+        return contextlib.nullcontext()
+    if limit < 1:
+        raise ValueError(f"Stage limit must be at least 1, got {limit}")
+    return asyncio.Semaphore(limit)
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from ..ingestion import EmbeddedDocumentChunk
+
+
+@runtime_checkable
+class VectorStore(Protocol):
+    """Vector store"""
+
+    def store_chunks(self, chunks: list["EmbeddedDocumentChunk"]) -> None:
+        ...
+
+    async def store_chunks_async(self, chunks: list["EmbeddedDocumentChunk"]) -> None:
+        ...
+
+    def delete_chunks(self, document_id: str, chunk_keys: list[tuple[str, int]] | None = None) -> None:
+        """Delete the chunks of a document, or only those with the given (node_path, node_chunk_index) keys."""
+        ...
+
+    def reindex_chunks(self, document_id: str, moves: dict[tuple[str, int], int]) -> None:
+        """
+        Change the index of stored chunks of a document, keeping their embeddings. Optional.
+        Moves map (node_path, node_chunk_index) keys to new indexes within the same node, and are applied
+        all at once, so a chunk may move to the index another one is leaving.
+        """
+        ...
+
+    def search(self, query_vector: list[float], limit: int = 10) -> list["EmbeddedDocumentChunk"]:
+        ...
+
+    async def search_async(self, query_vector: list[float], limit: int = 10) -> list["EmbeddedDocumentChunk"]:
+        ...
@@ -0,0 +1,57 @@
+import pytest
+
+
+class RecordingVectorStore:
+    """
+    Vector store fake that keeps rows like an append-only table.
+
+    Rows are (document_id, node_path, node_chunk_index, content) tuples; storing a key twice keeps both rows,
+    so duplicate writes show up. With `buffered`, chunks are only written on `flush()`.
+    """
+
+    def __init__(self, buffered: bool = False):
+        self.rows: list[tuple[str, str, int, str]] = []
+        self.pending = []
+        self._buffered = buffered
+
+    def store_chunks(self, chunks):
+        if self._buffered:
+            self.pending.extend(chunks)
+        else:
+            self._write(chunks)
+
+    async def store_chunks_async(self, chunks):
+        self.store_chunks(chunks)
+
+    def flush(self):
+        self._write(self.pending)
+        self.pending = []
+
+    def delete_chunks(self, document_id, chunk_keys=None):
+        self.rows = [
+            row for row in self.rows
+            if row[0] != document_id or (chunk_keys is not None and row[1:3] not in chunk_keys)
+        ]
+
+    def reindex_chunks(self, document_id, moves):
+        self.rows = [
+            (row[0], row[1], moves.get(row[1:3], row[2]), row[3]) if row[0] == document_id else row
+            for row in self.rows
+        ]
+
+    def contents(self) -> list[str]:
+        """Content of the stored rows, sorted."""
+        return sorted(row[3] for row in self.rows)
+
+    def _write(self, chunks):
+        self.rows.extend((c.document_id, c.node_path, c.node_chunk_index, c.content) for c in chunks)
+
+
+@pytest.fixture
+def store() -> RecordingVectorStore:
+    return RecordingVectorStore()
+
+
+@pytest.fixture
+def buffering_store() -> RecordingVectorStore:
+    return RecordingVectorStore(buffered=True)
@@ -0,0 +1,269 @@
+import pickle
+import pytest
+
+from orthant.core.chunking import ChunkingStrategy, RegexChunkingStrategy, TokenBudgetChunkingStrategy, estimate_tokens
+from orthant.core.documents import OrthantDocument, OrthantDocumentNode, OrthantDocumentNodeChunk, StreamingDocument
+from orthant.core.ingestion.pipeline import batch_chunk, iter_chunks
+
+
+class NodeChunker:
+    """Chunker that only implements chunk_document, without subclassing ChunkingStrategy: one chunk per node"""
+    def chunk_document(self, document: OrthantDocument) -> list[OrthantDocumentNodeChunk]:
+        return [
+            OrthantDocumentNodeChunk(
+                document_id=document.document_id,
+                node_path=node.node_path,
+                node_chunk_index=0,
+                content=node.content,
+            )
+            for node in document.nodes
+        ]
+
+
+@pytest.mark.unit
+class TestChunkingStrategy:
+    def test_chunk_document_is_enough_for_the_protocol(self):
+        assert isinstance(NodeChunker(), ChunkingStrategy)
+
+    def test_batch_chunk_falls_back_to_chunk_document(self):
+        documents = [
+            OrthantDocument(document_id="d1", source_uri="test://1", nodes=[OrthantDocumentNode(node_path="1", content="a")]),
+            OrthantDocument(document_id="d2", source_uri="test://2", nodes=[]),
+        ]
+
+        chunks = batch_chunk(NodeChunker(), documents)
+
+        assert [[c.content for c in doc_chunks] for doc_chunks in chunks] == [["a"], []]
+
+
+@pytest.mark.unit
+class TestStreamingChunking:
+
+    def test_iter_chunks_matches_chunk_document(self):
+        document = _document("One. Two. Three.", "Four. Five.")
+        chunker = RegexChunkingStrategy.sentence_splitter(n_sentences=2, overlap=0)
+        streamed = list(iter_chunks(chunker, StreamingDocument.from_document(document)))
+        assert streamed == chunker.chunk_document(document)
+
+    def test_iter_chunks_reads_nodes_lazily(self):
+        read = []
+
+        def nodes():
+            for i in range(3):
+                read.append(i)
+                yield OrthantDocumentNode(node_path=str(i + 1), content=f"Node {i}.")
+
+        chunks = iter_chunks(NodeChunker(), StreamingDocument("doc", "mem://doc", nodes()))
+        first = next(chunks)
+        assert first.node_path == "1"
+        assert read == [0]
+
+
+def _document(*contents: str) -> OrthantDocument:
+    return OrthantDocument(
+        document_id="doc",
+        source_uri="test://doc.txt",
+        nodes=[OrthantDocumentNode(node_path=str(i + 1), content=c) for i, c in enumerate(contents)],
+    )
+
+
+def _norm(s: str) -> str:
+    return " ".join(s.split())
+
+
+@pytest.mark.unit
+class TestRegexChunkingStrategy:
+    def test_chunk_by_sentences(self):
+        subject = RegexChunkingStrategy.sentence_splitter(n_sentences=2, overlap=0)
+        text = """Orthant ingests CSVs and PDFs.
+It builds embeddings for search.
+
+Chunking preserves meaning.
+Overlap reduces boundary loss.
+This line checks splitting."""
+
+        chunks = subject.chunk_document(_document(text))
+
+        assert [_norm(c.content) for c in chunks] == [
+            "Orthant ingests CSVs and PDFs. It builds embeddings for search.",
+            "Chunking preserves meaning. Overlap reduces boundary loss.",
+            "This line checks splitting.",
+        ]
+        assert [c.node_chunk_index for c in chunks] == [0, 1, 2]
+        assert all(c.document_id == "doc" and c.node_path == "1" for c in chunks)
+
+    def test_chunk_by_sentences_with_overlap(self):
+        subject = RegexChunkingStrategy.sentence_splitter(n_sentences=3, overlap=1)
+        sentences = [f"Sentence number {i}." for i in range(7)]
+
+        chunks = subject.chunk_document(_document(" ".join(sentences)))
+
+        assert [c.content for c in chunks] == [
+            " ".join(sentences[0:3]),
+            " ".join(sentences[2:5]),
+            " ".join(sentences[4:7]),
+        ]
+
+    def test_no_trailing_chunk_made_only_of_overlap(self):
+        subject = RegexChunkingStrategy.sentence_splitter(n_sentences=3, overlap=1)
+
+        chunks = subject.chunk_document(_document("One. Two. Three. Four. Five."))
+
+        assert [c.content for c in chunks] == ["One. Two. Three.", "Three. Four. Five."]
+
+    def test_blank_line_ends_sentence(self):
+        subject = RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0)
+
+        chunks = subject.chunk_document(_document("A heading\n\nBody text! Trailing words  \n"))
+
+        assert [c.content for c in chunks] == ["A heading", "Body text!", "Trailing words"]
+
+    def test_chunks_are_slices_of_the_node(self):
+        subject = RegexChunkingStrategy.word_splitter(n_words=3, overlap=1)
+        text = "  alpha beta\tgamma\ndelta  epsilon "
+
+        spans = list(subject.iter_spans(text))
+
+        assert [text[s:e] for s, e in spans] == ["alpha beta\tgamma", "gamma\ndelta  epsilon"]
+
+    def test_multiple_and_empty_nodes(self):
+        subject = RegexChunkingStrategy.word_splitter(n_words=2, overlap=0)
+
+        chunks = subject.chunk_document(_document("a b c", "", "d"))
+
+        assert [(c.node_path, c.node_chunk_index, c.content) for c in chunks] == [
+            ("1", 0, "a b"),
+            ("1", 1, "c"),
+            ("3", 0, "d"),
+        ]
+
+    def test_custom_pattern(self):
+        subject = RegexChunkingStrategy(r"[^,]+", units_per_chunk=2)
+
+        chunks = subject.chunk_document(_document("a,b,c"))
+
+        assert [c.content for c in chunks] == ["a,b", "c"]
+
+    @pytest.mark.parametrize(("units_per_chunk", "overlap"), [(0, 0), (2, 2), (2, -1)])
+    def test_invalid_window(self, units_per_chunk, overlap):
+        with pytest.raises(ValueError):
+            RegexChunkingStrategy(r"\S+", units_per_chunk, overlap)
+
+
+@pytest.mark.unit
+class TestRegexBufferChunking:
+
+    TEXT = "Première phrase ici. Deuxième — avec des accents! Troisième?\n\nÉpilogue sans point"
+
+    @pytest.mark.parametrize("chunker", [
+        RegexChunkingStrategy.sentence_splitter(n_sentences=2, overlap=1),
+        RegexChunkingStrategy.word_splitter(n_words=3, overlap=1),
+    ])
+    def test_buffer_spans_match_text_spans(self, chunker):
+        data = self.TEXT.encode("utf-8")
+        from_text = [self.TEXT[start:end] for start, end in chunker.iter_spans(self.TEXT)]
+        from_bytes = [data[start:end].decode("utf-8") for start, end in chunker.iter_buffer_spans(data)]
+        assert from_bytes == from_text
+
+    def test_chunk_buffer(self):
+        chunker = RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0)
+        chunks = list(chunker.chunk_buffer("doc", "1", self.TEXT.encode("utf-8")))
+        assert [chunk.content for chunk in chunks] == [
+            "Première phrase ici.", "Deuxième — avec des accents!", "Troisième?", "Épilogue sans point",
+        ]
+        assert [chunk.node_chunk_index for chunk in chunks] == [0, 1, 2, 3]
+        assert chunks[0].document_id == "doc"
+
+    def test_non_ascii_pattern_is_rejected(self):
+        chunker = RegexChunkingStrategy(r"[^。]+。", units_per_chunk=1)
+        with pytest.raises(ValueError):
+            list(chunker.iter_buffer_spans(b"abc"))
+
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+@pytest.mark.unit
+class TestTokenBudgetChunkingStrategy:
+    def test_chunks_fit_budget(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=8, tokenizer=_word_count)
+        text = "One two three. Four five six seven. Eight nine. Ten eleven twelve thirteen fourteen."
+
+        chunks = subject.chunk_document(_document(text))
+
+        assert [c.content for c in chunks] == [
+            "One two three. Four five six seven.",
+            "Eight nine. Ten eleven twelve thirteen fourteen.",
+        ]
+
+    def test_packs_sentences_greedily(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=5, tokenizer=_word_count)
+
+        chunks = subject.chunk_document(_document("A b. C d. E f. G h."))
+
+        assert [c.content for c in chunks] == ["A b. C d.", "E f. G h."]
+
+    def test_overlap_repeats_trailing_sentences_within_budget(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=6, overlap_tokens=2, tokenizer=_word_count)
+
+        chunks = subject.chunk_document(_document("A b. C d. E f. G h. I j."))
+
+        assert [c.content for c in chunks] == ["A b. C d. E f.", "E f. G h. I j."]
+
+    def test_overlap_shrinks_to_fit_next_sentence(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=10, overlap_tokens=9, tokenizer=_word_count)
+        text = "A. " + "b " * 8 + "B. " + "c " * 8 + "C."
+
+        chunks = subject.chunk_document(_document(text))
+
+        assert [c.content.split()[-1] for c in chunks] == ["B.", "C."]
+        assert all(_word_count(c.content) <= 10 for c in chunks)
+
+    def test_long_sentence_split_at_words(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=3, tokenizer=_word_count)
+
+        chunks = subject.chunk_document(_document("one two three four five six seven. Short one."))
+
+        assert [c.content for c in chunks] == ["one two three", "four five six", "seven. Short one."]
+
+    def test_long_word_cut_into_pieces(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=2, tokenizer=len)
+
+        chunks = subject.chunk_document(_document("abcde"))
+
+        assert [c.content for c in chunks] == ["ab", "cd", "e"]
+
+    def test_sentences_tokenized_once(self):
+        calls = []
+
+        def tokenizer(text):
+            calls.append(text)
+            return _word_count(text)
+
+        subject = TokenBudgetChunkingStrategy(max_tokens=4, overlap_tokens=2, tokenizer=tokenizer)
+        subject.chunk_document(_document("A b. C d. E f. G h.", "A b. C d."))
+
+        assert sorted(calls) == ["A b.", "C d.", "E f.", "G h."]
+
+    def test_default_tokenizer(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=16)
+        text = " ".join(f"Sentence {i} has a few words." for i in range(20))
+
+        chunks = subject.chunk_document(_document(text))
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(c.content) <= 16 + 2 for c in chunks)
+
+    def test_picklable(self):
+        subject = TokenBudgetChunkingStrategy(max_tokens=5)
+        document = _document("A b. C d. E f. G h.")
+
+        copy = pickle.loads(pickle.dumps(subject))
+
+        assert copy.chunk_document(document) == subject.chunk_document(document)
+
+    @pytest.mark.parametrize(("max_tokens", "overlap_tokens"), [(0, 0), (4, 4), (4, -1)])
+    def test_invalid_budget(self, max_tokens, overlap_tokens):
+        with pytest.raises(ValueError):
+            TokenBudgetChunkingStrategy(max_tokens, overlap_tokens)
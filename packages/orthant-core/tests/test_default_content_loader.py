@@ -1,10 +1,14 @@
+import asyncio
 import pytest
 import fsspec
+import threading
+import time
 import uuid
 import zipfile
 from pathlib import Path
+from fsspec.asyn import AsyncFileSystem
 
-from orthant.core.documents import DefaultContentLoader
+from orthant.core.documents import ContentLoader, DefaultContentLoader
 
 
 TEXT = "Café 🚀 — hello"
@@ -350,3 +354,137 @@ class TestDefaultContentLoader:
         sync_bytes = loader.load_bytes(str(binary_file))
         async_bytes = await loader.load_bytes_async(str(binary_file))
         assert sync_bytes == async_bytes
+
+
+class _SlowAsyncFileSystem(AsyncFileSystem):
+    """Async filesystem whose reads take a fixed time without blocking the loop"""
+    protocol = "orthantslow"
+    delay = 0.2
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        if path.endswith("missing"):
+            raise FileNotFoundError(path)
+        await asyncio.sleep(self.delay)
+        return f"{path}\r\nend".encode("utf-8")
+
+
+@pytest.fixture
+def slow_fs():
+    fsspec.register_implementation(_SlowAsyncFileSystem.protocol, _SlowAsyncFileSystem, clobber=True)
+    return _SlowAsyncFileSystem
+
+
+@pytest.mark.unit
+class TestAsyncContentLoading:
+
+    @pytest.mark.asyncio
+    async def test_async_filesystem_loads_overlap(self, loader, slow_fs):
+        uris = [f"orthantslow://bucket/doc{i}" for i in range(5)]
+        start = time.perf_counter()
+        results = await asyncio.gather(*(loader.load_bytes_async(uri) for uri in uris))
+        elapsed = time.perf_counter() - start
+        assert results[0] == b"bucket/doc0\r\nend"
+        assert elapsed < slow_fs.delay * 3
+
+    @pytest.mark.asyncio
+    async def test_async_filesystem_text_translates_newlines(self, loader, slow_fs):
+        assert await loader.load_text_async("orthantslow://bucket/doc") == "bucket/doc\nend"
+
+    @pytest.mark.asyncio
+    async def test_async_filesystem_errors_propagate(self, loader, slow_fs):
+        with pytest.raises(FileNotFoundError):
+            await loader.load_bytes_async("orthantslow://bucket/missing")
+
+    @pytest.mark.asyncio
+    async def test_sync_filesystem_reads_off_the_event_loop(self, tmp_path: Path, loader, monkeypatch):
+        p = tmp_path / "threaded.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        threads = []
+        load_text = loader.load_text
+
+        def recording_load_text(uri, *, encoding="utf-8"):
+            threads.append(threading.get_ident())
+            return load_text(uri, encoding=encoding)
+
+        monkeypatch.setattr(loader, "load_text", recording_load_text)
+        assert await loader.load_text_async(str(p)) == TEXT
+        assert threads and threads[0] != threading.get_ident()
+
+
+@pytest.mark.unit
+class TestBulkContentLoading:
+
+    def test_load_many_bytes_in_input_order(self, tmp_path: Path, loader):
+        paths = []
+        for i in range(3):
+            p = tmp_path / f"bulk{i}.bin"
+            p.write_bytes(bytes([i]) * 3)
+            paths.append(str(p))
+        assert loader.load_many_bytes(paths[::-1]) == [b"\x02" * 3, b"\x01" * 3, b"\x00" * 3]
+
+    def test_load_many_mixes_filesystems(self, tmp_path: Path, loader):
+        p = tmp_path / "local.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        uri = f"memory://bulk/{uuid.uuid4().hex}.txt"
+        with fsspec.open(uri, "w", encoding="utf-8") as f:
+            f.write("in memory")
+        assert loader.load_many_text([uri, str(p), "data:,inline"]) == ["in memory", TEXT, "inline"]
+
+    def test_load_many_returns_errors_in_place(self, tmp_path: Path, loader):
+        p = tmp_path / "present.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        results = loader.load_many_text([str(tmp_path / "absent.txt"), str(p), "nosuchprotocol://x"])
+        assert isinstance(results[0], FileNotFoundError)
+        assert results[1] == TEXT
+        assert isinstance(results[2], Exception)
+
+    def test_load_many_text_returns_decode_errors(self, tmp_path: Path, loader):
+        p = tmp_path / "latin1.txt"
+        p.write_bytes("café".encode("latin-1"))
+        assert isinstance(loader.load_many_text([str(p)])[0], UnicodeDecodeError)
+
+    def test_load_many_reuses_one_filesystem_call(self, tmp_path: Path, loader, monkeypatch):
+        calls = []
+        cat_ranges = fsspec.implementations.local.LocalFileSystem.cat_ranges
+
+        def recording_cat_ranges(self, paths, *args, **kwargs):
+            calls.append(list(paths))
+            return cat_ranges(self, paths, *args, **kwargs)
+
+        monkeypatch.setattr(fsspec.implementations.local.LocalFileSystem, "cat_ranges", recording_cat_ranges)
+        paths = []
+        for i in range(4):
+            p = tmp_path / f"one_call{i}.txt"
+            p.write_text(str(i), encoding="utf-8")
+            paths.append(str(p))
+        assert loader.load_many_text(paths) == ["0", "1", "2", "3"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_load_many_bytes_async_overlaps(self, slow_fs):
+        loader = DefaultContentLoader(max_concurrency=10)
+        uris = [f"orthantslow://bucket/doc{i}" for i in range(10)]
+        start = time.perf_counter()
+        results = await loader.load_many_bytes_async(uris + ["orthantslow://bucket/missing"])
+        elapsed = time.perf_counter() - start
+        assert results[3] == b"bucket/doc3\r\nend"
+        assert isinstance(results[-1], FileNotFoundError)
+        assert elapsed < slow_fs.delay * 3
+
+    @pytest.mark.asyncio
+    async def test_load_many_text_async_mixes_sync_and_async(self, tmp_path: Path, loader, slow_fs):
+        p = tmp_path / "local_async.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        results = await loader.load_many_text_async([str(p), "orthantslow://bucket/doc", str(tmp_path / "absent")])
+        assert results[:2] == [TEXT, "bucket/doc\nend"]
+        assert isinstance(results[2], FileNotFoundError)
+
+    def test_protocol_default_loads_one_by_one(self, tmp_path: Path):
+        class MinimalLoader(ContentLoader):
+            def load_bytes(self, uri):
+                if uri == "bad":
+                    raise ValueError(uri)
+                return uri.encode()
+
+        assert MinimalLoader().load_many_bytes(["a", "bad"])[0] == b"a"
+        assert isinstance(MinimalLoader().load_many_bytes(["a", "bad"])[1], ValueError)
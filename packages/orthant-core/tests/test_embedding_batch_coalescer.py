@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock
+
+from orthant.core.documents import OrthantDocument, OrthantDocumentNode, OrthantDocumentNodeChunk
+from orthant.core.ingestion import DocumentIngestionPipeline, EmbeddingBatchCoalescer
+
+
+class RecordingEmbedder:
+    """Embeds each text as [len(text)] and records the batches it receives"""
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def encode_batch(self, batch: list[str]) -> list[list[float]]:
+        self.batches.append(list(batch))
+        return [[float(len(text))] for text in batch]
+
+    async def encode_batch_async(self, batch: list[str]) -> list[list[float]]:
+        self.batches.append(list(batch))
+        await asyncio.sleep(0)
+        return [[float(len(text))] for text in batch]
+
+
+@pytest.mark.unit
+class TestEmbeddingBatchCoalescer:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_batches(self):
+        embedder = RecordingEmbedder()
+        coalescer = EmbeddingBatchCoalescer(embedder, max_batch_size=4, max_wait=0.01)
+
+        results = await asyncio.gather(
+            coalescer.encode_batch_async(["a", "bb"]),
+            coalescer.encode_batch_async(["ccc", "dddd"]),
+            coalescer.encode_batch_async(["eeeee"]),
+        )
+
+        assert results == [[[1.0], [2.0]], [[3.0], [4.0]], [[5.0]]]
+        assert embedder.batches == [["a", "bb", "ccc", "dddd"], ["eeeee"]]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_after_max_wait(self):
+        embedder = RecordingEmbedder()
+        coalescer = EmbeddingBatchCoalescer(embedder, max_batch_size=100, max_wait=0.01)
+
+        result = await asyncio.wait_for(coalescer.encode_batch_async(["one"]), timeout=1)
+
+        assert result == [[3.0]]
+        assert embedder.batches == [["one"]]
+
+    @pytest.mark.asyncio
+    async def test_large_document_split_across_requests(self):
+        embedder = RecordingEmbedder()
+        coalescer = EmbeddingBatchCoalescer(embedder, max_batch_size=2, max_wait=0.01)
+
+        result = await coalescer.encode_batch_async(["a", "b", "c", "d", "e"])
+
+        assert result == [[1.0]] * 5
+        assert [len(b) for b in embedder.batches] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_token_budget_limits_batches(self):
+        embedder = RecordingEmbedder()
+        coalescer = EmbeddingBatchCoalescer(
+            embedder, max_batch_size=100, max_batch_tokens=5, max_wait=0.01, token_counter=len
+        )
+
+        await coalescer.encode_batch_async(["aa", "bbb", "cc", "dddddddd"])
+
+        # A text over the budget on its own is still sent, alone
+        assert embedder.batches == [["aa", "bbb"], ["cc"], ["dddddddd"]]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller_in_batch(self):
+        embedder = Mock()
+        embedder.encode_batch_async = AsyncMock(side_effect=RuntimeError("rate limited"))
+        coalescer = EmbeddingBatchCoalescer(embedder, max_batch_size=4, max_wait=0.01)
+
+        results = await asyncio.gather(
+            coalescer.encode_batch_async(["a"]),
+            coalescer.encode_batch_async(["b"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        embedder.encode_batch_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        embedder = RecordingEmbedder()
+        coalescer = EmbeddingBatchCoalescer(embedder)
+
+        assert await coalescer.encode_batch_async([]) == []
+        assert embedder.batches == []
+
+    def test_sync_encode_batch_splits_oversized_batches(self):
+        embedder = RecordingEmbedder()
+        coalescer = EmbeddingBatchCoalescer(embedder, max_batch_size=2)
+
+        result = coalescer.encode_batch(["a", "bb", "ccc"])
+
+        assert result == [[1.0], [2.0], [3.0]]
+        assert embedder.batches == [["a", "bb"], ["ccc"]]
+
+    def test_concurrent_sync_callers_share_batches(self):
+        embedder = RecordingEmbedder()
+        coalescer = EmbeddingBatchCoalescer(embedder, max_batch_size=8, max_wait=5.0)
+        batches = [[f"{i}-{j}" * (j + 1) for j in range(2)] for i in range(4)]
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(coalescer.encode_batch, batches))
+
+        # The batch is sent as soon as it is full, without waiting for max_wait
+        assert [len(b) for b in embedder.batches] == [8]
+        assert results == [[[float(len(text))] for text in batch] for batch in batches]
+
+    def test_sync_errors_reach_every_caller_in_batch(self):
+        embedder = Mock()
+        embedder.encode_batch.side_effect = RuntimeError("provider down")
+        coalescer = EmbeddingBatchCoalescer(embedder, max_batch_size=4, max_wait=5.0)
+        barrier = threading.Barrier(2)
+
+        def encode(batch):
+            barrier.wait()
+            with pytest.raises(RuntimeError, match="provider down"):
+                coalescer.encode_batch(batch)
+
+        with ThreadPoolExecutor(2) as pool:
+            list(pool.map(encode, [["a", "b"], ["c", "d"]]))
+        assert embedder.encode_batch.call_count == 1
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            EmbeddingBatchCoalescer(RecordingEmbedder(), max_batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_pipeline_packs_chunks_from_many_documents(self):
+        reader = Mock()
+        reader.read_file.side_effect = lambda uri: OrthantDocument(
+            document_id=uri, source_uri=uri, nodes=[OrthantDocumentNode(node_path="1", content=uri)]
+        )
+        chunker = Mock()
+        chunker.chunk_document.side_effect = lambda doc: [
+            OrthantDocumentNodeChunk(document_id=doc.document_id, node_path="1", node_chunk_index=i, content=doc.source_uri * (i + 1))
+            for i in range(2)
+        ]
+        vector_store = Mock()
+        vector_store.store_chunks_async = AsyncMock()
+        vector_store.flush_async = AsyncMock()
+        embedder = RecordingEmbedder()
+        pipeline = DocumentIngestionPipeline(
+            reader=reader,
+            chunker=chunker,
+            embedder=EmbeddingBatchCoalescer(embedder, max_batch_size=8, max_wait=0.01),
+            vector_store=vector_store,
+        )
+
+        chunks = await pipeline.ingest_batch_async(["a", "b", "c", "d"], max_in_flight=4)
+
+        assert [len(b) for b in embedder.batches] == [8]
+        assert [(c.source_uri, c.content, c.embedding) for c in chunks] == [
+            (uri, uri * (i + 1), [float(i + 1)]) for uri in "abcd" for i in range(2)
+        ]
@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+from pathlib import Path
+
+from orthant.core.embedding import CachingEmbeddingModel, SqliteEmbeddingCacheStore
+
+
+class CountingEmbedder:
+    """Embeds each text as [len(text), 0.5] and records what it was asked to embed"""
+    model_name = "counting"
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def encode_batch(self, batch: list[str]) -> list[list[float]]:
+        self.calls.append(list(batch))
+        return [[float(len(text)), 0.5] for text in batch]
+
+    async def encode_batch_async(self, batch: list[str]) -> list[list[float]]:
+        return self.encode_batch(batch)
+
+
+@pytest.mark.unit
+class TestCachingEmbeddingModel:
+    def test_only_misses_are_embedded(self):
+        embedder = CountingEmbedder()
+        subject = CachingEmbeddingModel(embedder)
+
+        first = subject.encode_batch(["alpha", "beta"])
+        second = subject.encode_batch(["alpha", "gamma", "beta"])
+
+        assert first == [[5.0, 0.5], [4.0, 0.5]]
+        assert second == [[5.0, 0.5], [5.0, 0.5], [4.0, 0.5]]
+        assert embedder.calls == [["alpha", "beta"], ["gamma"]]
+        assert (subject.stats.hits, subject.stats.misses) == (2, 3)
+
+    def test_duplicates_in_batch_embedded_once(self):
+        embedder = CountingEmbedder()
+        subject = CachingEmbeddingModel(embedder)
+
+        result = subject.encode_batch(["same", "same", "other"])
+
+        assert result == [[4.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+        assert embedder.calls == [["same", "other"]]
+
+    def test_key_normalizes_whitespace_and_unicode(self):
+        subject = CachingEmbeddingModel(CountingEmbedder())
+
+        assert subject.cache_key("Café  au\nlait ") == subject.cache_key("Café au lait")
+        assert subject.cache_key("text") != CachingEmbeddingModel(CountingEmbedder(), model_name="other").cache_key("text")
+
+    def test_memory_lru_is_bounded(self):
+        embedder = CountingEmbedder()
+        subject = CachingEmbeddingModel(embedder, memory_size=2)
+
+        subject.encode_batch(["a", "b", "c"])
+        subject.encode_batch(["a"])
+
+        assert embedder.calls == [["a", "b", "c"], ["a"]]
+
+    def test_requires_model_name(self):
+        embedder = CountingEmbedder()
+        embedder.model_name = None
+        with pytest.raises(ValueError):
+            CachingEmbeddingModel(embedder)
+
+    @pytest.mark.asyncio
+    async def test_async_uses_cache(self):
+        embedder = CountingEmbedder()
+        subject = CachingEmbeddingModel(embedder)
+
+        await subject.encode_batch_async(["a", "b"])
+        result = await subject.encode_batch_async(["b", "c"])
+
+        assert result == [[1.0, 0.5], [1.0, 0.5]]
+        assert embedder.calls == [["a", "b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_async_store_access_is_off_the_event_loop(self, tmp_path: Path):
+        store = SqliteEmbeddingCacheStore(str(tmp_path / "embeddings.db"))
+        threads = []
+
+        def record_thread(method):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+            return wrapper
+
+        store.get_many = record_thread(store.get_many)
+        store.put_many = record_thread(store.put_many)
+        subject = CachingEmbeddingModel(CountingEmbedder(), store=store)
+
+        await subject.encode_batch_async(["a"])
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+        assert store.get_many([subject.cache_key("a")])
+
+    def test_persistent_store_survives_restart(self, tmp_path: Path):
+        path = str(tmp_path / "cache" / "embeddings.db")
+        first = CachingEmbeddingModel(CountingEmbedder(), store=SqliteEmbeddingCacheStore(path))
+        first.encode_batch(["persisted text"])
+
+        embedder = CountingEmbedder()
+        second = CachingEmbeddingModel(embedder, store=SqliteEmbeddingCacheStore(path))
+        result = second.encode_batch(["persisted text"])
+
+        assert result == [[14.0, 0.5]]
+        assert embedder.calls == []
+        assert second.stats.store_hits == 1
+
+
+@pytest.mark.unit
+class TestSqliteEmbeddingCacheStore:
+    def test_round_trip(self, tmp_path: Path):
+        store = SqliteEmbeddingCacheStore(str(tmp_path / "cache.db"))
+        store.put_many({"k1": [0.1, 0.2], "k2": [1e-9, -3.5]})
+
+        assert store.get_many(["k1", "k2", "missing"]) == {"k1": [0.1, 0.2], "k2": [1e-9, -3.5]}
+        assert store.total_bytes == 32
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        store = SqliteEmbeddingCacheStore(str(tmp_path / "cache.db"), max_bytes=24, evict_to=1.0)
+        store.put_many({"old": [1.0]})
+        store.put_many({"used": [2.0]})
+        store.put_many({"new": [3.0]})
+        store.get_many(["old"])
+        store.put_many({"newest": [4.0]})
+
+        assert set(store.get_many(["old", "used", "new", "newest"])) == {"old", "new", "newest"}
+        assert store.evictions == 1
+        assert store.total_bytes == 24
+
+    def test_overwrite_keeps_size_accounting(self, tmp_path: Path):
+        store = SqliteEmbeddingCacheStore(str(tmp_path / "cache.db"))
+        store.put_many({"k": [1.0, 2.0]})
+        store.put_many({"k": [1.0]})
+
+        assert store.total_bytes == 8
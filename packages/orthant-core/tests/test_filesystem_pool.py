@@ -0,0 +1,146 @@
+import asyncio
+import pickle
+import pytest
+
+import fsspec
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+
+from orthant.core.documents import DefaultContentLoader, FileSystemPool
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _RecordingMemoryFileSystem(MemoryFileSystem):
+    """Memory filesystem that records the options it was created with"""
+    protocol = "orthantpooltest"
+    created_with: list[dict] = []
+
+    def __init__(self, *args, **kwargs):
+        type(self).created_with.append(kwargs)
+        super().__init__()
+
+
+class _LoopBoundFileSystem(AsyncFileSystem):
+    """Async filesystem without I/O, to pool instances per event loop"""
+    protocol = "orthantpoolasynctest"
+
+
+@pytest.fixture(autouse=True)
+def recording_fs():
+    fsspec.register_implementation(_RecordingMemoryFileSystem.protocol, _RecordingMemoryFileSystem, clobber=True)
+    fsspec.register_implementation(_LoopBoundFileSystem.protocol, _LoopBoundFileSystem, clobber=True)
+    _RecordingMemoryFileSystem.created_with = []
+    return _RecordingMemoryFileSystem
+
+
+@pytest.mark.unit
+class TestFileSystemPool:
+
+    def test_reuses_instance_per_bucket(self):
+        pool = FileSystemPool()
+        fs1, path1 = pool.get("orthantpooltest://bucket-a/one.txt")
+        fs2, path2 = pool.get("orthantpooltest://bucket-a/two.txt")
+        fs3, _ = pool.get("orthantpooltest://bucket-b/one.txt")
+        assert fs1 is fs2
+        assert fs3 is not fs1
+        assert path2.endswith("bucket-a/two.txt")
+        assert pool.stats.created == 2
+        assert pool.stats.reused == 1
+        assert pool.stats.reuse_rate == pytest.approx(1 / 3)
+
+    def test_storage_options_by_protocol_and_bucket(self, recording_fs):
+        pool = FileSystemPool(storage_options={
+            "orthantpooltest": {"key": "default", "region": "eu"},
+            "orthantpooltest://private": {"key": "private"},
+        })
+        pool.get("orthantpooltest://public/x")
+        pool.get("orthantpooltest://private/x")
+        assert recording_fs.created_with[0]["key"] == "default"
+        assert recording_fs.created_with[1]["key"] == "private"
+        assert recording_fs.created_with[1]["region"] == "eu"
+
+    def test_max_connections_sets_s3_pool_size(self):
+        pool = FileSystemPool(max_connections=64, storage_options={"s3": {"config_kwargs": {"retries": 3}}})
+        options = pool._options_for("s3", "bucket")
+        assert options["config_kwargs"] == {"max_pool_connections": 64, "retries": 3}
+        assert "config_kwargs" not in pool._options_for("gcs", "bucket")
+
+    def test_idle_instances_are_evicted(self):
+        clock = _Clock()
+        pool = FileSystemPool(idle_timeout=10, clock=clock)
+        fs1, _ = pool.get("orthantpooltest://bucket/x")
+        clock.now = 5
+        pool.get("orthantpooltest://other/x")
+        clock.now = 12
+        assert pool.evict_idle() == 1
+        assert len(pool) == 1
+        fs2, _ = pool.get("orthantpooltest://bucket/x")
+        assert fs2 is not fs1
+        assert pool.stats.evicted == 1
+
+    def test_no_idle_timeout_keeps_instances(self):
+        clock = _Clock()
+        pool = FileSystemPool(idle_timeout=None, clock=clock)
+        pool.get("orthantpooltest://bucket/x")
+        clock.now = 1e9
+        assert pool.evict_idle() == 0
+        assert len(pool) == 1
+
+    def test_async_requires_async_filesystem(self):
+        with pytest.raises(ValueError):
+            FileSystemPool().get("orthantpooltest://bucket/x", asynchronous=True)
+
+    def test_async_instances_are_bound_to_their_loop(self):
+        pool = FileSystemPool(idle_timeout=None)
+
+        async def get():
+            fs, _ = pool.get("orthantpoolasynctest://bucket/x", asynchronous=True)
+            again, _ = pool.get("orthantpoolasynctest://bucket/y", asynchronous=True)
+            assert again is fs
+            return fs
+
+        first = asyncio.run(get())
+        assert len(pool) == 1
+        second = asyncio.run(get())
+        assert second is not first
+        assert len(pool) == 1
+        assert pool.stats.evicted == 1
+
+    def test_instances_of_closed_loop_are_evicted(self):
+        pool = FileSystemPool(idle_timeout=None)
+        loop = asyncio.new_event_loop()
+
+        async def get():
+            pool.get("orthantpoolasynctest://bucket/x", asynchronous=True)
+
+        loop.run_until_complete(get())
+        assert pool.evict_idle() == 0
+        loop.close()
+        assert pool.evict_idle() == 1
+        assert len(pool) == 0
+
+    def test_pickle_drops_instances(self):
+        pool = FileSystemPool(max_connections=8)
+        pool.get("orthantpooltest://bucket/x")
+        copy = pickle.loads(pickle.dumps(pool))
+        assert len(copy) == 0
+        copy.get("orthantpooltest://bucket/x")
+        assert len(copy) == 1
+
+    def test_loader_reuses_pooled_filesystem(self):
+        pool = FileSystemPool()
+        loader = DefaultContentLoader(filesystem_pool=pool)
+        for i in range(3):
+            with fsspec.open(f"memory://pooled/{i}.txt", "w") as f:
+                f.write(str(i))
+        assert [loader.load_text(f"memory://pooled/{i}.txt") for i in range(3)] == ["0", "1", "2"]
+        assert loader.load_many_text([f"memory://pooled/{i}.txt" for i in range(3)]) == ["0", "1", "2"]
+        assert pool.stats.created == 1
+        assert pool.stats.reused == 5
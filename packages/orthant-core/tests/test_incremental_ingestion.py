@@ -0,0 +1,261 @@
+import os
+from pathlib import Path
+import pytest
+from unittest.mock import Mock
+
+from orthant.core.chunking import RegexChunkingStrategy
+from orthant.core.documents import TextDocumentReader, DefaultContentLoader
+from orthant.core.ingestion import (
+    IncrementalIngestionPipeline,
+    InMemoryIngestionStateStore,
+    SqliteIngestionManifest,
+    SourceFingerprint,
+    fingerprint_uri,
+)
+
+
+@pytest.fixture
+def embedder():
+    embedder = Mock()
+    embedder.encode_batch.side_effect = lambda texts: [[float(len(text))] for text in texts]
+    return embedder
+
+
+@pytest.fixture
+def pipeline(embedder, store):
+    return IncrementalIngestionPipeline(
+        reader=TextDocumentReader(DefaultContentLoader()),
+        chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+        embedder=embedder,
+        vector_store=store,
+    )
+
+
+def _write(path, text, mtime=None):
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.unit
+class TestSourceFingerprint:
+
+    def test_matches_on_size_and_mtime(self):
+        assert SourceFingerprint(size=3, mtime="1").matches(SourceFingerprint(size=3, mtime="1"))
+        assert not SourceFingerprint(size=3, mtime="1").matches(SourceFingerprint(size=3, mtime="2"))
+        assert not SourceFingerprint(size=3, mtime="1").matches(SourceFingerprint(size=4, mtime="1"))
+
+    def test_etag_takes_precedence(self):
+        assert SourceFingerprint(size=3, mtime="1", etag="a").matches(SourceFingerprint(size=3, mtime="2", etag="a"))
+        assert not SourceFingerprint(size=3, mtime="1", etag="a").matches(SourceFingerprint(size=3, mtime="1", etag="b"))
+
+    def test_fingerprint_local_file(self, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "hello", mtime=1000)
+        fingerprint = fingerprint_uri(str(path))
+        assert fingerprint.size == 5
+        assert fingerprint.mtime is not None
+
+    def test_fingerprint_missing_file(self, tmp_path):
+        assert fingerprint_uri(str(tmp_path / "missing.txt")) is None
+
+
+@pytest.mark.unit
+class TestIncrementalIngestionPipeline:
+
+    def test_first_run_adds_all_chunks(self, pipeline, store, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two. Three.")
+        result = pipeline.ingest_incremental(str(path))
+        assert result.status == "added"
+        assert result.chunk_count == 3
+        assert result.embedded_count == 3
+        assert len(store.rows) == 3
+
+    def test_unchanged_fingerprint_skips_read(self, pipeline, embedder, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        pipeline._reader = Mock(wraps=pipeline._reader)
+        result = pipeline.ingest_incremental(str(path))
+        assert result.status == "unchanged"
+        pipeline._reader.read_file.assert_not_called()
+        assert embedder.encode_batch.call_count == 1
+
+    def test_touched_file_with_same_content_is_unchanged(self, pipeline, embedder, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        os.utime(path, (2000, 2000))
+        result = pipeline.ingest_incremental(str(path))
+        assert result.status == "unchanged"
+        assert embedder.encode_batch.call_count == 1
+
+    def test_only_changed_chunks_are_embedded(self, pipeline, embedder, store, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two. Three.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        _write(path, "One. Deux. Three.", mtime=2000)
+        result = pipeline.ingest_incremental(str(path))
+        assert result.status == "updated"
+        assert result.embedded_count == 1
+        assert result.deleted_count == 1
+        embedder.encode_batch.assert_called_with(["Deux."])
+        assert store.contents() == ["Deux.", "One.", "Three."]
+
+    def test_inserted_chunk_moves_the_following_ones(self, pipeline, embedder, store, tmp_path):
+        path = tmp_path / "doc.txt"
+        sentences = [f"Sentence {i}." for i in range(100)]
+        _write(path, " ".join(sentences), mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        _write(path, " ".join(["Intro.", *sentences]), mtime=2000)
+        result = pipeline.ingest_incremental(str(path))
+        assert (result.embedded_count, result.moved_count, result.deleted_count) == (1, 100, 0)
+        embedder.encode_batch.assert_called_with(["Intro."])
+        assert sorted(row[2:] for row in store.rows) == sorted(enumerate(["Intro.", *sentences]))
+
+    def test_moved_and_changed_chunks(self, pipeline, embedder, store, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two. Three. Four.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        _write(path, "Four. One. Deux. Three.", mtime=2000)
+        result = pipeline.ingest_incremental(str(path))
+        assert (result.embedded_count, result.moved_count, result.deleted_count) == (1, 3, 1)
+        assert sorted(row[2:] for row in store.rows) == [(0, "Four."), (1, "One."), (2, "Deux."), (3, "Three.")]
+
+    def test_store_without_reindex_reembeds_moved_chunks(self, embedder, tmp_path):
+        store = Mock(spec=["store_chunks", "delete_chunks"])
+        pipeline = IncrementalIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+            embedder=embedder,
+            vector_store=store,
+        )
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        _write(path, "Zero. One. Two.", mtime=2000)
+        result = pipeline.ingest_incremental(str(path))
+        assert (result.embedded_count, result.moved_count, result.deleted_count) == (3, 0, 2)
+
+    def test_retry_after_interrupted_write(self, pipeline, embedder, store, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        _write(path, "Zero. One. Two.", mtime=2000)
+        pipeline._vector_store.store_chunks = Mock(side_effect=KeyboardInterrupt)
+        with pytest.raises(KeyboardInterrupt):
+            pipeline.ingest_incremental(str(path))
+        del pipeline._vector_store.store_chunks
+        result = pipeline.ingest_incremental(str(path))
+        assert (result.embedded_count, result.moved_count) == (1, 0)
+        assert sorted(row[2:] for row in store.rows) == [(0, "Zero."), (1, "One."), (2, "Two.")]
+
+    def test_retry_after_crash_with_persistent_state(self, embedder, store, tmp_path):
+        def pipeline_with(state_store):
+            return IncrementalIngestionPipeline(
+                reader=TextDocumentReader(DefaultContentLoader()),
+                chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+                embedder=embedder,
+                vector_store=store,
+                state_store=state_store,
+            )
+        path = tmp_path / "doc.txt"
+        manifest_path = str(tmp_path / "m.sqlite")
+        _write(path, "Alpha one. Beta two.", mtime=1000)
+        pipeline = pipeline_with(SqliteIngestionManifest(manifest_path))
+        pipeline.ingest_incremental(str(path))
+        _write(path, "Beta two. Alpha one. Gamma.", mtime=2000)
+        # Crash between moving the chunks and writing the new one, then reopen the manifest
+        pipeline._vector_store.store_chunks = Mock(side_effect=KeyboardInterrupt)
+        with pytest.raises(KeyboardInterrupt):
+            pipeline.ingest_incremental(str(path))
+        del pipeline._vector_store.store_chunks
+        result = pipeline_with(SqliteIngestionManifest(manifest_path)).ingest_incremental(str(path))
+        assert (result.embedded_count, result.moved_count) == (1, 0)
+        assert sorted(row[2:] for row in store.rows) == [(0, "Beta two."), (1, "Alpha one."), (2, "Gamma.")]
+
+    def test_removed_chunks_are_deleted(self, pipeline, embedder, store, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two. Three.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        _write(path, "One. Two.", mtime=2000)
+        result = pipeline.ingest_incremental(str(path))
+        assert result.deleted_count == 1
+        assert result.embedded_count == 0
+        assert store.contents() == ["One.", "Two."]
+
+    def test_document_id_is_stable(self, pipeline, store, tmp_path):
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        _write(path, "One. Three.", mtime=2000)
+        pipeline.ingest_incremental(str(path))
+        assert len({key[0] for key in store.rows}) == 1
+
+    def test_state_store_is_shared_across_pipelines(self, embedder, store, tmp_path):
+        state_store = InMemoryIngestionStateStore()
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        for _ in range(2):
+            pipeline = IncrementalIngestionPipeline(
+                reader=TextDocumentReader(DefaultContentLoader()),
+                chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+                embedder=embedder,
+                vector_store=store,
+                state_store=state_store,
+            )
+            pipeline.ingest_incremental(str(path))
+        assert embedder.encode_batch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ingest_incremental_async(self, pipeline, embedder, store, tmp_path):
+        async def encode_batch_async(texts):
+            return [[float(len(text))] for text in texts]
+        embedder.encode_batch_async = encode_batch_async
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        result = await pipeline.ingest_incremental_async(str(path))
+        assert result.status == "added"
+        assert len(store.rows) == 2
+
+    def test_state_saved_after_flush(self, embedder, buffering_store, tmp_path):
+        store = buffering_store
+        state_store = InMemoryIngestionStateStore()
+        pipeline = IncrementalIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+            embedder=embedder,
+            vector_store=store,
+            state_store=state_store,
+        )
+        paths = [str(tmp_path / f"doc{i}.txt") for i in range(3)]
+        for path in paths:
+            _write(Path(path), "One. Two.", mtime=1000)
+        results = pipeline.iter_ingest_incremental(paths, checkpoint_every=2)
+        next(results)
+        assert (len(store.rows), state_store.get_state(paths[0])) == (0, None)
+        next(results)
+        assert len(store.rows) == 4
+        assert state_store.get_state(paths[1]) is not None
+        next(results)
+        assert (len(store.rows), state_store.get_state(paths[2])) == (4, None)
+        results.close()
+        assert (len(store.rows), store.pending) == (6, [])
+        assert state_store.get_state(paths[2]) is not None
+
+    def test_ingest_incremental_flushes_before_saving_state(self, embedder, buffering_store, tmp_path):
+        state_store = Mock(wraps=InMemoryIngestionStateStore())
+        state_store.put_state.side_effect = lambda state: stored_when_saved.append(len(buffering_store.rows))
+        stored_when_saved = []
+        pipeline = IncrementalIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+            embedder=embedder,
+            vector_store=buffering_store,
+            state_store=state_store,
+        )
+        path = tmp_path / "doc.txt"
+        _write(path, "One. Two.", mtime=1000)
+        pipeline.ingest_incremental(str(path))
+        assert stored_when_saved == [2]
@@ -0,0 +1,188 @@
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+from orthant.core.chunking import RegexChunkingStrategy
+from orthant.core.documents import TextDocumentReader, DefaultContentLoader
+from orthant.core.ingestion import (
+    DocumentIngestionPipeline,
+    IncrementalIngestionPipeline,
+    SqliteIngestionManifest,
+    SourceState,
+)
+
+
+@pytest.fixture
+def embedder():
+    embedder = Mock()
+    embedder.encode_batch.side_effect = lambda texts: [[0.0] for _ in texts]
+    return embedder
+
+
+@pytest.fixture
+def pipeline(embedder, store):
+    return DocumentIngestionPipeline(
+        reader=TextDocumentReader(DefaultContentLoader()),
+        chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+        embedder=embedder,
+        vector_store=store,
+    )
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[str]:
+    uris = []
+    for i in range(5):
+        p = tmp_path / "docs" / f"doc{i}.txt"
+        p.parent.mkdir(exist_ok=True)
+        p.write_text(f"Doc {i}. Second sentence.", encoding="utf-8")
+        uris.append(str(p))
+    return uris
+
+
+@pytest.mark.unit
+class TestSqliteIngestionManifest:
+
+    def test_for_dataset_path(self, tmp_path: Path):
+        with SqliteIngestionManifest.for_dataset(str(tmp_path), "my-dataset") as manifest:
+            assert manifest.path == str(tmp_path / "my-dataset" / "ingestion_manifest.sqlite")
+        assert (tmp_path / "my-dataset" / "ingestion_manifest.sqlite").exists()
+
+    def test_claim_skips_done_and_reuses_document_ids(self, tmp_path: Path):
+        manifest = SqliteIngestionManifest(str(tmp_path / "m.sqlite"))
+        first = manifest.claim(["a", "b"])
+        manifest.mark_done("a", "hash", 3)
+        second = manifest.claim(["a", "b", "c"])
+        assert set(second) == {"b", "c"}
+        assert second["b"].document_id == first["b"].document_id
+        assert second["b"].attempts == 2
+        assert second["c"].attempts == 1
+        assert manifest.status_counts() == {"done": 1, "in_progress": 2}
+
+    def test_completions_survive_reopen_after_checkpoint(self, tmp_path: Path):
+        path = str(tmp_path / "m.sqlite")
+        manifest = SqliteIngestionManifest(path, checkpoint_every=2, checkpoint_interval=3600)
+        manifest.claim(["a", "b", "c"])
+        manifest.mark_done("a", "h", 1)
+        manifest.mark_done("b", "h", 1)
+        manifest.mark_done("c", "h", 1)
+        # Simulate a crash: the last completion was never checkpointed
+        reopened = SqliteIngestionManifest(path)
+        assert reopened.get_entry("a").status == "done"
+        assert reopened.get_entry("b").status == "done"
+        assert reopened.get_entry("c").status == "in_progress"
+
+    def test_states_survive_reopen_without_checkpoint(self, tmp_path: Path):
+        path = str(tmp_path / "m.sqlite")
+        manifest = SqliteIngestionManifest(path, checkpoint_every=100, checkpoint_interval=3600)
+        manifest.put_state(SourceState("a", "doc-a", "hash", chunk_hashes={"1": ["x", "y"]}))
+        # Simulate a crash right after the state was put
+        reopened = SqliteIngestionManifest(path)
+        assert reopened.get_state("a").chunk_hashes == {"1": ["x", "y"]}
+        assert reopened.get_entry("a").chunk_count == 2
+
+    def test_mark_failed_records_error(self, tmp_path: Path):
+        manifest = SqliteIngestionManifest(str(tmp_path / "m.sqlite"))
+        manifest.claim(["a"])
+        manifest.mark_failed("a", "boom")
+        entry = manifest.get_entry("a")
+        assert (entry.status, entry.error) == ("failed", "boom")
+
+
+@pytest.mark.unit
+class TestResumableIngestion:
+
+    def test_ingests_and_records_all(self, tmp_path: Path, pipeline, store, files):
+        manifest = SqliteIngestionManifest(str(tmp_path / "m.sqlite"), checkpoint_every=2)
+        results = list(pipeline.iter_ingest_resumable(files, manifest))
+        assert [r.source_uri for r in results] == files
+        assert all(r.chunk_count == 2 and r.chunks is None for r in results)
+        assert manifest.status_counts() == {"done": 5}
+        entry = manifest.get_entry(files[0])
+        assert entry.chunk_count == 2
+        assert entry.content_hash
+
+    def test_resume_after_crash_neither_skips_nor_duplicates(self, tmp_path: Path, embedder, store, files):
+        path = str(tmp_path / "m.sqlite")
+        calls = {"n": 0}
+
+        def crashing_encode(texts):
+            calls["n"] += 1
+            if calls["n"] == 4:
+                raise KeyboardInterrupt
+            return [[0.0] for _ in texts]
+
+        embedder.encode_batch.side_effect = crashing_encode
+        pipeline = DocumentIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+            embedder=embedder,
+            vector_store=store,
+        )
+        manifest = SqliteIngestionManifest(path, checkpoint_every=10, checkpoint_interval=3600)
+        with pytest.raises(KeyboardInterrupt):
+            list(pipeline.iter_ingest_resumable(files, manifest))
+
+        # A partial write from the interrupted run is cleaned up on resume
+        store.rows.append((manifest.get_entry(files[3]).document_id, "1", 0, "partial"))
+        embedder.encode_batch.side_effect = lambda texts: [[0.0] for _ in texts]
+        resumed = list(pipeline.iter_ingest_resumable(files, SqliteIngestionManifest(path)))
+
+        assert [r.source_uri for r in resumed] == files[3:]
+        assert len(store.rows) == 10
+        assert len(set(store.rows)) == 10
+
+    def test_failure_is_recorded_and_raised(self, tmp_path: Path, pipeline, files):
+        manifest = SqliteIngestionManifest(str(tmp_path / "m.sqlite"))
+        missing = str(tmp_path / "missing.txt")
+        with pytest.raises(FileNotFoundError):
+            list(pipeline.iter_ingest_resumable([files[0], missing, files[1]], manifest))
+        assert manifest.get_entry(files[0]).status == "done"
+        assert manifest.get_entry(missing).status == "failed"
+        assert "FileNotFoundError" in manifest.get_entry(missing).error
+
+    def test_skip_failed_continues(self, tmp_path: Path, pipeline, files):
+        manifest = SqliteIngestionManifest(str(tmp_path / "m.sqlite"))
+        missing = str(tmp_path / "missing.txt")
+        failures = []
+        results = list(pipeline.iter_ingest_resumable(
+            [missing, *files], manifest, skip_failed=True, on_failure=lambda uri, e: failures.append((uri, e))
+        ))
+        assert len(results) == 5
+        assert manifest.status_counts() == {"done": 5, "failed": 1}
+        assert [(uri, type(e)) for uri, e in failures] == [(missing, FileNotFoundError)]
+
+    def test_manifest_as_incremental_state_store(self, tmp_path: Path, embedder, store, files):
+        path = str(tmp_path / "m.sqlite")
+        for _ in range(2):
+            with SqliteIngestionManifest(path) as manifest:
+                pipeline = IncrementalIngestionPipeline(
+                    reader=TextDocumentReader(DefaultContentLoader()),
+                    chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+                    embedder=embedder,
+                    vector_store=store,
+                    state_store=manifest,
+                )
+                statuses = [r.status for r in pipeline.iter_ingest_incremental(files)]
+        assert statuses == ["unchanged"] * 5
+        assert embedder.encode_batch.call_count == 5
+
+    def test_completions_recorded_after_flush(self, tmp_path: Path, embedder, buffering_store, files):
+        store = buffering_store
+        pipeline = DocumentIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+            embedder=embedder,
+            vector_store=store,
+        )
+        manifest = SqliteIngestionManifest(str(tmp_path / "m.sqlite"), checkpoint_every=2)
+        results = pipeline.iter_ingest_resumable(files, manifest)
+        next(results)
+        next(results)
+        assert manifest.status_counts() == {"in_progress": 2}
+        next(results)
+        assert manifest.status_counts() == {"done": 2, "in_progress": 2}
+        assert len(store.rows) == 4
+        results.close()
+        assert manifest.status_counts() == {"done": 3, "in_progress": 1}
+        assert len(store.rows) == 6
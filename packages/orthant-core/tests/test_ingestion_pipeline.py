@@ -1,9 +1,13 @@
+import asyncio
+import time
 import pytest
 import datetime as dt
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
-from orthant.core.ingestion import DocumentIngestionPipeline, EmbeddedDocumentChunk
+from orthant.core.chunking import ChunkingStrategy
+from orthant.core.ingestion import DocumentIngestionPipeline, EmbeddedDocumentChunk, IngestionResult, StageLimits
+from orthant.core.ingestion.pipeline import _ChunkWindow
 from orthant.core.documents import (
     TextDocumentReader,
     DefaultContentLoader,
@@ -63,11 +67,8 @@ def text_reader():
 def mock_vector_store():
     """Create a mock vector store"""
     vector_store = Mock()
-
-    async def mock_store_async(chunks):
-        pass
-
-    vector_store.store_chunks_async = mock_store_async
+    vector_store.store_chunks_async = AsyncMock()
+    vector_store.flush_async = AsyncMock()
     return vector_store
 
 
@@ -181,11 +182,13 @@ class TestDocumentIngestionPipeline:
         chunks = pipeline.ingest(str(test_file))
 
         # Verify metadata preservation
-        assert chunks[0].source_uri == "doc1"  # From document_id
+        assert chunks[0].source_uri == str(test_file)
+        assert chunks[0].document_id == "doc1"
         assert chunks[0].node_path == "1"
         assert chunks[0].node_chunk_index == 0
 
-        assert chunks[1].source_uri == "doc1"
+        assert chunks[1].source_uri == str(test_file)
+        assert chunks[1].document_id == "doc1"
         assert chunks[1].node_path == "1"
         assert chunks[1].node_chunk_index == 1
 
@@ -426,3 +429,369 @@ class TestDocumentIngestionPipeline:
 
         assert len(chunks) == 2
         mock_vector_store.store_chunks_async.assert_called_once()
+
+
+class _ConcurrencyProbe:
+    """Tracks how many calls are in progress at once"""
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, delay: float):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+
+
+def _uri_echo_pipeline(embed_probe: _ConcurrencyProbe, delays: dict[str, float] | None = None):
+    """Pipeline whose documents produce a single chunk containing their URI"""
+    reader = Mock()
+    reader.read_file.side_effect = lambda uri: OrthantDocument(
+        document_id=uri, source_uri=uri, nodes=[OrthantDocumentNode(node_path="1", content=uri)]
+    )
+    chunker = Mock()
+    chunker.chunk_document.side_effect = lambda doc: [
+        OrthantDocumentNodeChunk(document_id=doc.document_id, node_path="1", node_chunk_index=0, content=doc.source_uri)
+    ]
+    embedder = Mock()
+
+    async def encode_batch_async(texts):
+        await embed_probe.run((delays or {}).get(texts[0], 0.01))
+        return [[float(len(t))] for t in texts]
+
+    embedder.encode_batch_async = encode_batch_async
+    vector_store = Mock()
+
+    async def store_chunks_async(chunks):
+        pass
+
+    vector_store.store_chunks_async = store_chunks_async
+    vector_store.flush_async = AsyncMock()
+    return DocumentIngestionPipeline(reader=reader, chunker=chunker, embedder=embedder, vector_store=vector_store)
+
+
+@pytest.mark.unit
+class TestConcurrentBatchIngestion:
+
+    @pytest.mark.asyncio
+    async def test_default_is_sequential(self):
+        probe = _ConcurrencyProbe()
+        pipeline = _uri_echo_pipeline(probe)
+        uris = [f"doc{i}" for i in range(5)]
+
+        chunks = await pipeline.ingest_batch_async(uris)
+
+        assert [c.content for c in chunks] == uris
+        assert probe.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight_overlaps_embedding(self):
+        probe = _ConcurrencyProbe()
+        pipeline = _uri_echo_pipeline(probe)
+        uris = [f"doc{i}" for i in range(10)]
+
+        chunks = await pipeline.ingest_batch_async(uris, max_in_flight=4)
+
+        assert [c.content for c in chunks] == uris
+        assert 1 < probe.peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_stage_limit_bounds_embedding(self):
+        probe = _ConcurrencyProbe()
+        pipeline = _uri_echo_pipeline(probe)
+        uris = [f"doc{i}" for i in range(6)]
+
+        chunks = await pipeline.ingest_batch_async(uris, max_in_flight=6, stage_limits=StageLimits(embed=2))
+
+        assert len(chunks) == 6
+        assert probe.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_ordered_delivery_despite_slow_first_document(self):
+        probe = _ConcurrencyProbe()
+        pipeline = _uri_echo_pipeline(probe, delays={"slow": 0.1})
+        uris = ["slow", "fast1", "fast2"]
+
+        chunks = await pipeline.ingest_batch_async(uris, max_in_flight=3)
+
+        assert [c.content for c in chunks] == uris
+
+    @pytest.mark.asyncio
+    async def test_unordered_delivery_follows_completion(self):
+        probe = _ConcurrencyProbe()
+        pipeline = _uri_echo_pipeline(probe, delays={"slow": 0.1})
+        uris = ["slow", "fast1", "fast2"]
+
+        chunks = await pipeline.ingest_batch_async(uris, max_in_flight=3, ordered=False)
+
+        assert [c.content for c in chunks] == ["fast1", "fast2", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_and_cancels_remaining(self, tmp_path: Path, mock_chunker, mock_embedder, mock_vector_store):
+        file1 = tmp_path / "test1.txt"
+        file1.write_text("Content 1", encoding="utf-8")
+
+        pipeline = DocumentIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            vector_store=mock_vector_store,
+        )
+
+        with pytest.raises(FileNotFoundError):
+            await pipeline.ingest_batch_async([str(file1), str(tmp_path / "missing.txt")], max_in_flight=2)
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_in_flight(self):
+        pipeline = _uri_echo_pipeline(_ConcurrencyProbe())
+        with pytest.raises(ValueError):
+            await pipeline.ingest_batch_async(["doc"], max_in_flight=0)
+
+
+@pytest.mark.unit
+class TestStreamingIngestion:
+
+    def test_iter_ingest_yields_per_document_results(self, tmp_path: Path, text_reader, mock_chunker, mock_embedder, mock_vector_store):
+        files = []
+        for i in range(3):
+            f = tmp_path / f"test{i}.txt"
+            f.write_text(f"Content {i}", encoding="utf-8")
+            files.append(str(f))
+
+        pipeline = DocumentIngestionPipeline(
+            reader=text_reader,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            vector_store=mock_vector_store,
+        )
+
+        results = list(pipeline.iter_ingest(files))
+
+        assert [r.source_uri for r in results] == files
+        assert all(isinstance(r, IngestionResult) for r in results)
+        assert all(r.chunk_count == 2 and len(r.chunks) == 2 for r in results)
+        assert mock_vector_store.store_chunks.call_count == 3
+
+    def test_iter_ingest_consumes_uris_lazily(self, mock_chunker, mock_embedder, mock_vector_store):
+        consumed = []
+
+        def uris():
+            for i in range(3):
+                consumed.append(i)
+                yield f"data:,doc{i}"
+
+        pipeline = DocumentIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            vector_store=mock_vector_store,
+        )
+
+        results = pipeline.iter_ingest(uris())
+        first = next(results)
+
+        assert first.source_uri == "data:,doc0"
+        assert consumed == [0]
+        mock_vector_store.store_chunks.assert_called_once()
+
+    def test_iter_ingest_summary_only(self, mock_chunker, mock_embedder, mock_vector_store):
+        pipeline = DocumentIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            vector_store=mock_vector_store,
+        )
+
+        results = list(pipeline.iter_ingest(["data:,one", "data:,two"], include_chunks=False))
+
+        assert [(r.chunk_count, r.chunks) for r in results] == [(2, None), (2, None)]
+
+    @pytest.mark.asyncio
+    async def test_aiter_ingest_holds_at_most_max_in_flight_uris(self):
+        consumed = []
+
+        def uris():
+            for i in range(10):
+                consumed.append(i)
+                yield f"doc{i}"
+
+        pipeline = _uri_echo_pipeline(_ConcurrencyProbe())
+        results = pipeline.aiter_ingest(uris(), max_in_flight=3, include_chunks=False)
+
+        first = await anext(results)
+        assert first.source_uri == "doc0"
+        assert first.chunks is None
+        assert len(consumed) <= 4
+
+        remaining = [r.source_uri async for r in results]
+        assert remaining == [f"doc{i}" for i in range(1, 10)]
+
+    def test_iter_ingest_flushes_buffering_store(self, mock_chunker, mock_embedder, buffering_store):
+        pipeline = DocumentIngestionPipeline(
+            TextDocumentReader(DefaultContentLoader()), mock_chunker, mock_embedder, buffering_store
+        )
+
+        pipeline.ingest_batch(["data:,one", "data:,two"])
+
+        assert (len(buffering_store.rows), buffering_store.pending) == (4, [])
+
+    def test_close_flushes_or_closes_the_vector_store(self, mock_chunker, mock_embedder, buffering_store):
+        reader = TextDocumentReader(DefaultContentLoader())
+        buffering_store.store_chunks([
+            OrthantDocumentNodeChunk(document_id="d", node_path="1", node_chunk_index=0, content="pending")
+        ])
+        DocumentIngestionPipeline(reader, mock_chunker, mock_embedder, buffering_store).close()
+        closable = Mock()
+        DocumentIngestionPipeline(reader, mock_chunker, mock_embedder, closable).close()
+
+        assert (buffering_store.contents(), buffering_store.pending) == (["pending"], [])
+        closable.close.assert_called_once_with()
+        closable.flush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aiter_ingest_flushes_buffering_store(self, mock_chunker, mock_embedder, buffering_store):
+        pipeline = DocumentIngestionPipeline(
+            TextDocumentReader(DefaultContentLoader()), mock_chunker, mock_embedder, buffering_store
+        )
+
+        await pipeline.ingest_batch_async(["data:,one", "data:,two"], max_in_flight=2)
+
+        assert (len(buffering_store.rows), buffering_store.pending) == (4, [])
+
+
+class _WindowRecordingChunker(ChunkingStrategy):
+    """Chunks each node whole and records the documents of every `chunk_documents` call"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.windows: list[list[str]] = []
+
+    def chunk_document(self, document):
+        return [
+            OrthantDocumentNodeChunk(
+                document_id=document.document_id, node_path=node.node_path, node_chunk_index=0, content=node.content
+            )
+            for node in document.nodes
+        ]
+
+    def chunk_documents(self, documents):
+        self.windows.append([document.source_uri for document in documents])
+        time.sleep(self.delay)
+        return [self.chunk_document(document) for document in documents]
+
+
+@pytest.mark.unit
+class TestChunkWindows:
+
+    def test_iter_ingest_chunks_windows_of_documents(self, mock_embedder, store):
+        chunker = _WindowRecordingChunker()
+        pipeline = DocumentIngestionPipeline(
+            TextDocumentReader(DefaultContentLoader()), chunker, mock_embedder, store, chunk_window=2
+        )
+
+        results = list(pipeline.iter_ingest(["data:,a", "data:,b", "data:,c"]))
+
+        assert chunker.windows == [["data:,a", "data:,b"], ["data:,c"]]
+        assert [(r.source_uri, r.chunks[0].content) for r in results] == [
+            ("data:,a", "a"), ("data:,b", "b"), ("data:,c", "c")
+        ]
+        assert store.contents() == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_aiter_ingest_chunks_documents_in_flight_together(self, mock_embedder, store):
+        # While the first call runs, the other documents in flight queue up for the next one
+        chunker = _WindowRecordingChunker(delay=0.1)
+        pipeline = DocumentIngestionPipeline(TextDocumentReader(DefaultContentLoader()), chunker, mock_embedder, store)
+        uris = [f"data:,{name}" for name in "abcd"]
+
+        results = [r async for r in pipeline.aiter_ingest(uris, max_in_flight=4)]
+
+        assert [r.source_uri for r in results] == uris
+        assert sorted(uri for window in chunker.windows for uri in window) == uris
+        assert len(chunker.windows) <= 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("threaded", [True, False])
+    async def test_failed_window_only_fails_the_bad_document(self, threaded):
+        class FailingChunker(_WindowRecordingChunker):
+            def chunk_document(self, document):
+                if document.source_uri == "bad":
+                    raise ValueError("unchunkable")
+                return super().chunk_document(document)
+
+        chunker = FailingChunker()
+        window = _ChunkWindow(chunker, threaded=threaded)
+        documents = [
+            OrthantDocument(document_id=name, source_uri=name, nodes=[OrthantDocumentNode(node_path="1", content=name)])
+            for name in ("a", "bad", "c")
+        ]
+
+        results = await asyncio.gather(*(window.chunk(document) for document in documents), return_exceptions=True)
+
+        assert [results[0][0].content, results[2][0].content] == ["a", "c"]
+        assert isinstance(results[1], ValueError)
+        assert chunker.windows == [["a", "bad", "c"], ["a"], ["bad"], ["c"]]
+
+    def test_rejects_invalid_chunk_window(self, mock_chunker, mock_embedder, store):
+        with pytest.raises(ValueError):
+            DocumentIngestionPipeline(
+                TextDocumentReader(DefaultContentLoader()), mock_chunker, mock_embedder, store, chunk_window=0
+            )
+
+
+@pytest.mark.unit
+class TestStreamingDocumentIngestion:
+
+    def test_ingest_streaming_stores_in_batches(self, tmp_path: Path, mock_vector_store):
+        from orthant.core.chunking import RegexChunkingStrategy
+
+        p = tmp_path / "large.txt"
+        p.write_text(" ".join(f"Sentence {i}." for i in range(50)), encoding="utf-8")
+        embedder = Mock()
+        embedder.encode_batch.side_effect = lambda texts: [[0.0] for _ in texts]
+        pipeline = DocumentIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader(), block_size=40),
+            chunker=RegexChunkingStrategy.sentence_splitter(n_sentences=1, overlap=0),
+            embedder=embedder,
+            vector_store=mock_vector_store,
+        )
+
+        result = pipeline.ingest_streaming(str(p), batch_size=8)
+
+        assert result.chunk_count == 50
+        assert result.chunks is None
+        batches = [call.args[0] for call in mock_vector_store.store_chunks.call_args_list]
+        assert [len(batch) for batch in batches] == [8] * 6 + [2]
+        assert all(len(call.args[0]) <= 8 for call in embedder.encode_batch.call_args_list)
+        assert {chunk.source_uri for batch in batches for chunk in batch} == {batches[0][0].source_uri}
+
+    def test_ingest_streaming_with_structural_chunker(self, mock_vector_store):
+        class NodeChunker:
+            """Implements only `chunk_document`, without subclassing ChunkingStrategy"""
+            def chunk_document(self, document):
+                return [
+                    OrthantDocumentNodeChunk(
+                        document_id=document.document_id, node_path=node.node_path, node_chunk_index=0,
+                        content=node.content,
+                    )
+                    for node in document.nodes
+                ]
+
+        embedder = Mock()
+        embedder.encode_batch.side_effect = lambda texts: [[0.0] for _ in texts]
+        pipeline = DocumentIngestionPipeline(
+            TextDocumentReader(DefaultContentLoader()), NodeChunker(), embedder, mock_vector_store
+        )
+
+        result = pipeline.ingest_streaming("data:,hello")
+
+        assert result.chunk_count == 1
+        assert mock_vector_store.store_chunks.call_args.args[0][0].content == "hello"
+
+    def test_ingest_streaming_rejects_invalid_batch_size(self, text_reader, mock_chunker, mock_embedder, mock_vector_store):
+        pipeline = DocumentIngestionPipeline(text_reader, mock_chunker, mock_embedder, mock_vector_store)
+        with pytest.raises(ValueError):
+            pipeline.ingest_streaming("data:,x", batch_size=0)
@@ -0,0 +1,79 @@
+import pytest
+from pathlib import Path
+
+from orthant.core.chunking import RegexChunkingStrategy
+from orthant.core.documents import DefaultContentLoader, MappedFile
+
+
+TEXT = "Café 🚀 — hello.\nSecond line é.\n" * 50
+
+
+@pytest.fixture
+def loader():
+    return DefaultContentLoader()
+
+
+@pytest.mark.unit
+class TestMappedFile:
+
+    def test_buffer_is_file_bytes(self, tmp_path: Path, loader):
+        p = tmp_path / "mapped.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        with loader.open_mapped(str(p)) as mapped:
+            assert len(mapped) == len(TEXT.encode("utf-8"))
+            assert bytes(mapped.buffer[:5]) == "Café".encode("utf-8")[:5]
+            assert mapped.decode() == TEXT
+
+    def test_file_uri(self, tmp_path: Path, loader):
+        p = tmp_path / "mapped_uri.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        with loader.open_mapped(p.resolve().as_uri()) as mapped:
+            assert mapped.decode(0, 5) == "Café"
+
+    @pytest.mark.parametrize("block_size", [1, 3, 7, 4096])
+    def test_iter_text_reassembles_with_byte_offsets(self, tmp_path: Path, block_size):
+        p = tmp_path / "blocks.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        with MappedFile(str(p)) as mapped:
+            blocks = list(mapped.iter_text(block_size=block_size))
+            assert "".join(text for _, text in blocks) == TEXT
+            for offset, text in blocks:
+                assert mapped.decode(offset, offset + len(text.encode("utf-8"))) == text
+
+    def test_empty_file(self, tmp_path: Path):
+        p = tmp_path / "empty.txt"
+        p.write_bytes(b"")
+        with MappedFile(str(p)) as mapped:
+            assert len(mapped) == 0
+            assert mapped.decode() == ""
+            assert list(mapped.iter_text()) == []
+
+    def test_chunk_mapped_file(self, tmp_path: Path, loader):
+        p = tmp_path / "chunked.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        chunker = RegexChunkingStrategy.word_splitter(n_words=4, overlap=0)
+        with loader.open_mapped(str(p)) as mapped:
+            chunks = list(chunker.chunk_buffer("doc", "1", mapped.buffer))
+        assert chunks[0].content == "Café 🚀 — hello."
+        assert [chunk.content for chunk in chunks] == [TEXT[start:end] for start, end in chunker.iter_spans(TEXT)]
+
+    def test_views_outlive_close(self, tmp_path: Path, loader):
+        p = tmp_path / "views.txt"
+        p.write_text(TEXT, encoding="utf-8")
+        chunker = RegexChunkingStrategy.word_splitter(n_words=4, overlap=0)
+        with loader.open_mapped(str(p)) as mapped:
+            head = mapped.buffer[:5]
+            chunks = chunker.chunk_buffer("doc", "1", mapped.buffer)
+            first = next(chunks)
+        assert bytes(head) == "Café".encode("utf-8")[:5]
+        contents = [first.content, *(chunk.content for chunk in chunks)]
+        assert contents == [TEXT[start:end] for start, end in chunker.iter_spans(TEXT)]
+        head.release()
+
+    def test_remote_uri_is_rejected(self, loader):
+        with pytest.raises(ValueError):
+            loader.open_mapped("memory://bucket/file.txt")
+
+    def test_missing_file(self, tmp_path: Path, loader):
+        with pytest.raises(FileNotFoundError):
+            loader.open_mapped(str(tmp_path / "missing.txt"))
@@ -0,0 +1,201 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from orthant.core.chunking import ChunkingStrategy
+from orthant.core.documents import (
+    DefaultContentLoader,
+    OrthantDocument,
+    OrthantDocumentNode,
+    OrthantDocumentNodeChunk,
+    TextDocumentReader,
+)
+from orthant.core.ingestion import EngineConfig, StagedIngestionEngine
+
+
+class LineChunker(ChunkingStrategy):
+    """Splits every node into one chunk per line"""
+    def chunk_document(self, document: OrthantDocument) -> list[OrthantDocumentNodeChunk]:
+        return [
+            OrthantDocumentNodeChunk(
+                document_id=document.document_id,
+                node_path=node.node_path,
+                node_chunk_index=i,
+                content=line,
+            )
+            for node in document.nodes
+            for i, line in enumerate(node.content.splitlines())
+        ]
+
+
+class WindowRecordingChunker(LineChunker):
+    """Line chunker that records how many documents every `chunk_documents` call gets"""
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.window_sizes: list[int] = []
+
+    def chunk_documents(self, documents: list[OrthantDocument]) -> list[list[OrthantDocumentNodeChunk]]:
+        self.window_sizes.append(len(documents))
+        time.sleep(self.delay)
+        return [self.chunk_document(document) for document in documents]
+
+
+class SlowEmbedder:
+    """Embeds each text as [len(text)] after a short delay"""
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def encode_batch_async(self, batch: list[str]) -> list[list[float]]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return [[float(len(text))] for text in batch]
+
+
+def _vector_store():
+    vector_store = Mock()
+    vector_store.store_chunks_async = AsyncMock()
+    vector_store.flush_async = AsyncMock()
+    return vector_store
+
+
+@pytest.mark.unit
+class TestStagedIngestionEngine:
+
+    @pytest.mark.asyncio
+    async def test_ingests_every_document(self, tmp_path):
+        uris = []
+        for i in range(6):
+            p = tmp_path / f"doc{i}.txt"
+            p.write_text("\n".join(f"line {j}" for j in range(i + 1)), encoding="utf-8")
+            uris.append(str(p))
+        vector_store = _vector_store()
+        engine = StagedIngestionEngine(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=LineChunker(),
+            embedder=SlowEmbedder(),
+            vector_store=vector_store,
+            config=EngineConfig(read_workers=2, embed_workers=3),
+        )
+
+        results = [r async for r in engine.run(uris)]
+
+        assert sorted(r.source_uri for r in results) == sorted(uris)
+        assert {r.source_uri: r.chunk_count for r in results} == {uri: i + 1 for i, uri in enumerate(uris)}
+        assert all(r.chunks is None for r in results)
+        assert vector_store.store_chunks_async.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_flushes_buffering_store(self, buffering_store):
+        engine = StagedIngestionEngine(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=LineChunker(),
+            embedder=SlowEmbedder(),
+            vector_store=buffering_store,
+        )
+
+        [r async for r in engine.run(["data:,a%0Ab", "data:,c"])]
+
+        assert buffering_store.contents() == ["a", "b", "c"]
+        assert buffering_store.pending == []
+
+    @pytest.mark.asyncio
+    async def test_chunks_waiting_documents_together(self):
+        chunker = WindowRecordingChunker(delay=0.05)
+        engine = StagedIngestionEngine(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=chunker,
+            embedder=SlowEmbedder(),
+            vector_store=_vector_store(),
+            config=EngineConfig(chunk_window=3),
+        )
+
+        results = [r async for r in engine.run([f"data:,doc{i}" for i in range(8)])]
+
+        assert len(results) == 8
+        assert sum(chunker.window_sizes) == 8
+        assert 1 < max(chunker.window_sizes) <= 3
+
+    @pytest.mark.asyncio
+    async def test_include_chunks(self):
+        engine = StagedIngestionEngine(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=LineChunker(),
+            embedder=SlowEmbedder(),
+            vector_store=_vector_store(),
+            modality="custom",
+        )
+
+        results = [r async for r in engine.run(["data:,ab%0Acde"], include_chunks=True)]
+
+        assert [(c.content, c.embedding, c.modality) for c in results[0].chunks] == [
+            ("ab", [2.0], "custom"),
+            ("cde", [3.0], "custom"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_reads_ahead_of_embedder(self):
+        read_count = 0
+
+        def read_file(uri):
+            nonlocal read_count
+            read_count += 1
+            return OrthantDocument(document_id=uri, source_uri=uri, nodes=[OrthantDocumentNode(node_path="1", content=uri)])
+
+        reader = Mock()
+        reader.read_file.side_effect = read_file
+        config = EngineConfig(read_workers=2, chunk_workers=1, embed_workers=1, store_workers=1, queue_size=2)
+        engine = StagedIngestionEngine(
+            reader=reader,
+            chunker=LineChunker(),
+            embedder=SlowEmbedder(delay=0.05),
+            vector_store=_vector_store(),
+            config=config,
+        )
+
+        results = engine.run(f"doc{i}" for i in range(100))
+        await anext(results)
+        # Only the queues and workers between the reader and the embedder can hold documents
+        assert read_count < 20
+        await results.aclose()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, tmp_path):
+        good = tmp_path / "good.txt"
+        good.write_text("content", encoding="utf-8")
+        engine = StagedIngestionEngine(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=LineChunker(),
+            embedder=SlowEmbedder(),
+            vector_store=_vector_store(),
+        )
+
+        with pytest.raises(FileNotFoundError):
+            [r async for r in engine.run([str(good), str(tmp_path / "missing.txt")])]
+
+    @pytest.mark.asyncio
+    async def test_process_pool_chunking(self):
+        engine = StagedIngestionEngine(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=LineChunker(),
+            embedder=SlowEmbedder(),
+            vector_store=_vector_store(),
+            config=EngineConfig(chunk_workers=2, chunk_executor="process"),
+        )
+
+        results = [r async for r in engine.run([f"data:,a%0Ab%0Ac{i}" for i in range(4)], include_chunks=True)]
+
+        assert len(results) == 4
+        assert all([c.content for c in r.chunks][:2] == ["a", "b"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        engine = StagedIngestionEngine(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=LineChunker(),
+            embedder=SlowEmbedder(),
+            vector_store=_vector_store(),
+        )
+
+        assert [r async for r in engine.run([])] == []
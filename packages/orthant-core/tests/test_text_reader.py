@@ -5,8 +5,8 @@ import zipfile
 from pathlib import Path
 from unittest.mock import Mock
 
-from orthant.core.documents import TextDocumentReader, DefaultContentLoader, ContentLoader
-from orthant.core.documents.contracts import DocumentReader
+from orthant.core.documents import TextDocumentReader, DefaultContentLoader, ContentLoader, DocumentReaderDispatcher
+from orthant.core.documents.contracts import DocumentReader, OrthantDocument, OrthantDocumentNode, StreamingDocument
 
 
 TEXT_CASES = [
@@ -731,3 +731,131 @@ class TestTextReader:
         assert reader.can_read(45.67) == False
         assert reader.can_read([]) == False
         assert reader.can_read({}) == False
+
+
+@pytest.mark.unit
+class TestStreamingTextReader:
+
+    TEXT = "".join(f"Paragraph {i} has a few words in it.\n\n" for i in range(40))
+
+    def test_block_size_splits_into_numbered_nodes(self, tmp_path: Path):
+        p = tmp_path / "big.txt"
+        p.write_text(self.TEXT, encoding="utf-8")
+        doc = TextDocumentReader(DefaultContentLoader(), block_size=100).read_file(str(p))
+        assert len(doc.nodes) > 1
+        assert [node.node_path for node in doc.nodes] == [str(i) for i in range(1, len(doc.nodes) + 1)]
+        assert "".join(node.content for node in doc.nodes) == self.TEXT
+
+    def test_nodes_end_at_paragraph_breaks(self, tmp_path: Path):
+        p = tmp_path / "paragraphs.txt"
+        p.write_text(self.TEXT, encoding="utf-8")
+        doc = TextDocumentReader(DefaultContentLoader(), block_size=100).read_file(str(p))
+        for node in doc.nodes:
+            assert node.content.endswith("\n\n")
+            assert len(node.content) <= 100
+
+    def test_words_are_not_split_without_paragraphs(self, tmp_path: Path):
+        text = " ".join(f"word{i}" for i in range(500))
+        p = tmp_path / "words.txt"
+        p.write_text(text, encoding="utf-8")
+        doc = TextDocumentReader(DefaultContentLoader(), block_size=64).read_file(str(p))
+        assert "".join(node.content for node in doc.nodes) == text
+        assert all(node.content.endswith(" ") for node in doc.nodes[:-1])
+
+    def test_long_token_is_cut_at_block_size(self, tmp_path: Path):
+        p = tmp_path / "token.txt"
+        p.write_text("x" * 250, encoding="utf-8")
+        doc = TextDocumentReader(DefaultContentLoader(), block_size=100).read_file(str(p))
+        assert [len(node.content) for node in doc.nodes] == [100, 100, 50]
+
+    def test_empty_file_has_one_empty_node(self, tmp_path: Path):
+        p = tmp_path / "empty.txt"
+        p.write_text("", encoding="utf-8")
+        doc = TextDocumentReader(DefaultContentLoader(), block_size=100).read_file(str(p))
+        assert [(node.node_path, node.content) for node in doc.nodes] == [("1", "")]
+
+    def test_iter_nodes_reads_lazily(self, tmp_path: Path):
+        p = tmp_path / "lazy.txt"
+        p.write_text(self.TEXT, encoding="utf-8")
+        loader = DefaultContentLoader()
+        blocks_read = []
+        iter_text = loader.iter_text
+
+        def recording_iter_text(uri, **kwargs):
+            for block in iter_text(uri, **kwargs):
+                blocks_read.append(block)
+                yield block
+
+        loader.iter_text = recording_iter_text
+        nodes = TextDocumentReader(loader, block_size=100).iter_nodes(str(p))
+        next(nodes)
+        assert len(blocks_read) <= 2
+
+    def test_custom_loader_without_iter_text(self, tmp_path: Path):
+        p = tmp_path / "custom.txt"
+        p.write_text(self.TEXT, encoding="utf-8")
+
+        class PlainLoader(ContentLoader):
+            def load_text(self, uri, *, encoding="utf-8"):
+                with open(uri, "r", encoding=encoding) as f:
+                    return f.read()
+
+        doc = TextDocumentReader(PlainLoader(), block_size=100).read_file(str(p))
+        assert "".join(node.content for node in doc.nodes) == self.TEXT
+
+    def test_invalid_block_size(self):
+        with pytest.raises(ValueError):
+            TextDocumentReader(DefaultContentLoader(), block_size=0)
+
+
+@pytest.mark.unit
+class TestStreamingDocument:
+
+    def test_read_file_streaming_yields_nodes_lazily(self, tmp_path: Path):
+        p = tmp_path / "stream.txt"
+        p.write_text("alpha beta gamma delta " * 20, encoding="utf-8")
+        reader = TextDocumentReader(DefaultContentLoader(), block_size=50)
+        streaming = reader.read_file_streaming(str(p))
+        assert streaming.source_uri == str(p)
+        nodes = list(streaming.iter_nodes())
+        assert len(nodes) > 1
+        assert "".join(node.content for node in nodes) == "alpha beta gamma delta " * 20
+
+    def test_nodes_can_only_be_iterated_once(self, tmp_path: Path, reader):
+        p = tmp_path / "once.txt"
+        p.write_text("hello", encoding="utf-8")
+        streaming = reader.read_file_streaming(str(p))
+        list(streaming.iter_nodes())
+        with pytest.raises(RuntimeError):
+            list(streaming.iter_nodes())
+
+    def test_to_document_adapter(self, tmp_path: Path, reader):
+        p = tmp_path / "adapter.txt"
+        p.write_text("hello", encoding="utf-8")
+        streaming = reader.read_file_streaming(str(p))
+        doc = streaming.to_document()
+        assert doc.document_id == streaming.document_id
+        assert [(node.node_path, node.content) for node in doc.nodes] == [("1", "hello")]
+
+    def test_default_read_file_streaming_wraps_read_file(self):
+        class ListReader(DocumentReader):
+            def can_read(self, file_uri):
+                return True
+
+            def read_file(self, file_uri):
+                return OrthantDocument(
+                    document_id="doc", source_uri=file_uri,
+                    nodes=[OrthantDocumentNode(node_path="1", content="a"), OrthantDocumentNode(node_path="2", content="b")],
+                )
+
+        streaming = ListReader().read_file_streaming("any://uri")
+        assert StreamingDocument.from_document(ListReader().read_file("x")).to_document().nodes[1].content == "b"
+        assert [node.node_path for node in streaming.iter_nodes()] == ["1", "2"]
+
+    def test_dispatcher_read_file_streaming(self, tmp_path: Path):
+        p = tmp_path / "dispatch.txt"
+        p.write_text("hello", encoding="utf-8")
+        dispatcher = DocumentReaderDispatcher([TextDocumentReader(DefaultContentLoader())])
+        assert dispatcher.read_file_streaming(str(p)).to_document().nodes[0].content == "hello"
+        with pytest.raises(ValueError):
+            dispatcher.read_file_streaming(str(tmp_path / "file.pdf"))
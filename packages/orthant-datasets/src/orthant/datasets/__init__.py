@@ -1,17 +1,24 @@
 from .container import DatasetsContainer
+from .crawler import DatasetCrawler
 from .dataset_registry import DatasetRegistry, InMemoryDatasetRegistry
 from .dataset_service import DatasetService
 from .dataset_spec import DatasetSpec
+from .ingestion_jobs import IngestionJob, IngestionJobRunner
 
 
 __all__ = [
     # _container
     DatasetsContainer.__name__,
+    # _crawler
+    DatasetCrawler.__name__,
     # _dataset_registry
     DatasetRegistry.__name__,
     InMemoryDatasetRegistry.__name__,
     # _dataset_service
     DatasetService.__name__,
     # _dataset_spec
-    DatasetSpec.__name__
+    DatasetSpec.__name__,
+    # _ingestion_jobs
+    IngestionJob.__name__,
+    IngestionJobRunner.__name__,
 ]
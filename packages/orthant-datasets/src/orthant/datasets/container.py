@@ -2,9 +2,17 @@ from dependency_injector import containers, providers
 
 from .dataset_registry import InMemoryDatasetRegistry
 from .dataset_service import DatasetService
+from .ingestion_jobs import IngestionJobRunner
 
 
 class DatasetsContainer(containers.DeclarativeContainer):
     """DI container for the dataset package"""
     dataset_registry = providers.Singleton(InMemoryDatasetRegistry)
     dataset_service = providers.Singleton(DatasetService, dataset_registry=dataset_registry)
+    # Override with a callable creating the ingestion pipeline of a dataset to enable ingestion jobs
+    pipeline_factory = providers.Object(None)
+    # Override with the storage directory to keep ingestion progress across jobs and restarts
+    storage_dir = providers.Object(None)
+    ingestion_job_runner = providers.Singleton(
+        IngestionJobRunner, pipeline_factory=pipeline_factory, storage_dir=storage_dir
+    )
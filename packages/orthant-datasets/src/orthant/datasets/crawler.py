@@ -0,0 +1,201 @@
+import queue
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import fsspec
+from fsspec.asyn import AsyncFileSystem, sync
+from fsspec.utils import glob_translate
+
+from .dataset_spec import DatasetSpec
+
+if TYPE_CHECKING:
+    from orthant.core.ingestion import DocumentIngestionPipeline, IngestionResult
+
+
+_DONE = object()
+
+
+class DatasetCrawler:
+    """
+    Lists the files of a dataset location as a stream of URIs.
+
+    The top level of `uri` is listed first; each sub-directory is then walked by its own worker, and
+    matches are handed over in pages as each directory is listed. On object stores with a paged listing,
+    such as s3fs, each page of a directory is handed over as it arrives, so no directory is listed in full
+    first. Ingestion can start on the first page while the rest of the dataset is still being listed.
+    URIs come out in no particular order.
+
+    fsspec has no public paged listing: pages come from the `_iterdir(bucket, prefix)` coroutine of s3fs
+    (checked against s3fs 2025.9). Other filesystems list each directory in full with `ls`.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        glob: str | None = None,
+        storage_options: dict | None = None,
+        max_workers: int = 8,
+        page_size: int = 1000,
+        max_pending_pages: int = 16,
+    ):
+        """
+        Args:
+            uri: Root of the dataset, e.g. "s3://bucket/prefix" or a local directory
+            glob: Pattern matched against paths relative to `uri`, e.g. "**/*.txt" (default: all files)
+            storage_options: Options passed to the fsspec filesystem
+            max_workers: Number of prefixes listed in parallel
+            page_size: Maximum number of URIs per page
+            max_pending_pages: Pages buffered ahead of the consumer before listing pauses
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self._fs, root = fsspec.core.url_to_fs(uri, **(storage_options or {}))
+        self._root = root.rstrip("/")
+        self._pattern = re.compile(glob_translate(glob)) if glob else None
+        # A pattern without a path separator only matches files at the top level
+        self._recursive = glob is None or "/" in glob or "**" in glob
+        self._max_workers = max_workers
+        self._page_size = page_size
+        self._max_pending_pages = max_pending_pages
+
+    @classmethod
+    def for_dataset(cls, dataset_spec: DatasetSpec, **kwargs) -> "DatasetCrawler":
+        """Crawler for the `uri` and `glob` of a dataset."""
+        if not dataset_spec.uri:
+            raise ValueError(f"Dataset '{dataset_spec.dataset_id}' has no uri")
+        return cls(dataset_spec.uri, glob=dataset_spec.glob, **kwargs)
+
+    def iter_uris(self) -> Iterator[str]:
+        """Yield the URI of each matching file as it is listed."""
+        for page in self.iter_pages():
+            yield from page
+
+    def iter_pages(self) -> Iterator[list[str]]:
+        """Yield pages of matching file URIs as they are listed."""
+        pages: queue.Queue = queue.Queue(maxsize=self._max_pending_pages)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="dataset-crawler")
+        producer = threading.Thread(target=self._list, args=(executor, pages, stop), daemon=True)
+        producer.start()
+        try:
+            while (page := pages.get()) is not _DONE:
+                if isinstance(page, BaseException):
+                    raise page
+                yield page
+        finally:
+            stop.set()
+            # Unblock workers waiting on a full queue
+            while not pages.empty():
+                pages.get_nowait()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def ingest(
+        self, pipeline: "DocumentIngestionPipeline", include_chunks: bool = False
+    ) -> Iterator["IngestionResult"]:
+        """
+        Ingest the listed files as they are found.
+        Args:
+            pipeline: Pipeline that ingests each file
+            include_chunks: Keep the embedded chunks in each result (default: False)
+        Returns:
+            Iterator of per-file results
+        """
+        return pipeline.iter_ingest(self.iter_uris(), include_chunks=include_chunks)
+
+    def _list(self, executor: ThreadPoolExecutor, pages: queue.Queue, stop: threading.Event) -> None:
+        try:
+            if self._fs.isfile(self._root):
+                self._put(pages, stop, [self._fs.unstrip_protocol(self._root)])
+                return
+            futures = []
+            for entries in self._iter_listing(self._root):
+                if stop.is_set():
+                    return
+                files, prefixes = _split_entries(entries)
+                self._emit(files, pages, stop)
+                if self._recursive:
+                    # Walk sub-directories while the rest of the top level is still being listed
+                    futures.extend(executor.submit(self._walk, prefix, pages, stop) for prefix in prefixes)
+            for future in futures:
+                future.result()
+        except BaseException as e:
+            self._put(pages, stop, e)
+        finally:
+            self._put(pages, stop, _DONE)
+
+    def _walk(self, prefix: str, pages: queue.Queue, stop: threading.Event) -> None:
+        directories = [prefix]
+        while directories:
+            for entries in self._iter_listing(directories.pop()):
+                if stop.is_set():
+                    return
+                files, subdirectories = _split_entries(entries)
+                self._emit(files, pages, stop)
+                directories.extend(subdirectories)
+
+    def _iter_listing(self, path: str) -> Iterator[list[dict]]:
+        """
+        List the entries of a directory, in pages of at most `page_size` when the filesystem pages its
+        listing, else all at once.
+        """
+        if not has_paged_listing(self._fs):
+            yield self._fs.ls(path, detail=True)
+            return
+        bucket, key = self._fs.split_path(path)[:2]
+        entries = self._fs._iterdir(bucket, prefix=f"{key.rstrip('/')}/" if key else "")
+        try:
+            while page := sync(self._fs.loop, _take, entries, self._page_size):
+                # A directory marker object lists as the directory itself
+                yield [entry for entry in page if entry["name"].rstrip("/") != path.rstrip("/")]
+        finally:
+            sync(self._fs.loop, entries.aclose)
+
+    def _emit(self, paths: list[str], pages: queue.Queue, stop: threading.Event) -> None:
+        matches = [self._fs.unstrip_protocol(path) for path in paths if self._matches(path)]
+        for i in range(0, len(matches), self._page_size):
+            self._put(pages, stop, matches[i:i + self._page_size])
+
+    def _matches(self, path: str) -> bool:
+        if self._pattern is None:
+            return True
+        relative = path[len(self._root):].lstrip("/") if path.startswith(self._root) else path
+        return self._pattern.match(relative) is not None
+
+    @staticmethod
+    def _put(pages: queue.Queue, stop: threading.Event, item) -> None:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def has_paged_listing(fs: fsspec.AbstractFileSystem) -> bool:
+    """Whether a filesystem lists directories in pages, through the `_iterdir` coroutine of s3fs."""
+    return (
+        isinstance(fs, AsyncFileSystem)
+        and callable(getattr(fs, "_iterdir", None))
+        and callable(getattr(fs, "split_path", None))
+    )
+
+
+def _split_entries(entries: list[dict]) -> tuple[list[str], list[str]]:
+    """Paths of the files and of the sub-directories among listing entries."""
+    files, directories = [], []
+    for entry in entries:
+        (directories if entry["type"] == "directory" else files).append(entry["name"])
+    return files, directories
+
+
+async def _take(entries, n: int) -> list[dict]:
+    """Next `n` entries of an async listing, fewer at its end."""
+    page = []
+    async for entry in entries:
+        page.append(entry)
+        if len(page) >= n:
+            break
+    return page
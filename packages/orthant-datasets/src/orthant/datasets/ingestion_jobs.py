@@ -0,0 +1,247 @@
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+from uuid import uuid4
+
+from orthant.core.ingestion import SqliteIngestionManifest
+
+from .crawler import DatasetCrawler
+from .dataset_spec import DatasetSpec
+
+if TYPE_CHECKING:
+    from orthant.core.ingestion import DocumentIngestionPipeline
+
+
+JobStatus = Literal["queued", "running", "completed", "failed", "cancelled"]
+
+# Per-file errors kept on a job; later errors are only counted
+MAX_JOB_ERRORS = 100
+
+
+@dataclass
+class IngestionJob:
+    """Status and progress of a dataset ingestion job"""
+    job_id: str
+    dataset_id: str
+    status: JobStatus = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    files_done: int = 0
+    files_failed: int = 0
+    chunks_done: int = 0
+    errors: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_done / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks_done / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "dataset_id": self.dataset_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "files_done": self.files_done,
+            "files_failed": self.files_failed,
+            "chunks_done": self.chunks_done,
+            "files_per_second": self.files_per_second,
+            "chunks_per_second": self.chunks_per_second,
+            "errors": list(self.errors),
+            "error": self.error,
+        }
+
+
+class IngestionJobRunner:
+    """
+    Runs dataset ingestion jobs in the background.
+
+    Jobs are queued on the event loop and at most `max_concurrent_jobs` run at a time, each on its own
+    worker thread, so listing, reading and embedding never block the API's event loop. Files that fail are
+    recorded on the job and skipped; a job where every file failed is itself failed. Progress is kept in the dataset's ingestion manifest under `storage_dir`,
+    so a job that was cancelled or interrupted resumes where it stopped and files already ingested are skipped.
+    A dataset has at most one queued or running job, since jobs of the same dataset share its manifest and table.
+    """
+
+    def __init__(
+        self,
+        pipeline_factory: Callable[[DatasetSpec], "DocumentIngestionPipeline"] | None = None,
+        max_concurrent_jobs: int = 2,
+        crawler_factory: Callable[[DatasetSpec], DatasetCrawler] = DatasetCrawler.for_dataset,
+        storage_dir: str | None = None,
+        max_finished_jobs: int = 1000,
+    ):
+        """
+        Args:
+            pipeline_factory: Creates the ingestion pipeline of a dataset; ingestion is disabled without one
+            max_concurrent_jobs: Maximum number of jobs running at the same time
+            crawler_factory: Creates the crawler listing a dataset's files (default: `DatasetCrawler.for_dataset`)
+            storage_dir: Directory of the datasets' ingestion manifests; without one, progress is only kept
+                for the duration of a job
+            max_finished_jobs: Number of finished jobs kept; older ones are forgotten
+        """
+        if max_concurrent_jobs < 1:
+            raise ValueError(f"max_concurrent_jobs must be at least 1, got {max_concurrent_jobs}")
+        self._pipeline_factory = pipeline_factory
+        self._crawler_factory = crawler_factory
+        self._max_concurrent_jobs = max_concurrent_jobs
+        self._storage_dir = storage_dir
+        self._max_finished_jobs = max_finished_jobs
+        self._jobs: dict[str, IngestionJob] = {}
+        self._active_jobs: dict[str, IngestionJob] = {}
+        self._cancel_events: dict[str, threading.Event] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._pipeline_factory is not None
+
+    def submit(self, dataset_spec: DatasetSpec) -> IngestionJob:
+        """
+        Queue an ingestion job for a dataset. Must be called from the event loop.
+        Args:
+            dataset_spec: Dataset to ingest; must have a `uri`
+        Returns:
+            The queued job
+        Raises:
+            RuntimeError: If ingestion is not configured, or the dataset already has a queued or running job
+        """
+        if self._pipeline_factory is None:
+            raise RuntimeError("Ingestion is not configured: no pipeline factory")
+        if not dataset_spec.uri:
+            raise ValueError(f"Dataset '{dataset_spec.dataset_id}' has no uri")
+        active = self._active_jobs.get(dataset_spec.dataset_id)
+        if active is not None:
+            raise RuntimeError(
+                f"Dataset '{dataset_spec.dataset_id}' already has job '{active.job_id}' {active.status}"
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_jobs)
+            self._executor = ThreadPoolExecutor(self._max_concurrent_jobs, thread_name_prefix="ingestion-job")
+        job = IngestionJob(job_id=str(uuid4()), dataset_id=dataset_spec.dataset_id)
+        self._jobs[job.job_id] = job
+        self._active_jobs[job.dataset_id] = job
+        self._cancel_events[job.job_id] = threading.Event()
+        task = asyncio.get_running_loop().create_task(self._run(job, dataset_spec))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get_job(self, job_id: str) -> IngestionJob | None:
+        return self._jobs.get(job_id)
+
+    def get_active_job(self, dataset_id: str) -> IngestionJob | None:
+        """The queued or running job of a dataset, if any."""
+        return self._active_jobs.get(dataset_id)
+
+    def list_jobs(self, dataset_id: str | None = None) -> list[IngestionJob]:
+        return [job for job in self._jobs.values() if dataset_id is None or job.dataset_id == dataset_id]
+
+    def cancel(self, job_id: str) -> bool:
+        """Ask a queued or running job to stop. Returns False if the job is unknown or already finished."""
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in ("queued", "running"):
+            return False
+        self._cancel_events[job_id].set()
+        return True
+
+    async def wait(self) -> None:
+        """Wait until all submitted jobs have finished."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """Cancel all jobs and wait for them to stop."""
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+        await self.wait()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    async def _run(self, job: IngestionJob, dataset_spec: DatasetSpec) -> None:
+        try:
+            await self._run_when_allowed(job, dataset_spec)
+        finally:
+            del self._active_jobs[job.dataset_id]
+
+    async def _run_when_allowed(self, job: IngestionJob, dataset_spec: DatasetSpec) -> None:
+        cancelled = self._cancel_events[job.job_id]
+        async with self._semaphore:
+            if cancelled.is_set():
+                job.status = "cancelled"
+                return
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._ingest, job, dataset_spec, cancelled
+                )
+                if cancelled.is_set():
+                    job.status = "cancelled"
+                elif job.files_failed and not job.files_done:
+                    job.status = "failed"
+                    job.error = f"All {job.files_failed} files failed"
+                else:
+                    job.status = "completed"
+            except Exception as e:
+                logging.exception(f"Ingestion job '{job.job_id}' for dataset '{job.dataset_id}' failed")
+                job.status = "failed"
+                job.error = f"{type(e).__name__}: {e}"
+            finally:
+                job.finished_at = time.time()
+                self._forget_finished_jobs()
+
+    def _forget_finished_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(0, len(finished) - self._max_finished_jobs)]:
+            del self._jobs[job_id]
+            del self._cancel_events[job_id]
+
+    def _open_manifest(self, dataset_spec: DatasetSpec) -> SqliteIngestionManifest:
+        if self._storage_dir is None:
+            return SqliteIngestionManifest(":memory:")
+        return SqliteIngestionManifest.for_dataset(self._storage_dir, dataset_spec.dataset_id)
+
+    def _ingest(self, job: IngestionJob, dataset_spec: DatasetSpec, cancelled: threading.Event) -> None:
+        pipeline = self._pipeline_factory(dataset_spec)
+
+        def record_failure(uri: str, error: Exception) -> None:
+            job.files_failed += 1
+            if len(job.errors) < MAX_JOB_ERRORS:
+                job.errors.append(f"{uri}: {type(error).__name__}: {error}")
+
+        try:
+            with self._open_manifest(dataset_spec) as manifest:
+                uris = self._crawler_factory(dataset_spec).iter_uris()
+                results = pipeline.iter_ingest_resumable(uris, manifest, skip_failed=True, on_failure=record_failure)
+                # Close the results before the manifest, so completed files are recorded in it
+                with contextlib.closing(uris), contextlib.closing(results):
+                    for result in results:
+                        job.files_done += 1
+                        job.chunks_done += result.chunk_count
+                        if cancelled.is_set():
+                            return
+        finally:
+            # The pipeline was built for this job: write what its vector store buffers and stop its flush timer
+            pipeline.close()
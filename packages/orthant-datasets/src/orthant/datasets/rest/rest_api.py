@@ -6,6 +6,7 @@ from dependency_injector.wiring import inject, Provide
 from ..container import DatasetsContainer
 from ..dataset_service import DatasetService
 from ..dataset_spec import DatasetSpec
+from ..ingestion_jobs import IngestionJobRunner
 
 
 api_router = fastapi.APIRouter()
@@ -29,3 +30,59 @@ async def list_datasets():
 @api_router.get("/v1/datasets/{dataset_id}")
 async def get_dataset(dataset_id: str):
     return None
+
+
+@api_router.post("/v1/datasets/{dataset_id}/ingest", status_code=202)
+@inject
+async def ingest_dataset(
+    dataset_id: str,
+    dataset_service: DatasetService = Depends(Provide[DatasetsContainer.dataset_service]),
+    job_runner: IngestionJobRunner = Depends(Provide[DatasetsContainer.ingestion_job_runner]),
+):
+    dataset_spec = dataset_service.get_dataset(dataset_id)
+    if dataset_spec is None:
+        raise fastapi.HTTPException(status_code=404, detail=f"Dataset '{dataset_id}' not found")
+    if not job_runner.enabled:
+        raise fastapi.HTTPException(status_code=503, detail="Ingestion is not configured")
+    if not dataset_spec.uri:
+        raise fastapi.HTTPException(status_code=400, detail=f"Dataset '{dataset_id}' has no uri")
+    active = job_runner.get_active_job(dataset_id)
+    if active is not None:
+        raise fastapi.HTTPException(
+            status_code=409, detail=f"Dataset '{dataset_id}' already has job '{active.job_id}' {active.status}"
+        )
+    job = job_runner.submit(dataset_spec)
+    logging.info(f"Queued ingestion job '{job.job_id}' for dataset '{dataset_id}'")
+    return {"job_id": job.job_id}
+
+
+@api_router.get("/v1/datasets/{dataset_id}/jobs")
+@inject
+async def list_ingestion_jobs(
+    dataset_id: str,
+    job_runner: IngestionJobRunner = Depends(Provide[DatasetsContainer.ingestion_job_runner]),
+):
+    return [job.to_dict() for job in job_runner.list_jobs(dataset_id)]
+
+
+@api_router.get("/v1/jobs/{job_id}")
+@inject
+async def get_ingestion_job(
+    job_id: str,
+    job_runner: IngestionJobRunner = Depends(Provide[DatasetsContainer.ingestion_job_runner]),
+):
+    job = job_runner.get_job(job_id)
+    if job is None:
+        raise fastapi.HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job.to_dict()
+
+
+@api_router.delete("/v1/jobs/{job_id}", status_code=202)
+@inject
+async def cancel_ingestion_job(
+    job_id: str,
+    job_runner: IngestionJobRunner = Depends(Provide[DatasetsContainer.ingestion_job_runner]),
+):
+    if job_runner.get_job(job_id) is None:
+        raise fastapi.HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return {"cancelled": job_runner.cancel(job_id)}
@@ -0,0 +1,161 @@
+import inspect
+import threading
+import uuid
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+import fsspec
+from fsspec.asyn import AsyncFileSystem
+
+from orthant.datasets import DatasetCrawler, DatasetSpec
+from orthant.datasets.crawler import has_paged_listing
+
+
+def _tree(root: Path, paths: list[str]) -> None:
+    for path in paths:
+        p = root / path
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(path, encoding="utf-8")
+
+
+def _relative(uris, root: Path) -> set[str]:
+    prefix = root.resolve().as_uri() + "/"
+    return {uri[len(prefix):] for uri in uris}
+
+
+class PagedFileSystem(AsyncFileSystem):
+    """Object store whose listing comes in pages, like s3fs; files are "bucket/key" paths"""
+    protocol = "paged"
+    files: list[str] = []
+    listed = 0
+
+    def split_path(self, path):
+        bucket, _, key = self._strip_protocol(path).partition("/")
+        return bucket, key, None
+
+    async def _info(self, path, **kwargs):
+        raise FileNotFoundError(path)
+
+    async def _iterdir(self, bucket, prefix=""):
+        directories = set()
+        for path in self.files:
+            key = path[len(bucket) + 1:]
+            if not path.startswith(f"{bucket}/") or not key.startswith(prefix):
+                continue
+            PagedFileSystem.listed += 1
+            name, sep, _ = key[len(prefix):].partition("/")
+            if not sep:
+                yield {"name": path, "type": "file"}
+            elif name not in directories:
+                directories.add(name)
+                yield {"name": f"{bucket}/{prefix}{name}", "type": "directory"}
+
+
+fsspec.register_implementation("paged", PagedFileSystem, clobber=True)
+
+
+FILES = ["top.txt", "top.md", "a/one.txt", "a/deep/two.txt", "b/three.txt", "b/skip.md", "c/d/e/four.txt"]
+
+
+@pytest.mark.unit
+class TestDatasetCrawler:
+
+    def test_lists_all_files(self, tmp_path: Path):
+        _tree(tmp_path, FILES)
+        assert _relative(DatasetCrawler(str(tmp_path)).iter_uris(), tmp_path) == set(FILES)
+
+    def test_recursive_glob(self, tmp_path: Path):
+        _tree(tmp_path, FILES)
+        uris = DatasetCrawler(str(tmp_path), glob="**/*.txt").iter_uris()
+        assert _relative(uris, tmp_path) == {"top.txt", "a/one.txt", "a/deep/two.txt", "b/three.txt", "c/d/e/four.txt"}
+
+    def test_top_level_glob(self, tmp_path: Path):
+        _tree(tmp_path, FILES)
+        assert _relative(DatasetCrawler(str(tmp_path), glob="*.txt").iter_uris(), tmp_path) == {"top.txt"}
+
+    def test_prefix_glob(self, tmp_path: Path):
+        _tree(tmp_path, FILES)
+        uris = DatasetCrawler(str(tmp_path), glob="a/**/*.txt").iter_uris()
+        assert _relative(uris, tmp_path) == {"a/one.txt", "a/deep/two.txt"}
+
+    def test_pages_respect_page_size(self, tmp_path: Path):
+        _tree(tmp_path, [f"many/{i}.txt" for i in range(25)])
+        pages = list(DatasetCrawler(str(tmp_path), page_size=10).iter_pages())
+        assert sorted(len(page) for page in pages) == [5, 10, 10]
+
+    def test_memory_filesystem(self):
+        root = f"memory://crawl-{uuid.uuid4().hex}"
+        for path in ["x/1.txt", "y/2.txt", "3.txt"]:
+            with fsspec.open(f"{root}/{path}", "w") as f:
+                f.write(path)
+        uris = sorted(DatasetCrawler(root, glob="**/*.txt").iter_uris())
+        assert len(uris) == 3
+        assert all(uri.startswith("memory://") for uri in uris)
+
+    def test_paged_listing(self):
+        PagedFileSystem.files = [f"bucket/data/{path}" for path in FILES] + ["bucket/other.txt"]
+        uris = DatasetCrawler("paged://bucket/data", glob="**/*.txt", page_size=2).iter_uris()
+        prefix = "paged://bucket/data/"
+        assert {uri[len(prefix):] for uri in uris} == {
+            "top.txt", "a/one.txt", "a/deep/two.txt", "b/three.txt", "c/d/e/four.txt"
+        }
+
+    def test_paged_listing_emits_pages_while_listing(self):
+        PagedFileSystem.files = [f"bucket/{i}.txt" for i in range(100)]
+        PagedFileSystem.listed = 0
+        pages = DatasetCrawler("paged://bucket", page_size=10, max_pending_pages=1).iter_pages()
+        assert len(next(pages)) == 10
+        assert PagedFileSystem.listed < 100
+        assert sum(len(page) for page in pages) == 90
+
+    def test_listing_without_pages(self):
+        root = f"memory://crawl-{uuid.uuid4().hex}"
+        for i in range(5):
+            with fsspec.open(f"{root}/{i}.txt", "w") as f:
+                f.write(str(i))
+        crawler = DatasetCrawler(root, page_size=2)
+        assert not has_paged_listing(crawler._fs)
+        assert sorted(len(page) for page in crawler.iter_pages()) == [1, 2, 2]
+
+    def test_s3fs_has_paged_listing(self):
+        s3fs = pytest.importorskip("s3fs")
+        fs = s3fs.S3FileSystem(anon=True, skip_instance_cache=True)
+        assert has_paged_listing(fs)
+        assert inspect.isasyncgenfunction(s3fs.S3FileSystem._iterdir)
+        assert {"bucket", "prefix"} <= set(inspect.signature(s3fs.S3FileSystem._iterdir).parameters)
+
+    def test_single_file_uri(self, tmp_path: Path):
+        _tree(tmp_path, ["only.txt"])
+        assert list(DatasetCrawler(str(tmp_path / "only.txt")).iter_uris()) == [(tmp_path / "only.txt").resolve().as_uri()]
+
+    def test_for_dataset(self, tmp_path: Path):
+        _tree(tmp_path, FILES)
+        spec = DatasetSpec(dataset_id="docs", storage_format="lance", query_format="text", uri=str(tmp_path), glob="b/*.md")
+        assert _relative(DatasetCrawler.for_dataset(spec).iter_uris(), tmp_path) == {"b/skip.md"}
+
+    def test_for_dataset_requires_uri(self):
+        with pytest.raises(ValueError):
+            DatasetCrawler.for_dataset(DatasetSpec(dataset_id="docs", storage_format="lance", query_format="text"))
+
+    def test_missing_root_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            list(DatasetCrawler(str(tmp_path / "missing")).iter_uris())
+
+    def test_closing_early_stops_listing(self, tmp_path: Path):
+        _tree(tmp_path, [f"d{i}/{j}.txt" for i in range(20) for j in range(20)])
+        uris = DatasetCrawler(str(tmp_path), max_workers=2, page_size=1, max_pending_pages=1).iter_uris()
+        next(uris)
+        uris.close()
+        threads = [t for t in threading.enumerate() if t.name.startswith("dataset-crawler")]
+        for thread in threads:
+            thread.join(timeout=5)
+        assert not any(thread.is_alive() for thread in threads)
+
+    def test_ingest_feeds_pipeline(self, tmp_path: Path):
+        _tree(tmp_path, FILES)
+        pipeline = Mock()
+        pipeline.iter_ingest.side_effect = lambda uris, include_chunks: (uri for uri in uris)
+        results = list(DatasetCrawler(str(tmp_path), glob="**/*.md").ingest(pipeline))
+        assert _relative(results, tmp_path) == {"top.md", "b/skip.md"}
+        assert pipeline.iter_ingest.call_args.kwargs["include_chunks"] is False
@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+import pytest
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from orthant.core.ingestion import IngestionResult
+from orthant.datasets import DatasetsContainer, DatasetSpec, IngestionJobRunner
+from orthant.datasets.rest import datasets_router
+import orthant.datasets.rest.rest_api as rest_api
+
+
+class _FakePipeline:
+    """Pipeline storing two chunks per file, failing for files named 'bad'"""
+
+    def __init__(self, delay: float = 0.0, gate: threading.Event | None = None):
+        self.delay = delay
+        self.gate = gate
+        self.ingested = []
+        self.closed = False
+
+    def iter_ingest_resumable(self, uris, manifest, include_chunks=False, skip_failed=False, on_failure=None):
+        try:
+            for uri in manifest.claim(list(uris)):
+                if self.gate is not None:
+                    self.gate.wait(5)
+                time.sleep(self.delay)
+                if "bad" in uri:
+                    manifest.mark_failed(uri, "ValueError: unreadable")
+                    on_failure(uri, ValueError("unreadable"))
+                    continue
+                self.ingested.append(uri)
+                manifest.mark_done(uri, None, 2)
+                yield IngestionResult(uri, 2)
+        finally:
+            manifest.checkpoint()
+
+    def close(self):
+        self.closed = True
+
+
+def _dataset(tmp_path: Path, names: list[str], dataset_id: str = "docs") -> DatasetSpec:
+    root = tmp_path / dataset_id
+    root.mkdir()
+    for name in names:
+        (root / name).write_text(name, encoding="utf-8")
+    return DatasetSpec(dataset_id=dataset_id, storage_format="lance", query_format="text", uri=str(root))
+
+
+@pytest.mark.unit
+class TestIngestionJobRunner:
+
+    @pytest.mark.asyncio
+    async def test_job_reports_progress_and_errors(self, tmp_path: Path):
+        pipeline = _FakePipeline()
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: pipeline)
+        job = runner.submit(_dataset(tmp_path, ["a.txt", "b.txt", "bad.txt"]))
+        assert job.status == "queued"
+        await runner.wait()
+        assert job.status == "completed"
+        assert (job.files_done, job.files_failed, job.chunks_done) == (2, 1, 4)
+        assert "unreadable" in job.errors[0]
+        assert job.to_dict()["files_per_second"] > 0
+        assert pipeline.closed
+
+    @pytest.mark.asyncio
+    async def test_job_fails_when_every_file_fails(self, tmp_path: Path):
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: _FakePipeline())
+        job = runner.submit(_dataset(tmp_path, ["bad1.txt", "bad2.txt"]))
+        await runner.wait()
+        assert (job.status, job.files_done, job.files_failed) == ("failed", 0, 2)
+        assert job.error == "All 2 files failed"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, tmp_path: Path):
+        gate = threading.Event()
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: _FakePipeline(gate=gate), max_concurrent_jobs=1)
+        first = runner.submit(_dataset(tmp_path, ["a.txt"], "one"))
+        second = runner.submit(_dataset(tmp_path, ["a.txt"], "two"))
+        await asyncio.sleep(0.1)
+        assert (first.status, second.status) == ("running", "queued")
+        gate.set()
+        await runner.wait()
+        assert (first.status, second.status) == ("completed", "completed")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, tmp_path: Path):
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: _FakePipeline(delay=0.05))
+        runner.submit(_dataset(tmp_path, [f"{i}.txt" for i in range(6)]))
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        assert time.perf_counter() - start < 0.05
+        await runner.wait()
+
+    @pytest.mark.asyncio
+    async def test_cancel(self, tmp_path: Path):
+        gate = threading.Event()
+        pipeline = _FakePipeline(gate=gate)
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: pipeline, max_concurrent_jobs=1)
+        running = runner.submit(_dataset(tmp_path, [f"{i}.txt" for i in range(5)], "one"))
+        queued = runner.submit(_dataset(tmp_path, ["a.txt"], "two"))
+        await asyncio.sleep(0.1)
+        assert runner.cancel(running.job_id)
+        assert runner.cancel(queued.job_id)
+        gate.set()
+        await runner.wait()
+        assert (running.status, queued.status) == ("cancelled", "cancelled")
+        assert len(pipeline.ingested) < 5
+        assert not runner.cancel(running.job_id)
+
+    @pytest.mark.asyncio
+    async def test_failed_listing_fails_job(self, tmp_path: Path):
+        pipeline = _FakePipeline()
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: pipeline)
+        spec = DatasetSpec(dataset_id="x", storage_format="lance", query_format="text", uri=str(tmp_path / "missing"))
+        job = runner.submit(spec)
+        await runner.wait()
+        assert job.status == "failed"
+        assert "FileNotFoundError" in job.error
+        assert pipeline.closed
+
+    @pytest.mark.asyncio
+    async def test_job_resumes_from_manifest(self, tmp_path: Path):
+        pipeline = _FakePipeline()
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: pipeline, storage_dir=str(tmp_path / "storage"))
+        spec = _dataset(tmp_path, ["a.txt", "b.txt", "bad.txt"])
+        first = runner.submit(spec)
+        await runner.wait()
+        (tmp_path / "docs" / "c.txt").write_text("c", encoding="utf-8")
+        second = runner.submit(spec)
+        await runner.wait()
+        assert (first.files_done, second.files_done, second.files_failed) == (2, 1, 1)
+        assert sorted(Path(uri).name for uri in pipeline.ingested) == ["a.txt", "b.txt", "c.txt"]
+        assert (tmp_path / "storage" / "docs" / "ingestion_manifest.sqlite").exists()
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_are_bounded(self, tmp_path: Path):
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: _FakePipeline(), max_finished_jobs=2)
+        spec = _dataset(tmp_path, ["a.txt"])
+        jobs = []
+        for _ in range(4):
+            jobs.append(runner.submit(spec))
+            await runner.wait()
+        assert [job.job_id for job in runner.list_jobs()] == [job.job_id for job in jobs[2:]]
+        assert runner.get_job(jobs[0].job_id) is None
+
+    @pytest.mark.asyncio
+    async def test_one_active_job_per_dataset(self, tmp_path: Path):
+        gate = threading.Event()
+        runner = IngestionJobRunner(pipeline_factory=lambda spec: _FakePipeline(gate=gate), max_concurrent_jobs=1)
+        spec = _dataset(tmp_path, ["a.txt"])
+        first = runner.submit(spec)
+        other = runner.submit(_dataset(tmp_path, ["a.txt"], "other"))
+        with pytest.raises(RuntimeError, match=first.job_id):
+            runner.submit(spec)
+        await asyncio.sleep(0.1)
+        with pytest.raises(RuntimeError, match="running"):
+            runner.submit(spec)
+        assert runner.get_active_job("docs") is first
+        gate.set()
+        await runner.wait()
+        assert (first.status, other.status) == ("completed", "completed")
+        assert runner.get_active_job("docs") is None
+        second = runner.submit(spec)
+        await runner.wait()
+        assert second.status == "completed"
+        assert [job.job_id for job in runner.list_jobs("docs")] == [first.job_id, second.job_id]
+
+    def test_submit_requires_pipeline_factory(self, tmp_path: Path):
+        with pytest.raises(RuntimeError):
+            IngestionJobRunner().submit(_dataset(tmp_path, ["a.txt"]))
+
+
+@pytest.fixture
+def client():
+    container = DatasetsContainer()
+    container.wire(modules=[rest_api])
+    app = FastAPI()
+    app.include_router(datasets_router, prefix="/api")
+    with TestClient(app) as client:
+        client.container = container
+        yield client
+    container.unwire()
+
+
+@pytest.mark.unit
+class TestIngestionJobsApi:
+
+    def test_ingest_and_poll_job(self, tmp_path: Path, client):
+        pipeline = _FakePipeline()
+        client.container.pipeline_factory.override(lambda spec: pipeline)
+        spec = _dataset(tmp_path, ["a.txt", "b.txt"])
+        client.container.dataset_service().add_dataset(spec)
+
+        response = client.post("/api/v1/datasets/docs/ingest")
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        for _ in range(100):
+            job = client.get(f"/api/v1/jobs/{job_id}").json()
+            if job["status"] == "completed":
+                break
+            time.sleep(0.02)
+        assert job["status"] == "completed"
+        assert (job["files_done"], job["chunks_done"]) == (2, 4)
+        assert [j["job_id"] for j in client.get("/api/v1/datasets/docs/jobs").json()] == [job_id]
+
+    def test_second_job_for_dataset_conflicts(self, tmp_path: Path, client):
+        gate = threading.Event()
+        client.container.pipeline_factory.override(lambda spec: _FakePipeline(gate=gate))
+        client.container.dataset_service().add_dataset(_dataset(tmp_path, ["a.txt"]))
+        job_id = client.post("/api/v1/datasets/docs/ingest").json()["job_id"]
+        response = client.post("/api/v1/datasets/docs/ingest")
+        gate.set()
+        assert response.status_code == 409
+        assert job_id in response.json()["detail"]
+
+    def test_unknown_dataset(self, client):
+        client.container.pipeline_factory.override(lambda spec: _FakePipeline())
+        assert client.post("/api/v1/datasets/missing/ingest").status_code == 404
+
+    def test_ingestion_not_configured(self, tmp_path: Path, client):
+        client.container.dataset_service().add_dataset(_dataset(tmp_path, ["a.txt"]))
+        assert client.post("/api/v1/datasets/docs/ingest").status_code == 503
+
+    def test_unknown_job(self, client):
+        assert client.get("/api/v1/jobs/missing").status_code == 404
+        assert client.delete("/api/v1/jobs/missing").status_code == 404
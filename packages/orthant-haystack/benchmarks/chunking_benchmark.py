@@ -0,0 +1,104 @@
+"""
+Compares the chunking throughput of `RegexChunkingStrategy` with `HaystackChunkingStrategy` on the same corpus.
+
+Usage:
+    python benchmarks/chunking_benchmark.py [--documents 200] [--sentences 400] [--split-by sentence|word]
+        [--workers 4] [--node-size 0]
+
+With `--workers`, Haystack also runs on a process pool, once per document and once over the whole corpus with
+`chunk_documents`. The pool shares nodes between workers and never cuts one, so documents made of a single node
+(the default, like files read by `TextDocumentReader` without a `block_size`) are split in the calling process
+when chunked one at a time; `--node-size` cuts each document into nodes of about that many characters.
+
+Sentence splitting with Haystack needs the nltk `punkt_tab` data; `--split-by word` runs without it.
+"""
+import argparse
+import random
+import time
+
+from haystack.components.preprocessors import DocumentPreprocessor
+
+from orthant.core.chunking import ChunkingStrategy, RegexChunkingStrategy
+from orthant.core.documents import OrthantDocument, OrthantDocumentNode
+from orthant.core.ingestion.pipeline import batch_chunk
+from orthant.haystack import HaystackChunkingStrategy
+
+
+WORDS = (
+    "orthant ingests documents builds embeddings for search chunking preserves meaning overlap reduces "
+    "boundary loss the pipeline cleans and splits text vectors are stored in lance tables queries return "
+    "the nearest chunks"
+).split()
+
+
+def make_corpus(n_documents: int, n_sentences: int, node_size: int = 0, seed: int = 0) -> list[OrthantDocument]:
+    """Random documents; with a `node_size`, paragraphs are grouped into nodes of about that many characters."""
+    rng = random.Random(seed)
+    documents = []
+    for i in range(n_documents):
+        sentences = [
+            " ".join(rng.choices(WORDS, k=rng.randint(6, 24))).capitalize() + rng.choice(".!?")
+            for _ in range(n_sentences)
+        ]
+        paragraphs = [" ".join(sentences[j:j + 8]) for j in range(0, n_sentences, 8)]
+        contents = [""]
+        for paragraph in paragraphs:
+            if node_size and contents[-1] and len(contents[-1]) >= node_size:
+                contents.append("")
+            contents[-1] = f"{contents[-1]}\n\n{paragraph}" if contents[-1] else paragraph
+        documents.append(OrthantDocument(
+            document_id=f"doc-{i}",
+            source_uri=f"bench://doc-{i}.txt",
+            nodes=[OrthantDocumentNode(node_path=str(n + 1), content=content) for n, content in enumerate(contents)],
+        ))
+    return documents
+
+
+def bench(
+    name: str, chunker: ChunkingStrategy, corpus: list[OrthantDocument], repeat: int, batched: bool = False
+) -> None:
+    best = float("inf")
+    n_chunks = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if batched:
+            n_chunks = sum(len(chunks) for chunks in batch_chunk(chunker, corpus))
+        else:
+            n_chunks = sum(len(chunker.chunk_document(document)) for document in corpus)
+        best = min(best, time.perf_counter() - start)
+    n_chars = sum(len(node.content) for document in corpus for node in document.nodes)
+    print(f"{name:<16} {best:8.3f}s  {n_chars / best / 1e6:8.2f} MB/s  {n_chunks:>8} chunks")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--sentences", type=int, default=400, help="sentences per document")
+    parser.add_argument("--split-by", choices=["sentence", "word"], default="sentence")
+    parser.add_argument("--length", type=int, default=6, help="units per chunk")
+    parser.add_argument("--overlap", type=int, default=2, help="units shared by consecutive chunks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=0, help="worker processes for Haystack; 0 skips the pool")
+    parser.add_argument("--node-size", type=int, default=0, help="characters per node; 0 keeps one node per document")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.documents, args.sentences, args.node_size)
+    if args.split_by == "sentence":
+        regex = RegexChunkingStrategy.sentence_splitter(n_sentences=args.length, overlap=args.overlap)
+        preprocessor = DocumentPreprocessor(split_by="sentence", split_length=args.length, split_overlap=args.overlap)
+    else:
+        regex = RegexChunkingStrategy.word_splitter(n_words=args.length, overlap=args.overlap)
+        preprocessor = DocumentPreprocessor(split_by="word", split_length=args.length, split_overlap=args.overlap)
+
+    bench("regex", regex, corpus, args.repeat)
+    bench("haystack", HaystackChunkingStrategy(preprocessor), corpus, args.repeat)
+    if args.workers:
+        with HaystackChunkingStrategy(preprocessor, max_workers=args.workers) as pooled:
+            # Warm the workers up, so starting them is not timed
+            pooled.chunk_documents(corpus[:args.workers])
+            bench(f"pool x{args.workers}", pooled, corpus, args.repeat)
+            bench(f"pool x{args.workers} corpus", pooled, corpus, args.repeat, batched=True)
+
+
+if __name__ == "__main__":
+    main()
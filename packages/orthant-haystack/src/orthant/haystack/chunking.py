@@ -1,3 +1,6 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 from haystack import Document
 from haystack.components.preprocessors import DocumentPreprocessor
 
@@ -5,34 +8,119 @@ from orthant.core import ChunkingStrategy
 from orthant.core.documents import OrthantDocument, OrthantDocumentNodeChunk
 
 class HaystackChunkingStrategy(ChunkingStrategy):
-    def __init__(self, document_preprocessor: DocumentPreprocessor):
+    def __init__(
+        self,
+        document_preprocessor: DocumentPreprocessor,
+        max_workers: int | None = None,
+    ):
+        """
+        Args:
+            document_preprocessor: Haystack preprocessor used to split node contents
+            max_workers: Split nodes on a pool of this many worker processes; None splits in the calling thread.
+                Nodes are never cut between workers, so the chunks are the same either way. A lone node is
+                therefore split in the calling thread: a large file only uses the pool when it is read in
+                several nodes, e.g. with `TextDocumentReader(block_size=...)`, or chunked together with other
+                documents through `chunk_documents`
+        """
         self._document_preprocessor = document_preprocessor
+        self._max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
 
     def chunk_document(self, document: OrthantDocument) -> list[OrthantDocumentNodeChunk]:
-        all_chunks = []
-        for node in document.nodes:
-            # Convert OrthantDocumentNode to Haystack Document
-            haystack_document = Document(content=node.content)
-            # Process through Haystack preprocessor
-            split_result = self._document_preprocessor.run(documents=[haystack_document])
-            split_docs = split_result["documents"]
-            # Convert split documents back to OrthantDocumentNodeChunk
-            for idx, split_doc in enumerate(split_docs):
+        return self.chunk_documents([document])[0]
+
+    def chunk_documents(self, documents: list[OrthantDocument]) -> list[list[OrthantDocumentNodeChunk]]:
+        # Split every node of every document together, then hand the splits back out by node
+        nodes = [(i, node) for i, document in enumerate(documents) for node in document.nodes]
+        node_splits = self._split_texts([node.content for _, node in nodes])
+        chunks_by_document: list[list[OrthantDocumentNodeChunk]] = [[] for _ in documents]
+        for (i, node), splits in zip(nodes, node_splits):
+            # Convert split contents back to OrthantDocumentNodeChunk
+            for idx, content in enumerate(splits):
                 chunk = OrthantDocumentNodeChunk(
-                    document_id=document.document_id,
+                    document_id=documents[i].document_id,
                     node_path=node.node_path,
                     node_chunk_index=idx,
-                    content=split_doc.content
+                    content=content
                 )
-                all_chunks.append(chunk)
-        return all_chunks
+                chunks_by_document[i].append(chunk)
+        return chunks_by_document
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self):
+        # Worker pools cannot be pickled; a copy starts its own pool on first use
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def _split_texts(self, texts: list[str]) -> list[list[str]]:
+        """Split each text, returning the split contents in input order."""
+        if self._max_workers is None or len(texts) <= 1:
+            # A single text cannot be shared between workers without changing its split boundaries
+            return _split_text_batch(self._document_preprocessor, texts)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._document_preprocessor,),
+            )
+        # A few contiguous batches per worker keeps the workers balanced and the result order stable
+        batch_size = -(-len(texts) // (self._max_workers * 4))
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        return [splits for batch_splits in self._pool.map(_split_batch_in_worker, batches) for splits in batch_splits]
 
     @staticmethod
-    def sentence_splitter(n_sentences: int = 6, overlap: int = 2, **kwargs):
+    def sentence_splitter(
+        n_sentences: int = 6,
+        overlap: int = 2,
+        max_workers: int | None = None,
+        **kwargs,
+    ):
         processor = DocumentPreprocessor(
             split_by="sentence",
             split_length=n_sentences,
             split_overlap=overlap,
             **kwargs
         )
-        return HaystackChunkingStrategy(processor)
+        return HaystackChunkingStrategy(processor, max_workers=max_workers)
+
+
+def _split_text_batch(document_preprocessor: DocumentPreprocessor, texts: list[str]) -> list[list[str]]:
+    """Split many texts with a single preprocessor run."""
+    if not texts:
+        return []
+    # Tag each text with its position; splits inherit the meta, identical texts stay distinct
+    haystack_documents = [Document(content=text, meta={_TEXT_INDEX: i}) for i, text in enumerate(texts)]
+    # Process through Haystack preprocessor
+    split_result = document_preprocessor.run(documents=haystack_documents)
+    splits: list[list[str]] = [[] for _ in texts]
+    for split_doc in split_result["documents"]:
+        splits[split_doc.meta[_TEXT_INDEX]].append(split_doc.content)
+    return splits
+
+
+_TEXT_INDEX = "orthant_text_index"
+_worker_preprocessor: DocumentPreprocessor | None = None
+
+
+def _init_worker(document_preprocessor: DocumentPreprocessor) -> None:
+    """Process-pool initializer: load the preprocessor and its tokenizer models once per worker."""
+    global _worker_preprocessor
+    document_preprocessor.warm_up()
+    _worker_preprocessor = document_preprocessor
+
+
+def _split_batch_in_worker(texts: list[str]) -> list[list[str]]:
+    return _split_text_batch(_worker_preprocessor, texts)
@@ -1,4 +1,6 @@
+import pickle
 import pytest
+from haystack.components.preprocessors import DocumentPreprocessor
 from orthant.haystack import HaystackChunkingStrategy
 from orthant.core.documents import OrthantDocument, OrthantDocumentNode
 
@@ -194,3 +196,118 @@ Everything is version controlled in Git."""
             assert chunk.document_id == "doc-with-metadata"
             assert chunk.node_path == "chapter/section/paragraph"
             assert chunk.node_chunk_index == i
+
+
+def _word_document(n_nodes: int) -> OrthantDocument:
+    return OrthantDocument(
+        document_id="test-doc-words",
+        source_uri="test://words.txt",
+        nodes=[
+            OrthantDocumentNode(
+                node_path=f"section{i}",
+                content=" ".join(f"word{i}_{j}" for j in range(i + 3)),
+            )
+            for i in range(n_nodes)
+        ]
+    )
+
+
+@pytest.mark.unit
+class TestProcessPoolChunking:
+    def test_process_pool_matches_inline_chunking(self):
+        preprocessor = DocumentPreprocessor(split_by="word", split_length=2, split_overlap=0)
+        document = _word_document(n_nodes=8)
+
+        inline_chunks = HaystackChunkingStrategy(preprocessor).chunk_document(document)
+        with HaystackChunkingStrategy(preprocessor, max_workers=2) as subject:
+            pooled_chunks = subject.chunk_document(document)
+
+        assert pooled_chunks == inline_chunks
+        assert [c.node_path for c in pooled_chunks][:2] == ["section0", "section0"]
+
+    def test_pool_is_reused_and_closed(self):
+        preprocessor = DocumentPreprocessor(split_by="word", split_length=2, split_overlap=0)
+        subject = HaystackChunkingStrategy(preprocessor, max_workers=2)
+
+        subject.chunk_document(_word_document(n_nodes=3))
+        pool = subject._pool
+        subject.chunk_document(_word_document(n_nodes=3))
+
+        assert pool is not None and subject._pool is pool
+        subject.close()
+        assert subject._pool is None
+
+    def test_strategy_with_pool_is_picklable(self):
+        preprocessor = DocumentPreprocessor(split_by="word", split_length=2, split_overlap=0)
+        with HaystackChunkingStrategy(preprocessor, max_workers=2) as subject:
+            subject.chunk_document(_word_document(n_nodes=3))
+            copy = pickle.loads(pickle.dumps(subject))
+
+        assert copy._pool is None
+        assert copy.chunk_document(_word_document(n_nodes=2)) == subject.chunk_document(_word_document(n_nodes=2))
+        copy.close()
+
+    def test_pool_matches_inline_for_multi_paragraph_node(self):
+        preprocessor = DocumentPreprocessor(split_by="word", split_length=3, split_overlap=1)
+        text = "\n\n".join(" ".join(f"p{p}w{w}" for w in range(10)) for p in range(6))
+        document = OrthantDocument(
+            document_id="big",
+            source_uri="test://big.txt",
+            nodes=[
+                OrthantDocumentNode(node_path="1", content=text),
+                OrthantDocumentNode(node_path="2", content=text.upper()),
+            ],
+        )
+
+        with HaystackChunkingStrategy(preprocessor, max_workers=2) as subject:
+            pooled_chunks = subject.chunk_document(document)
+
+        assert pooled_chunks == HaystackChunkingStrategy(preprocessor).chunk_document(document)
+
+
+@pytest.mark.unit
+class TestBatchChunking:
+    def test_chunk_documents_matches_per_document_chunking(self):
+        subject = HaystackChunkingStrategy(DocumentPreprocessor(split_by="word", split_length=2, split_overlap=0))
+        documents = [_word_document(n_nodes=n) for n in (3, 0, 2)]
+        documents[2] = documents[2].model_copy(update={"document_id": "other"})
+
+        batched = subject.chunk_documents(documents)
+
+        assert batched == [subject.chunk_document(d) for d in documents]
+        assert batched[1] == []
+        assert {c.document_id for c in batched[2]} == {"other"}
+
+    def test_chunk_documents_uses_single_preprocessor_run(self):
+        preprocessor = DocumentPreprocessor(split_by="word", split_length=2, split_overlap=0)
+        run_calls = []
+        original_run = preprocessor.run
+        preprocessor.run = lambda documents: run_calls.append(len(documents)) or original_run(documents=documents)
+        subject = HaystackChunkingStrategy(preprocessor)
+
+        subject.chunk_documents([_word_document(n_nodes=3), _word_document(n_nodes=4)])
+
+        assert run_calls == [7]
+
+    def test_identical_nodes_are_kept_apart(self):
+        subject = HaystackChunkingStrategy(DocumentPreprocessor(split_by="word", split_length=2, split_overlap=0))
+        document = OrthantDocument(
+            document_id="dup",
+            source_uri="test://dup.txt",
+            nodes=[
+                OrthantDocumentNode(node_path="a", content="same words here"),
+                OrthantDocumentNode(node_path="b", content="same words here"),
+            ]
+        )
+
+        chunks = subject.chunk_document(document)
+
+        assert [(c.node_path, c.node_chunk_index) for c in chunks] == [("a", 0), ("a", 1), ("b", 0), ("b", 1)]
+
+    def test_chunk_documents_with_process_pool(self):
+        preprocessor = DocumentPreprocessor(split_by="word", split_length=2, split_overlap=0)
+        documents = [_word_document(n_nodes=n) for n in (5, 1, 6)]
+
+        expected = HaystackChunkingStrategy(preprocessor).chunk_documents(documents)
+        with HaystackChunkingStrategy(preprocessor, max_workers=2) as subject:
+            assert subject.chunk_documents(documents) == expected
@@ -1,2 +1,4 @@
-from .vector_store import LanceVectorStore
+from .vector_store import LanceVectorStore, chunk_filter
 from .documents import make_document_chunk_lance_schema
+from .maintenance import LanceMaintenanceScheduler, MaintenancePolicy, MaintenanceReport
+from .indexing import ScalarIndexPolicy, VectorIndexPolicy, num_partitions_for, num_sub_vectors_for
@@ -7,6 +7,7 @@ def make_document_chunk_lance_schema(n_dims: int) -> type[LanceModel]:
     embedding_type = Vector(n_dims)
     class DocumentChunkLanceSchema(LanceModel):
         source_uri: str
+        document_id: str
         node_path: str
         node_chunk_index: int
         modality: str
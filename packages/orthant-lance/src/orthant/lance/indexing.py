@@ -0,0 +1,92 @@
+import math
+from dataclasses import dataclass, field
+from typing import Literal
+
+from lancedb.index import Bitmap, BTree, HnswPq, HnswSq, IvfPq
+
+
+VectorIndexType = Literal["IVF_PQ", "IVF_HNSW_SQ", "IVF_HNSW_PQ"]
+ScalarIndexType = Literal["BTREE", "BITMAP"]
+# "stale": enough rows are not indexed yet, and the next table optimization (run by maintenance) adds them
+IndexAction = Literal["created", "rebuilt", "updated", "stale"]
+
+# BTREE suits high-cardinality and range-filtered columns, BITMAP columns with few distinct values
+DEFAULT_SCALAR_INDEXES: dict[str, ScalarIndexType] = {
+    "source_uri": "BTREE",
+    "document_id": "BTREE",
+    "node_path": "BTREE",
+    "modality": "BITMAP",
+    "created_at": "BTREE",
+}
+
+VECTOR_INDEX_NAME = "embedding_idx"
+
+# Product quantization trains 2^8 centroids per sub-vector, and IVF wants at least as many rows per partition
+MIN_ROWS_PER_PARTITION = 256
+
+
+@dataclass
+class VectorIndexPolicy:
+    """When to build the ANN index of a Lance table, and how to query it"""
+    index_type: VectorIndexType = "IVF_PQ"
+    distance_type: Literal["l2", "cosine", "dot"] = "l2"
+    min_rows: int = 100_000
+    """Create the index once the table has at least this many rows; smaller tables are scanned"""
+    update_after_rows: int = 10_000
+    """Add new rows to the index once this many are not indexed yet"""
+    rebuild_growth: float = 2.0
+    """Retrain the index once the table has grown by this factor since the index was trained"""
+    nprobes: int | None = None
+    """Default number of IVF partitions searched per query"""
+    refine_factor: int | None = None
+    """Default re-ranking factor: fetch `limit * refine_factor` candidates and re-rank them on full vectors"""
+
+
+@dataclass
+class ScalarIndexPolicy:
+    """Which metadata columns of a Lance table get scalar indexes, to speed up filtered searches"""
+    columns: dict[str, ScalarIndexType] = field(default_factory=lambda: dict(DEFAULT_SCALAR_INDEXES))
+    """Index type of each indexed column"""
+    min_rows: int = 10_000
+    """Create the indexes once the table has at least this many rows"""
+
+
+def num_partitions_for(num_rows: int) -> int:
+    """Number of IVF partitions for a table: about the square root of its row count."""
+    return max(1, min(round(math.sqrt(num_rows)), num_rows // MIN_ROWS_PER_PARTITION))
+
+
+def num_sub_vectors_for(embedding_dim: int) -> int:
+    """Number of PQ sub-vectors: the dimension must divide evenly, ideally into 16-dimension sub-vectors."""
+    for sub_vector_dim in (16, 8, 4, 2):
+        if embedding_dim % sub_vector_dim == 0:
+            return embedding_dim // sub_vector_dim
+    return embedding_dim
+
+
+def make_index_config(policy: VectorIndexPolicy, num_rows: int, embedding_dim: int) -> IvfPq | HnswSq | HnswPq:
+    """Index configuration of a policy, sized for a table of `num_rows` rows."""
+    num_partitions = num_partitions_for(num_rows)
+    if policy.index_type == "IVF_HNSW_SQ":
+        return HnswSq(distance_type=policy.distance_type, num_partitions=num_partitions)
+    num_sub_vectors = num_sub_vectors_for(embedding_dim)
+    if policy.index_type == "IVF_HNSW_PQ":
+        return HnswPq(distance_type=policy.distance_type, num_partitions=num_partitions, num_sub_vectors=num_sub_vectors)
+    return IvfPq(distance_type=policy.distance_type, num_partitions=num_partitions, num_sub_vectors=num_sub_vectors)
+
+
+def vector_index_name(num_rows: int) -> str:
+    """Name of a vector index trained on `num_rows` rows."""
+    return f"{VECTOR_INDEX_NAME}_{num_rows}"
+
+
+def trained_rows(index) -> int:
+    """Number of rows a vector index was trained on, from its name, else the rows it covers."""
+    prefix = f"{VECTOR_INDEX_NAME}_"
+    if index.name.startswith(prefix) and index.name[len(prefix):].isdigit():
+        return int(index.name[len(prefix):])
+    return index.num_indexed_rows
+
+
+def make_scalar_index_config(index_type: ScalarIndexType) -> BTree | Bitmap:
+    return Bitmap() if index_type == "BITMAP" else BTree()
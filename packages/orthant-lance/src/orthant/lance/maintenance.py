@@ -0,0 +1,184 @@
+import asyncio
+import datetime as dt
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import lancedb
+
+if TYPE_CHECKING:
+    from .vector_store import LanceVectorStore
+
+
+@dataclass
+class MaintenancePolicy:
+    """When to compact a Lance table and how long to keep its old versions"""
+    min_fragments: int = 16
+    """Compact once the table has at least this many fragments"""
+    max_versions: int = 100
+    """Prune once the table has at least this many versions"""
+    version_retention: dt.timedelta = dt.timedelta(hours=1)
+    """Versions younger than this are kept, so concurrent readers of them keep working"""
+    idle_time: float = 30.0
+    """Only run once no chunks have been written for this many seconds"""
+    check_interval: float = 60.0
+    """Seconds between checks of the background scheduler"""
+
+
+@dataclass
+class MaintenanceReport:
+    """What a maintenance run reclaimed"""
+    table_name: str
+    started_at: dt.datetime
+    duration: float
+    fragments_before: int
+    fragments_after: int
+    fragments_removed: int
+    fragments_added: int
+    files_removed: int
+    files_added: int
+    versions_removed: int
+    bytes_removed: int
+    index_action: str | None = None
+    """What was done to the ANN index, see `LanceVectorStore.ensure_index`"""
+    scalar_indexes_created: list[str] = field(default_factory=list)
+    """Columns that got a scalar index"""
+
+
+class LanceMaintenanceScheduler:
+    """
+    Keeps the table of a `LanceVectorStore` compact.
+
+    A run creates or retrains the ANN index and creates missing scalar indexes if the store's index policies
+    call for it, compacts small fragments, updates the table's indices to cover new rows, and deletes versions
+    older than the policy's retention. Runs happen on a background thread when the table has accumulated
+    fragments or versions and writes have been idle for a while, so they stay off the ingestion and search path.
+    """
+
+    def __init__(
+        self,
+        store: "LanceVectorStore",
+        policy: MaintenancePolicy | None = None,
+        max_reports: int = 100,
+    ):
+        """
+        Args:
+            store: Vector store whose table is maintained
+            policy: When to run (default: `MaintenancePolicy()`)
+            max_reports: Number of recent reports kept
+        """
+        self._store = store
+        self.policy = policy or MaintenancePolicy()
+        self.reports: deque[MaintenanceReport] = deque(maxlen=max_reports)
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "LanceMaintenanceScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def last_report(self) -> MaintenanceReport | None:
+        return self.reports[-1] if self.reports else None
+
+    def start(self) -> None:
+        """Start checking the table in the background."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="lance-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background checks, waiting for a run in progress to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def is_due(self) -> bool:
+        """Whether the table needs maintenance and writes are idle."""
+        idle = self._store.seconds_since_last_write()
+        if idle is not None and idle < self.policy.idle_time:
+            return False
+        table = self._store.table
+        if table is None:
+            return False
+        fragments = table.stats()["fragment_stats"]["num_fragments"]
+        return (
+            fragments >= self.policy.min_fragments
+            or len(table.list_versions()) >= self.policy.max_versions
+            or self._store.pending_index_action() is not None
+            or bool(self._store.missing_scalar_indexes())
+        )
+
+    def run(self, force: bool = False) -> MaintenanceReport | None:
+        """
+        Maintain the table now, unless it is not due.
+        Runs an event loop of its own, so it cannot be called from a running event loop; use `run_async` there.
+        Args:
+            force: Run even if the policy does not call for it
+        Returns:
+            Report of the run, or None if nothing was run
+        """
+        with self._run_lock:
+            if not force and not self.is_due():
+                return None
+            index_action = self._store.ensure_index()
+            scalar_indexes_created = self._store.ensure_scalar_indexes()
+            report = asyncio.run(self._optimize())
+        if report is not None:
+            # Optimizing the table merged the unindexed rows into the existing index
+            report.index_action = "updated" if index_action == "stale" else index_action
+            report.scalar_indexes_created = scalar_indexes_created
+            self.reports.append(report)
+            logging.info(
+                f"Maintained Lance table '{report.table_name}': {report.fragments_before} -> "
+                f"{report.fragments_after} fragments, {report.versions_removed} versions and "
+                f"{report.bytes_removed} bytes removed in {report.duration:.2f}s"
+            )
+        return report
+
+    async def run_async(self, force: bool = False) -> MaintenanceReport | None:
+        """Asynchronous version of `run`, which runs on a worker thread to keep the event loop free."""
+        return await asyncio.to_thread(self.run, force)
+
+    async def _optimize(self) -> MaintenanceReport | None:
+        # A connection of its own, bound to this run's event loop
+        db = await lancedb.connect_async(self._store.uri)
+        try:
+            table = await db.open_table(self._store.table_name)
+        except ValueError:
+            return None
+        started_at = dt.datetime.now(dt.timezone.utc)
+        start = time.perf_counter()
+        fragments_before = (await table.stats())["fragment_stats"]["num_fragments"]
+        stats = await table.optimize(cleanup_older_than=self.policy.version_retention)
+        fragments_after = (await table.stats())["fragment_stats"]["num_fragments"]
+        return MaintenanceReport(
+            table_name=self._store.table_name,
+            started_at=started_at,
+            duration=time.perf_counter() - start,
+            fragments_before=fragments_before,
+            fragments_after=fragments_after,
+            fragments_removed=stats.compaction.fragments_removed,
+            fragments_added=stats.compaction.fragments_added,
+            files_removed=stats.compaction.files_removed,
+            files_added=stats.compaction.files_added,
+            versions_removed=stats.prune.old_versions_removed,
+            bytes_removed=stats.prune.bytes_removed,
+        )
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.policy.check_interval):
+            try:
+                self.run()
+            except Exception:
+                logging.exception(f"Maintenance of Lance table '{self._store.table_name}' failed")
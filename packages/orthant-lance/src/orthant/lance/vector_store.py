@@ -1,8 +1,26 @@
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+
 import lancedb
 import datetime as dt
+import numpy as np
+import pyarrow as pa
 
 from orthant.core.ingestion import EmbeddedDocumentChunk
 from .documents import make_document_chunk_lance_schema
+from .indexing import (
+    IndexAction,
+    ScalarIndexPolicy,
+    VectorIndexPolicy,
+    make_index_config,
+    make_scalar_index_config,
+    trained_rows,
+    vector_index_name,
+)
+from .maintenance import LanceMaintenanceScheduler, MaintenancePolicy
 
 
 
@@ -12,10 +30,34 @@ class LanceVectorStore:
     Vector store implementation using LanceDB.
 
     This class provides storage and retrieval of embedded document chunks
-    using LanceDB as the backend.
+    using LanceDB as the backend. The async methods use LanceDB's native async
+    API, so concurrent searches and writes do not block the event loop.
+
+    Each write to Lance creates a new fragment and table version. With `target_fragment_rows` set, stored
+    chunks are buffered and written together once the buffer reaches that many rows, `max_buffer_bytes`,
+    or is `flush_interval` seconds old; a background timer enforces the interval even when no more chunks
+    arrive. Buffered chunks are written out before a search or delete, on `flush()` and `close()`, and when
+    the store is used as a context manager and exits.
+
+    Searches scan the whole table until it has an ANN index. With an `index_policy`, `ensure_index()` creates
+    the index once the table is large enough and retrains it as the table grows; background maintenance calls
+    it too, and adds new rows to the index when it optimizes the table.
+    Likewise, `scalar_index_policy` indexes the metadata columns used in `where` filters.
     """
 
-    def __init__(self, uri: str, table_name: str = "documents", embedding_dim: int = 384):
+    def __init__(
+        self,
+        uri: str,
+        table_name: str = "documents",
+        embedding_dim: int = 384,
+        native_async: bool = True,
+        target_fragment_rows: int | None = None,
+        max_buffer_bytes: int = 64 * 1024 * 1024,
+        flush_interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        index_policy: VectorIndexPolicy | None = None,
+        scalar_index_policy: ScalarIndexPolicy | None = None,
+    ):
         """
         Initialize the Lance vector store.
 
@@ -23,22 +65,194 @@ class LanceVectorStore:
             uri: Path to the LanceDB database
             table_name: Name of the table to store documents (default: "documents")
             embedding_dim: Dimension of the embedding vectors (default: 384)
+            native_async: Use LanceDB's async API for the async methods; if False or unavailable,
+                the sync methods run on a worker thread instead (default: True)
+            target_fragment_rows: Buffer stored chunks and write them in fragments of about this many rows;
+                None writes each call right away (default: None)
+            max_buffer_bytes: Write the buffer once it holds this many bytes (default: 64 MiB)
+            flush_interval: Write the buffer once its oldest chunk is this many seconds old (default: None)
+            clock: Monotonic time source, in seconds
+            index_policy: When to build the ANN index and its default query parameters (default: no index)
+            scalar_index_policy: Which metadata columns to index, and when (default: no indexes)
         """
+        if target_fragment_rows is not None and target_fragment_rows < 1:
+            raise ValueError(f"target_fragment_rows must be at least 1, got {target_fragment_rows}")
         self.uri = uri
         self.table_name = table_name
         self.embedding_dim = embedding_dim
-        self._db = lancedb.connect(uri)
+        # Sync and async handles must see each other's writes
+        self._db = lancedb.connect(uri, read_consistency_interval=dt.timedelta(0))
         self._schema = make_document_chunk_lance_schema(embedding_dim)
+        self._arrow_schema = self._schema.to_arrow_schema()
         self._table = None
+        self._native_async = native_async and hasattr(lancedb, "connect_async")
+        # Async connections are bound to the event loop that opened them
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_db: asyncio.Task | None = None
+        self._async_table = None
+        self._async_lock: asyncio.Lock | None = None
+        self._target_fragment_rows = target_fragment_rows
+        self._max_buffer_bytes = max_buffer_bytes
+        self._flush_interval = flush_interval
+        self._clock = clock
+        self._buffer: list[pa.RecordBatch] = []
+        self._buffer_rows = 0
+        self._buffer_bytes = 0
+        self._buffer_since = 0.0
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._last_write: float | None = None
+        self.index_policy = index_policy
+        self.scalar_index_policy = scalar_index_policy
+        self._maintenance: LanceMaintenanceScheduler | None = None
+
+    def __enter__(self) -> "LanceVectorStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "LanceVectorStore":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.flush_async()
+        await asyncio.to_thread(self._stop_background)
+
+    def close(self) -> None:
+        """Write buffered chunks, then stop the flush timer and background maintenance."""
+        self.flush()
+        self._stop_background()
+
+    def _stop_background(self) -> None:
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.stop_maintenance()
+
+    @property
+    def pending_rows(self) -> int:
+        """Number of buffered rows not written yet."""
+        return self._buffer_rows
+
+    @property
+    def table(self):
+        """The Lance table, or None until the first chunks are written."""
+        return self._get_or_create_table()
+
+    def seconds_since_last_write(self) -> float | None:
+        """Seconds since this store last wrote to the table, or None if it has not written yet."""
+        return None if self._last_write is None else self._clock() - self._last_write
+
+    def start_maintenance(self, policy: MaintenancePolicy | None = None) -> LanceMaintenanceScheduler:
+        """
+        Start compacting the table and pruning its old versions in the background.
+
+        Args:
+            policy: When to run maintenance (default: `MaintenancePolicy()`)
+
+        Returns:
+            The running scheduler, whose `reports` tell what each run reclaimed
+        """
+        self.stop_maintenance()
+        self._maintenance = LanceMaintenanceScheduler(self, policy)
+        self._maintenance.start()
+        return self._maintenance
+
+    def stop_maintenance(self) -> None:
+        """Stop background maintenance, if it was started."""
+        if self._maintenance is not None:
+            self._maintenance.stop()
+            self._maintenance = None
+
+    def pending_index_action(self) -> IndexAction | None:
+        """What `ensure_index()` would do now, or None if the index is up to date or not wanted yet."""
+        table = self.table
+        if table is None or self.index_policy is None:
+            return None
+        policy = self.index_policy
+        index = self._vector_index(table)
+        num_rows = table.count_rows()
+        if index is None:
+            return "created" if num_rows >= policy.min_rows else None
+        if num_rows >= trained_rows(index) * policy.rebuild_growth:
+            return "rebuilt"
+        if table.index_stats(index.name).num_unindexed_rows >= policy.update_after_rows:
+            return "updated"
+        return None
+
+    def ensure_index(self) -> IndexAction | None:
+        """
+        Create or retrain the ANN index as the index policy calls for.
+
+        Once the table has grown by `rebuild_growth` since the index was trained, the index is retrained with
+        partitions sized for the new row count. The row count at training is kept in the index name, so it
+        survives restarts. New rows are added to the existing index when the table is optimized, which is
+        left to `LanceMaintenanceScheduler`: it also compacts the table and prunes old versions.
+
+        Returns:
+            What was done, "stale" if new rows are waiting for the next optimization, or None if nothing
+            was needed
+        """
+        action = self.pending_index_action()
+        if action in ("created", "rebuilt"):
+            table = self.table
+            num_rows = table.count_rows()
+            config = make_index_config(self.index_policy, num_rows, self.embedding_dim)
+            name = vector_index_name(num_rows)
+            table.create_index("embedding", config=config, replace=True, name=name)
+            # Searches keep using the previous index until the new one exists
+            for index in table.list_indices():
+                if index.columns == ["embedding"] and index.name != name:
+                    table.drop_index(index.name)
+        elif action == "updated":
+            return "stale"
+        return action
+
+    def missing_scalar_indexes(self) -> list[str]:
+        """Columns of the scalar index policy that are not indexed yet, once the table is large enough."""
+        table = self.table
+        policy = self.scalar_index_policy
+        if table is None or policy is None or table.count_rows() < policy.min_rows:
+            return []
+        indexed = {column for index in table.list_indices() for column in index.columns}
+        return [column for column in policy.columns if column not in indexed]
+
+    def ensure_scalar_indexes(self) -> list[str]:
+        """
+        Create the scalar indexes of the scalar index policy that are missing.
+
+        Indexes cover rows added later once the table is optimized, e.g. by background maintenance.
+
+        Returns:
+            Columns that were indexed
+        """
+        columns = self.missing_scalar_indexes()
+        for column in columns:
+            config = make_scalar_index_config(self.scalar_index_policy.columns[column])
+            self.table.create_index(column, config=config, replace=True)
+        return columns
+
+    @staticmethod
+    def _vector_index(table):
+        indexes = [index for index in table.list_indices() if index.columns == ["embedding"]]
+        return max(indexes, key=trained_rows, default=None)
 
     def _get_or_create_table(self):
         """Get an existing table or create a new one."""
         if self._table is None:
             try:
-                self._table = self._db.open_table(self.table_name)
+                table = self._db.open_table(self.table_name)
             except Exception:
                 # Table doesn't exist, will be created on first add
-                pass
+                return None
+            missing = _missing_columns(table.schema)
+            if missing:
+                table.add_columns(missing)
+            self._table = table
         return self._table
 
     def store_chunks(self, chunks: list["EmbeddedDocumentChunk"]) -> None:
@@ -51,29 +265,120 @@ class LanceVectorStore:
         if not chunks:
             return
 
-        # Convert chunks to Lance schema format
-        lance_records = []
-        for chunk in chunks:
-            record = {
-                "source_uri": chunk.source_uri,
-                "node_path": chunk.node_path,
-                "node_chunk_index": chunk.node_chunk_index,
-                "modality": chunk.modality,
-                "created_at": chunk.created_at or dt.datetime.now(dt.timezone.utc),
-                "content": chunk.content,
-                "embedding": chunk.embedding,
-            }
-            lance_records.append(record)
-
-        # Add records to table, creating it if needed
-        if self._table is None:
-            self._table = self._db.create_table(
-                self.table_name,
-                data=lance_records,
-                mode="overwrite"
-            )
-        else:
-            self._table.add(lance_records)
+        data = self._buffer_or_take(self._to_record_batch(chunks))
+        if data is not None:
+            self._write(data)
+
+    def flush(self) -> None:
+        """Write all buffered chunks to the table."""
+        data = self._take_buffer()
+        if data is not None:
+            self._write(data)
+
+    def flush_expired(self) -> bool:
+        """
+        Write the buffer if its oldest chunk is `flush_interval` seconds old.
+
+        Returns:
+            True if buffered chunks were written
+        """
+        with self._buffer_lock:
+            data = self._take_buffer_locked() if self._seconds_until_expiry_locked() == 0 else None
+        if data is None:
+            return False
+        self._write(data)
+        return True
+
+    def _seconds_until_expiry_locked(self) -> float | None:
+        """Seconds until the buffer is due for writing, or None if it is empty or has no interval."""
+        if self._flush_interval is None or not self._buffer:
+            return None
+        return max(0.0, self._flush_interval - (self._clock() - self._buffer_since))
+
+    def _start_flush_timer(self) -> None:
+        if self._flush_interval is None or (self._flush_thread is not None and self._flush_thread.is_alive()):
+            return
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="lance-flush", daemon=True)
+        self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._buffer_lock:
+                remaining = self._seconds_until_expiry_locked()
+            # An empty buffer starts its interval no earlier than now
+            if self._flush_stop.wait(self._flush_interval if remaining is None else remaining):
+                return
+            try:
+                self.flush_expired()
+            except Exception:
+                logging.exception(f"Timed flush to Lance table '{self.table_name}' failed")
+
+    async def flush_async(self) -> None:
+        """Write all buffered chunks to the table asynchronously."""
+        data = self._take_buffer()
+        if data is not None:
+            await self._write_async(data)
+
+    def _write(self, data: pa.RecordBatch | pa.Table) -> None:
+        # The flush timer writes from its own thread
+        with self._write_lock:
+            self._last_write = self._clock()
+            # Add records to table, creating it if needed
+            if self._get_or_create_table() is None:
+                try:
+                    self._table = self._db.create_table(self.table_name, data=data)
+                    return
+                except ValueError:
+                    # Created meanwhile by an async write
+                    self._table = self._db.open_table(self.table_name)
+            self._table.add(data)
+
+    async def _write_async(self, data: pa.RecordBatch | pa.Table) -> None:
+        if not self._native_async:
+            await asyncio.to_thread(self._write, data)
+            return
+        self._last_write = self._clock()
+        db = await self._connect_async()
+        # Only one task may create the table
+        async with self._async_lock:
+            table = await self._get_async_table()
+            if table is None:
+                try:
+                    self._async_table = await db.create_table(self.table_name, data=data)
+                    return
+                except ValueError:
+                    # Created meanwhile by a sync write
+                    table = self._async_table = await db.open_table(self.table_name)
+        await table.add(data)
+
+    def _buffer_or_take(self, batch: pa.RecordBatch) -> pa.RecordBatch | pa.Table | None:
+        """Add a batch to the buffer. Returns the data to write now, or None while the buffer is not full."""
+        if self._target_fragment_rows is None:
+            return batch
+        self._start_flush_timer()
+        with self._buffer_lock:
+            if not self._buffer:
+                self._buffer_since = self._clock()
+            self._buffer.append(batch)
+            self._buffer_rows += batch.num_rows
+            self._buffer_bytes += batch.nbytes
+            full = self._buffer_rows >= self._target_fragment_rows or self._buffer_bytes >= self._max_buffer_bytes
+            expired = self._flush_interval is not None and self._clock() - self._buffer_since >= self._flush_interval
+            return self._take_buffer_locked() if full or expired else None
+
+    def _take_buffer(self) -> pa.Table | None:
+        with self._buffer_lock:
+            return self._take_buffer_locked()
+
+    def _take_buffer_locked(self) -> pa.Table | None:
+        if not self._buffer:
+            return None
+        data = pa.Table.from_batches(self._buffer)
+        self._buffer = []
+        self._buffer_rows = 0
+        self._buffer_bytes = 0
+        return data
 
     async def store_chunks_async(self, chunks: list["EmbeddedDocumentChunk"]) -> None:
         """
@@ -82,53 +387,282 @@ class LanceVectorStore:
         Args:
             chunks: List of embedded chunks to store
         """
-        # LanceDB doesn't have native async support yet, so we use the sync method
-        self.store_chunks(chunks)
+        if not chunks:
+            return
+        data = self._buffer_or_take(self._to_record_batch(chunks))
+        if data is not None:
+            await self._write_async(data)
+
+    def delete_chunks(self, document_id: str, chunk_keys: list[tuple[str, int]] | None = None) -> None:
+        """
+        Delete stored chunks of a document.
+
+        Args:
+            document_id: Document whose chunks are deleted
+            chunk_keys: (node_path, node_chunk_index) of the chunks to delete, or None to delete them all
+        """
+        self.flush()
+        table = self._get_or_create_table()
+        if table is None or chunk_keys == []:
+            return
+        where = f"document_id = {_sql_string(document_id)}"
+        if chunk_keys is not None:
+            # One condition per node rather than per chunk, so large deletes keep a short filter
+            by_node: dict[str, list[int]] = {}
+            for node_path, idx in chunk_keys:
+                by_node.setdefault(node_path, []).append(int(idx))
+            keys = " OR ".join(
+                f"(node_path = {_sql_string(node_path)} AND node_chunk_index IN ({_sql_list(indexes)}))"
+                for node_path, indexes in by_node.items()
+            )
+            where = f"{where} AND ({keys})"
+        table.delete(where)
 
-    def search(self, query_vector: list[float], limit: int = 10) -> list["EmbeddedDocumentChunk"]:
+    def reindex_chunks(self, document_id: str, moves: dict[tuple[str, int], int]) -> None:
+        """
+        Change the index of stored chunks of a document, keeping their embeddings.
+
+        Args:
+            document_id: Document whose chunks are moved
+            moves: New index of each (node_path, node_chunk_index) key; the moves of a node are applied
+                in one update, so a chunk may move to the index another one is leaving
+        """
+        self.flush()
+        table = self._get_or_create_table()
+        if table is None or not moves:
+            return
+        by_node: dict[str, dict[int, list[int]]] = {}
+        for (node_path, idx), new_idx in moves.items():
+            by_node.setdefault(node_path, {}).setdefault(int(new_idx) - int(idx), []).append(int(idx))
+        for node_path, by_offset in by_node.items():
+            # Lance has no CASE expression: add each move's offset to the rows it selects, in one update
+            offsets = " ".join(
+                f"+ {offset} * CAST(node_chunk_index IN ({_sql_list(indexes)}) AS BIGINT)"
+                for offset, indexes in by_offset.items()
+            )
+            moved = [idx for indexes in by_offset.values() for idx in indexes]
+            table.update(
+                where=(
+                    f"document_id = {_sql_string(document_id)} AND node_path = {_sql_string(node_path)} "
+                    f"AND node_chunk_index IN ({_sql_list(moved)})"
+                ),
+                values_sql={"node_chunk_index": f"node_chunk_index {offsets}"},
+            )
+
+    def search(
+        self,
+        query_vector: list[float],
+        limit: int = 10,
+        nprobes: int | None = None,
+        refine_factor: int | None = None,
+        where: str | None = None,
+        prefilter: bool = True,
+    ) -> list["EmbeddedDocumentChunk"]:
         """
         Search for similar chunks using a query vector.
 
         Args:
             query_vector: Query embedding vector
             limit: Maximum number of results to return
+            nprobes: Number of IVF partitions searched (default: from the index policy, else LanceDB's)
+            refine_factor: Re-rank `limit * refine_factor` candidates on full vectors (default: from the
+                index policy, else no re-ranking)
+            where: SQL filter on the chunk columns, e.g. `chunk_filter(source_uri="s3://bucket/doc.txt")`
+            prefilter: Filter before the vector search (default), or filter its `limit` nearest results,
+                which is cheaper for permissive filters but may return fewer results
 
         Returns:
             List of similar embedded chunks
         """
-        from orthant.core.ingestion import EmbeddedDocumentChunk
-
+        self.flush()
         table = self._get_or_create_table()
+        if table is None:
+            return []
 
         # Perform vector search
-        results = table.search(query_vector).limit(limit).to_list()
-
-        # Convert results back to EmbeddedDocumentChunk
-        chunks = []
-        for result in results:
-            chunk = EmbeddedDocumentChunk(
-                source_uri=result["source_uri"],
-                node_path=result["node_path"],
-                node_chunk_index=result["node_chunk_index"],
-                content=result["content"],
-                embedding=result["embedding"],
-                modality=result.get("modality", "text"),
-                created_at=result.get("created_at"),
-            )
-            chunks.append(chunk)
+        query = self._tune_query(table.search(query_vector), nprobes, refine_factor)
+        if where is not None:
+            query = query.where(where, prefilter=prefilter)
+        results = query.limit(limit).to_list()
 
-        return chunks
+        return [self._to_chunk(result) for result in results]
 
-    async def search_async(self, query_vector: list[float], limit: int = 10) -> list["EmbeddedDocumentChunk"]:
+    async def search_async(
+        self,
+        query_vector: list[float],
+        limit: int = 10,
+        nprobes: int | None = None,
+        refine_factor: int | None = None,
+        where: str | None = None,
+        prefilter: bool = True,
+    ) -> list["EmbeddedDocumentChunk"]:
         """
         Search for similar chunks asynchronously.
 
         Args:
             query_vector: Query embedding vector
             limit: Maximum number of results to return
+            nprobes: Number of IVF partitions searched (default: from the index policy, else LanceDB's)
+            refine_factor: Re-rank `limit * refine_factor` candidates on full vectors (default: from the
+                index policy, else no re-ranking)
+            where: SQL filter on the chunk columns, e.g. `chunk_filter(source_uri="s3://bucket/doc.txt")`
+            prefilter: Filter before the vector search (default), or filter its `limit` nearest results,
+                which is cheaper for permissive filters but may return fewer results
 
         Returns:
             List of similar embedded chunks
         """
-        # LanceDB doesn't have native async support yet, so we use the sync method
-        return self.search(query_vector, limit)
+        if not self._native_async:
+            return await asyncio.to_thread(
+                self.search, query_vector, limit, nprobes, refine_factor, where, prefilter
+            )
+
+        await self.flush_async()
+        table = await self._get_async_table()
+        if table is None:
+            return []
+        query = self._tune_query(table.vector_search(query_vector), nprobes, refine_factor)
+        if where is not None:
+            query = query.where(where) if prefilter else query.where(where).postfilter()
+        results = await query.limit(limit).to_list()
+        return [self._to_chunk(result) for result in results]
+
+    def _tune_query(self, query, nprobes: int | None, refine_factor: int | None):
+        """Apply the ANN parameters of a query, falling back to those of the index policy."""
+        if self.index_policy is not None:
+            nprobes = nprobes if nprobes is not None else self.index_policy.nprobes
+            refine_factor = refine_factor if refine_factor is not None else self.index_policy.refine_factor
+        if nprobes is not None:
+            query = query.nprobes(nprobes)
+        if refine_factor is not None:
+            query = query.refine_factor(refine_factor)
+        return query
+
+    async def _connect_async(self):
+        """Get the async connection of the running event loop, reconnecting if the loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # Concurrent callers share the pending connection
+            self._async_db = loop.create_task(
+                lancedb.connect_async(self.uri, read_consistency_interval=dt.timedelta(0))
+            )
+            self._async_loop = loop
+            self._async_table = None
+            self._async_lock = asyncio.Lock()
+        return await self._async_db
+
+    async def _get_async_table(self):
+        """Get the async table, or None if it does not exist yet."""
+        db = await self._connect_async()
+        if self._async_table is None:
+            try:
+                table = await db.open_table(self.table_name)
+            except Exception:
+                # Table doesn't exist, will be created on first add
+                return None
+            missing = _missing_columns(await table.schema())
+            if missing:
+                await table.add_columns(missing)
+            self._async_table = table
+        return self._async_table
+
+    def _to_record_batch(self, chunks: list["EmbeddedDocumentChunk"]) -> pa.RecordBatch:
+        """
+        Convert chunks to a record batch of the Lance schema, column by column.
+
+        Embeddings are packed into one contiguous float32 buffer, so no per-row Python objects are
+        handed to LanceDB.
+        """
+        embeddings = np.asarray([chunk.embedding for chunk in chunks], dtype=np.float32)
+        if embeddings.shape != (len(chunks), self.embedding_dim):
+            raise ValueError(
+                f"Expected embeddings of dimension {self.embedding_dim}, got shape {embeddings.shape}"
+            )
+        now = dt.datetime.now(dt.timezone.utc)
+        schema = self._arrow_schema
+        columns = [
+            pa.array([chunk.source_uri for chunk in chunks], type=schema.field("source_uri").type),
+            pa.array([chunk.document_id for chunk in chunks], type=schema.field("document_id").type),
+            pa.array([chunk.node_path for chunk in chunks], type=schema.field("node_path").type),
+            pa.array([chunk.node_chunk_index for chunk in chunks], type=schema.field("node_chunk_index").type),
+            pa.array([chunk.modality for chunk in chunks], type=schema.field("modality").type),
+            pa.array([chunk.created_at or now for chunk in chunks], type=schema.field("created_at").type),
+            pa.array([chunk.content for chunk in chunks], type=schema.field("content").type),
+            pa.FixedSizeListArray.from_arrays(pa.array(embeddings.reshape(-1)), self.embedding_dim),
+        ]
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    @staticmethod
+    def _to_chunk(result: dict) -> "EmbeddedDocumentChunk":
+        """Convert a search result back to an EmbeddedDocumentChunk."""
+        return EmbeddedDocumentChunk(
+            source_uri=result["source_uri"],
+            node_path=result["node_path"],
+            node_chunk_index=result["node_chunk_index"],
+            content=result["content"],
+            embedding=result["embedding"],
+            modality=result.get("modality", "text"),
+            created_at=result.get("created_at"),
+            document_id=result.get("document_id"),
+        )
+
+
+def chunk_filter(
+    source_uri: str | list[str] | None = None,
+    modality: str | None = None,
+    created_after: dt.datetime | None = None,
+    created_before: dt.datetime | None = None,
+) -> str | None:
+    """
+    Build a `where` filter on chunk metadata for `LanceVectorStore.search`.
+
+    Args:
+        source_uri: Source, or sources, whose chunks are kept; an empty list keeps none
+        modality: Modality of the chunks kept
+        created_after: Keep chunks created at or after this time
+        created_before: Keep chunks created before this time
+
+    Returns:
+        The filter, or None if no condition was given
+    """
+    conditions = []
+    if isinstance(source_uri, str):
+        conditions.append(f"source_uri = {_sql_string(source_uri)}")
+    elif source_uri:
+        conditions.append(f"source_uri IN ({', '.join(_sql_string(uri) for uri in source_uri)})")
+    elif source_uri is not None:
+        # No sources keeps no chunks; `IN ()` is not a valid filter
+        conditions.append("FALSE")
+    if modality is not None:
+        conditions.append(f"modality = {_sql_string(modality)}")
+    if created_after is not None:
+        conditions.append(f"created_at >= {_sql_timestamp(created_after)}")
+    if created_before is not None:
+        conditions.append(f"created_at < {_sql_timestamp(created_before)}")
+    return " AND ".join(conditions) or None
+
+
+# Columns added to the schema since its first version, and the SQL filling them in for existing rows.
+# Before chunks had a document id, `source_uri` held it
+_ADDED_COLUMNS = {"document_id": "source_uri"}
+
+
+def _missing_columns(schema: pa.Schema) -> dict[str, str]:
+    """Columns a table created by an earlier version lacks, with the SQL computing them."""
+    return {column: sql for column, sql in _ADDED_COLUMNS.items() if column not in schema.names}
+
+
+def _sql_string(value: str) -> str:
+    """Quote a string literal for a Lance filter expression."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _sql_list(values: list[int]) -> str:
+    return ", ".join(str(value) for value in values)
+
+
+def _sql_timestamp(value: dt.datetime) -> str:
+    """Timestamp literal for a Lance filter expression; `created_at` is stored in UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return f"timestamp '{value.isoformat(sep=' ', timespec='microseconds')}'"
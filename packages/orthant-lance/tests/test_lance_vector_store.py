@@ -0,0 +1,525 @@
+import asyncio
+import datetime as dt
+import time
+import lancedb
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from orthant.core.chunking import RegexChunkingStrategy
+from orthant.core.documents import DefaultContentLoader, TextDocumentReader
+from orthant.core.ingestion import DocumentIngestionPipeline, EmbeddedDocumentChunk
+from orthant.lance import (
+    LanceMaintenanceScheduler,
+    LanceVectorStore,
+    MaintenancePolicy,
+    ScalarIndexPolicy,
+    VectorIndexPolicy,
+    chunk_filter,
+    num_partitions_for,
+    num_sub_vectors_for,
+)
+
+
+def _chunk(source_uri: str, index: int, embedding: list[float]) -> EmbeddedDocumentChunk:
+    return EmbeddedDocumentChunk(
+        source_uri=source_uri,
+        node_path="1",
+        node_chunk_index=index,
+        content=f"{source_uri} chunk {index}",
+        embedding=embedding,
+    )
+
+
+@pytest.fixture
+def chunks() -> list[EmbeddedDocumentChunk]:
+    return [
+        _chunk("a.txt", 0, [1.0, 0.0, 0.0]),
+        _chunk("b.txt", 0, [0.0, 1.0, 0.0]),
+        _chunk("c.txt", 0, [0.0, 0.0, 1.0]),
+    ]
+
+
+@pytest.mark.unit
+class TestLanceVectorStore:
+
+    def test_store_and_search(self, tmp_path, chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks(chunks)
+        results = store.search([0.0, 0.9, 0.1], limit=1)
+        assert [r.source_uri for r in results] == ["b.txt"]
+
+    def test_search_without_table(self, tmp_path):
+        assert LanceVectorStore(str(tmp_path), embedding_dim=3).search([1.0, 0.0, 0.0]) == []
+
+    def test_delete_chunks(self, tmp_path, chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks(chunks)
+        store.delete_chunks("a.txt")
+        assert {r.source_uri for r in store.search([1.0, 0.0, 0.0])} == {"b.txt", "c.txt"}
+
+    def test_delete_chunk_keys(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks([_chunk("a.txt", i, [float(i), 0.0, 0.0]) for i in range(500)])
+        store.store_chunks([_chunk("b.txt", i, [float(i), 0.0, 0.0]) for i in range(2)])
+        store.delete_chunks("a.txt", [("1", i) for i in range(1, 500)] + [("2", 0)])
+        remaining = store.search([0.0, 0.0, 0.0], limit=10)
+        assert sorted((r.source_uri, r.node_chunk_index) for r in remaining) == [("a.txt", 0), ("b.txt", 0), ("b.txt", 1)]
+
+    def test_table_without_document_id_is_migrated(self, tmp_path):
+        schema = pa.schema([
+            pa.field(name, type) for name, type in [
+                ("source_uri", pa.string()),
+                ("node_path", pa.string()),
+                ("node_chunk_index", pa.int64()),
+                ("modality", pa.string()),
+                ("created_at", pa.timestamp("us")),
+                ("content", pa.string()),
+                ("embedding", pa.list_(pa.float32(), 3)),
+            ]
+        ])
+        old = pa.table({
+            "source_uri": ["doc-1"],
+            "node_path": ["1"],
+            "node_chunk_index": [0],
+            "modality": ["text"],
+            "created_at": [dt.datetime(2025, 1, 1)],
+            "content": ["old chunk"],
+            "embedding": [[1.0, 0.0, 0.0]],
+        }, schema=schema)
+        lancedb.connect(str(tmp_path)).create_table("documents", data=old)
+
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks([_chunk("b.txt", 0, [0.0, 1.0, 0.0])])
+        assert {r.document_id for r in store.search([1.0, 0.0, 0.0])} == {"doc-1", "b.txt"}
+        store.delete_chunks("doc-1")
+        assert [r.source_uri for r in store.search([1.0, 0.0, 0.0])] == ["b.txt"]
+
+    @pytest.mark.asyncio
+    async def test_table_without_document_id_is_migrated_async(self, tmp_path):
+        data = pa.table({"source_uri": ["doc-1"], "content": ["old chunk"], "embedding": [[1.0, 0.0, 0.0]]})
+        lancedb.connect(str(tmp_path)).create_table("documents", data=data)
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        assert "document_id" in (await (await store._get_async_table()).schema()).names
+
+    def test_reindex_chunks(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks([_chunk("a.txt", i, [float(i), 0.0, 0.0]) for i in range(3)])
+        store.store_chunks([_chunk("b.txt", 0, [0.0, 1.0, 0.0])])
+        store.reindex_chunks("a.txt", {("1", 0): 1, ("1", 1): 2, ("1", 2): 0})
+        results = store.search([0.0, 0.0, 0.0], limit=4)
+        moved = {r.content: r.node_chunk_index for r in results if r.source_uri == "a.txt"}
+        assert moved == {"a.txt chunk 0": 1, "a.txt chunk 1": 2, "a.txt chunk 2": 0}
+        assert [r.node_chunk_index for r in results if r.source_uri == "b.txt"] == [0]
+
+
+@pytest.mark.unit
+class TestLanceVectorStoreAsync:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("native_async", [True, False])
+    async def test_store_and_search(self, tmp_path, chunks, native_async):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, native_async=native_async)
+        assert await store.search_async([1.0, 0.0, 0.0]) == []
+        await store.store_chunks_async(chunks[:1])
+        await store.store_chunks_async(chunks[1:])
+        results = await store.search_async([0.1, 0.0, 0.9], limit=1)
+        assert [r.source_uri for r in results] == ["c.txt"]
+        assert results[0].embedding == pytest.approx([0.0, 0.0, 1.0])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_and_searches(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        await asyncio.gather(*(
+            store.store_chunks_async([_chunk(f"{i}.txt", 0, [float(i), 1.0, 0.0])]) for i in range(8)
+        ))
+        results = await asyncio.gather(*(store.search_async([float(i), 1.0, 0.0], limit=1) for i in range(8)))
+        assert [r[0].source_uri for r in results] == [f"{i}.txt" for i in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_sync_and_async_see_each_other(self, tmp_path, chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        await store.store_chunks_async(chunks[:1])
+        store.store_chunks(chunks[1:2])
+        assert len(await store.search_async([1.0, 0.0, 0.0])) == 2
+        store.delete_chunks("a.txt")
+        assert [r.source_uri for r in await store.search_async([1.0, 0.0, 0.0])] == ["b.txt"]
+
+    def test_reconnects_per_event_loop(self, tmp_path, chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        asyncio.run(store.store_chunks_async(chunks))
+        results = asyncio.run(store.search_async([1.0, 0.0, 0.0], limit=1))
+        assert [r.source_uri for r in results] == ["a.txt"]
+
+
+@pytest.mark.unit
+class TestLanceVectorStoreColumnarWrites:
+
+    def test_table_uses_lance_schema(self, tmp_path, chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks(chunks)
+        schema = store._get_or_create_table().schema
+        assert schema.field("embedding").type == pa.list_(pa.float32(), 3)
+        assert schema.field("node_chunk_index").type == pa.int64()
+
+    def test_accepts_numpy_embeddings(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks([_chunk("a.txt", i, np.array([i, 1, 0], dtype=np.float64)) for i in range(3)])
+        results = store.search([2.0, 1.0, 0.0], limit=1)
+        assert (results[0].node_chunk_index, results[0].embedding) == (2, pytest.approx([2.0, 1.0, 0.0]))
+
+    def test_rejects_wrong_dimension(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        with pytest.raises(ValueError, match="dimension 3"):
+            store.store_chunks([_chunk("a.txt", 0, [1.0, 0.0])])
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _row_count(store: LanceVectorStore) -> int:
+    table = store._get_or_create_table()
+    return 0 if table is None else table.count_rows()
+
+
+@pytest.mark.unit
+class TestLanceVectorStoreBuffering:
+
+    def test_writes_full_fragments(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, target_fragment_rows=4)
+        for i in range(10):
+            store.store_chunks([_chunk(f"{i}.txt", 0, [float(i), 0.0, 0.0])])
+        assert (_row_count(store), store.pending_rows) == (8, 2)
+        assert len(store._get_or_create_table().list_versions()) == 2
+        store.flush()
+        assert (_row_count(store), store.pending_rows) == (10, 0)
+
+    def test_flush_interval(self, tmp_path):
+        clock = _FakeClock()
+        store = LanceVectorStore(
+            str(tmp_path), embedding_dim=3, target_fragment_rows=100, flush_interval=5.0, clock=clock
+        )
+        store.store_chunks([_chunk("a.txt", 0, [1.0, 0.0, 0.0])])
+        clock.now = 6.0
+        store.store_chunks([_chunk("b.txt", 0, [0.0, 1.0, 0.0])])
+        assert (_row_count(store), store.pending_rows) == (2, 0)
+
+    def test_flush_expired(self, tmp_path):
+        clock = _FakeClock()
+        store = LanceVectorStore(
+            str(tmp_path), embedding_dim=3, target_fragment_rows=100, flush_interval=5.0, clock=clock
+        )
+        store.store_chunks([_chunk("a.txt", 0, [1.0, 0.0, 0.0])])
+        assert not store.flush_expired()
+        clock.now = 5.0
+        assert store.flush_expired()
+        assert (_row_count(store), store.pending_rows) == (1, 0)
+        store.close()
+
+    def test_flush_timer_writes_idle_buffer(self, tmp_path):
+        with LanceVectorStore(str(tmp_path), embedding_dim=3, target_fragment_rows=100, flush_interval=0.05) as store:
+            store.store_chunks([_chunk("a.txt", 0, [1.0, 0.0, 0.0])])
+            deadline = time.monotonic() + 5.0
+            while _row_count(store) == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert (_row_count(store), store.pending_rows) == (1, 0)
+        assert store._flush_thread is None
+
+    def test_max_buffer_bytes(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, target_fragment_rows=100, max_buffer_bytes=1)
+        store.store_chunks([_chunk("a.txt", 0, [1.0, 0.0, 0.0])])
+        assert store.pending_rows == 0
+
+    def test_search_and_delete_flush_first(self, tmp_path, chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, target_fragment_rows=100)
+        store.store_chunks(chunks)
+        assert [r.source_uri for r in store.search([1.0, 0.0, 0.0], limit=1)] == ["a.txt"]
+        store.store_chunks([_chunk("d.txt", 0, [1.0, 0.0, 0.0])])
+        store.delete_chunks("d.txt")
+        assert store.pending_rows == 0
+        assert _row_count(store) == 3
+
+    def test_context_manager_flushes(self, tmp_path, chunks):
+        with LanceVectorStore(str(tmp_path), embedding_dim=3, target_fragment_rows=100) as store:
+            store.store_chunks(chunks)
+            assert _row_count(store) == 0
+        assert _row_count(store) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_buffering(self, tmp_path, chunks):
+        async with LanceVectorStore(str(tmp_path), embedding_dim=3, target_fragment_rows=2) as store:
+            for chunk in chunks:
+                await store.store_chunks_async([chunk])
+            assert store.pending_rows == 1
+            results = await store.search_async([0.0, 0.0, 1.0], limit=1)
+            assert [r.source_uri for r in results] == ["c.txt"]
+        assert _row_count(store) == 3
+
+    def test_rejects_invalid_fragment_rows(self, tmp_path):
+        with pytest.raises(ValueError):
+            LanceVectorStore(str(tmp_path), embedding_dim=3, target_fragment_rows=0)
+
+
+@pytest.mark.unit
+@pytest.mark.filterwarnings("ignore:optimize\\(cleanup_older_than=0\\)")
+class TestLanceMaintenance:
+
+    def _fragmented_store(self, tmp_path, clock) -> LanceVectorStore:
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, clock=clock)
+        for i in range(6):
+            store.store_chunks([_chunk(f"{i}.txt", 0, [float(i), 0.0, 0.0])])
+        return store
+
+    def test_due_after_idle_time(self, tmp_path):
+        clock = _FakeClock()
+        store = self._fragmented_store(tmp_path, clock)
+        scheduler = LanceMaintenanceScheduler(store, MaintenancePolicy(min_fragments=4, idle_time=10.0))
+        assert not scheduler.is_due()
+        assert scheduler.run() is None
+        clock.now = 11.0
+        assert scheduler.is_due()
+
+    def test_not_due_below_thresholds(self, tmp_path):
+        store = self._fragmented_store(tmp_path, _FakeClock())
+        policy = MaintenancePolicy(min_fragments=10, max_versions=10, idle_time=0.0)
+        assert not LanceMaintenanceScheduler(store, policy).is_due()
+
+    def test_run_compacts_and_reports(self, tmp_path):
+        store = self._fragmented_store(tmp_path, _FakeClock())
+        policy = MaintenancePolicy(min_fragments=4, idle_time=0.0, version_retention=dt.timedelta(0))
+        scheduler = LanceMaintenanceScheduler(store, policy)
+        report = scheduler.run()
+        assert (report.fragments_before, report.fragments_after) == (6, 1)
+        assert report.fragments_removed == 6
+        assert report.versions_removed > 0 and report.bytes_removed > 0
+        assert scheduler.last_report is report
+        assert store.table.stats()["fragment_stats"]["num_fragments"] == 1
+        assert len(store.search([5.0, 0.0, 0.0])) == 6
+
+    @pytest.mark.asyncio
+    async def test_run_async_from_event_loop(self, tmp_path):
+        store = self._fragmented_store(tmp_path, _FakeClock())
+        scheduler = LanceMaintenanceScheduler(store, MaintenancePolicy(min_fragments=4, idle_time=0.0))
+        report = await scheduler.run_async()
+        assert (report.fragments_before, report.fragments_after) == (6, 1)
+        assert await scheduler.run_async() is None
+
+    def test_run_without_table(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        assert LanceMaintenanceScheduler(store).run(force=True) is None
+
+    def test_background_maintenance(self, tmp_path):
+        store = self._fragmented_store(tmp_path, _FakeClock())
+        policy = MaintenancePolicy(min_fragments=4, idle_time=0.0, check_interval=0.01)
+        scheduler = store.start_maintenance(policy)
+        for _ in range(200):
+            if scheduler.last_report is not None:
+                break
+            time.sleep(0.01)
+        store.stop_maintenance()
+        assert scheduler.last_report.fragments_after == 1
+
+
+def _random_chunks(n: int, dim: int = 16, seed: int = 0) -> list[EmbeddedDocumentChunk]:
+    rng = np.random.default_rng(seed)
+    return [_chunk(f"{seed}-{i}.txt", 0, rng.random(dim, dtype=np.float32)) for i in range(n)]
+
+
+@pytest.mark.unit
+class TestLanceVectorIndex:
+
+    def test_index_parameters(self):
+        assert num_partitions_for(1_000_000) == 1000
+        assert num_partitions_for(1000) == 3
+        assert num_partitions_for(10) == 1
+        assert num_sub_vectors_for(384) == 24
+        assert num_sub_vectors_for(1000) == 125
+        assert num_sub_vectors_for(3) == 3
+
+    def test_no_index_below_min_rows(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=16, index_policy=VectorIndexPolicy(min_rows=1000))
+        store.store_chunks(_random_chunks(300))
+        assert store.ensure_index() is None
+        assert store.table.list_indices() == []
+
+    def test_no_index_without_policy(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=16)
+        store.store_chunks(_random_chunks(300))
+        assert store.ensure_index() is None
+
+    @pytest.mark.parametrize("index_type", ["IVF_PQ", "IVF_HNSW_SQ"])
+    def test_index_lifecycle(self, tmp_path, index_type):
+        policy = VectorIndexPolicy(index_type=index_type, min_rows=500, update_after_rows=100)
+        store = LanceVectorStore(str(tmp_path), embedding_dim=16, index_policy=policy)
+        store.store_chunks(_random_chunks(600))
+        assert store.ensure_index() == "created"
+        assert store.ensure_index() is None
+        store.store_chunks(_random_chunks(150, seed=1))
+        assert store.ensure_index() == "stale"
+        assert store.table.index_stats("embedding_idx_600").num_unindexed_rows == 150
+        assert LanceMaintenanceScheduler(store).run(force=True).index_action == "updated"
+        assert store.table.index_stats("embedding_idx_600").num_unindexed_rows == 0
+        store.store_chunks(_random_chunks(800, seed=2))
+        assert store.ensure_index() == "rebuilt"
+        assert [index.name for index in store.table.list_indices()] == ["embedding_idx_1550"]
+        assert store.table.index_stats("embedding_idx_1550").num_indexed_rows == 1550
+
+    def test_steady_growth_retrains(self, tmp_path):
+        policy = VectorIndexPolicy(min_rows=500, update_after_rows=100)
+        store = LanceVectorStore(str(tmp_path), embedding_dim=16, index_policy=policy)
+        store.store_chunks(_random_chunks(600))
+        scheduler = LanceMaintenanceScheduler(store)
+        actions = [scheduler.run(force=True).index_action]
+        for seed in range(1, 7):
+            store.store_chunks(_random_chunks(100, seed=seed))
+            actions.append(scheduler.run(force=True).index_action)
+        assert actions == ["created", "updated", "updated", "updated", "updated", "updated", "rebuilt"]
+        assert [index.name for index in store.table.list_indices()] == ["embedding_idx_1200"]
+        # The training size survives a new store instance
+        reopened = LanceVectorStore(str(tmp_path), embedding_dim=16, index_policy=policy)
+        assert reopened.pending_index_action() is None
+
+    def test_search_with_query_parameters(self, tmp_path):
+        chunks = _random_chunks(600)
+        policy = VectorIndexPolicy(min_rows=500, nprobes=2, refine_factor=5)
+        store = LanceVectorStore(str(tmp_path), embedding_dim=16, index_policy=policy)
+        store.store_chunks(chunks)
+        store.ensure_index()
+        query = list(chunks[7].embedding)
+        assert store.search(query, limit=1)[0].source_uri == chunks[7].source_uri
+        assert store.search(query, limit=1, nprobes=3, refine_factor=10)[0].source_uri == chunks[7].source_uri
+
+    @pytest.mark.asyncio
+    async def test_search_async_with_query_parameters(self, tmp_path):
+        chunks = _random_chunks(600)
+        store = LanceVectorStore(str(tmp_path), embedding_dim=16, index_policy=VectorIndexPolicy(min_rows=500))
+        await store.store_chunks_async(chunks)
+        await asyncio.to_thread(store.ensure_index)
+        results = await store.search_async(list(chunks[3].embedding), limit=1, nprobes=3, refine_factor=10)
+        assert results[0].source_uri == chunks[3].source_uri
+
+    def test_maintenance_creates_index(self, tmp_path):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=16, index_policy=VectorIndexPolicy(min_rows=500))
+        store.store_chunks(_random_chunks(600))
+        scheduler = LanceMaintenanceScheduler(store, MaintenancePolicy(idle_time=0.0))
+        assert scheduler.is_due()
+        assert scheduler.run().index_action == "created"
+        assert not scheduler.is_due()
+
+
+class _ConstantEmbedder:
+    """Embeds every text as the same vector"""
+    def encode_batch(self, texts: list[str]) -> list[list[float]]:
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+
+@pytest.fixture
+def dated_chunks() -> list[EmbeddedDocumentChunk]:
+    chunks = []
+    for month in range(1, 7):
+        chunk = _chunk(f"{month}.txt", 0, [1.0, float(month), 0.0])
+        chunk.created_at = dt.datetime(2025, month, 1, tzinfo=dt.timezone.utc)
+        chunk.modality = "image" if month % 2 else "text"
+        chunks.append(chunk)
+    return chunks
+
+
+@pytest.mark.unit
+class TestLanceFilteredSearch:
+
+    def test_chunk_filter(self):
+        assert chunk_filter() is None
+        assert chunk_filter(source_uri="it's.txt") == "source_uri = 'it''s.txt'"
+        assert chunk_filter(source_uri=["a", "b"], modality="text") == "source_uri IN ('a', 'b') AND modality = 'text'"
+        after = dt.datetime(2025, 1, 1, 2, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+        assert chunk_filter(created_after=after) == "created_at >= timestamp '2025-01-01 00:00:00.000000'"
+
+    @pytest.mark.parametrize("prefilter", [True, False])
+    def test_search_where(self, tmp_path, dated_chunks, prefilter):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks(dated_chunks)
+        where = chunk_filter(
+            modality="text",
+            created_after=dt.datetime(2025, 3, 1, tzinfo=dt.timezone.utc),
+            created_before=dt.datetime(2025, 6, 1, tzinfo=dt.timezone.utc),
+        )
+        results = store.search([1.0, 4.0, 0.0], limit=6, where=where, prefilter=prefilter)
+        assert [r.source_uri for r in results] == ["4.txt"]
+
+    @pytest.mark.parametrize("prefilter", [True, False])
+    def test_search_without_sources(self, tmp_path, dated_chunks, prefilter):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks(dated_chunks)
+        assert chunk_filter(source_uri=[], modality="text") == "FALSE AND modality = 'text'"
+        assert store.search([1.0, 1.0, 0.0], limit=6, where=chunk_filter(source_uri=[]), prefilter=prefilter) == []
+
+    def test_prefilter_fills_limit_postfilter_does_not(self, tmp_path, dated_chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3)
+        store.store_chunks(dated_chunks)
+        where = chunk_filter(source_uri="6.txt")
+        assert len(store.search([1.0, 1.0, 0.0], limit=2, where=where)) == 1
+        assert store.search([1.0, 1.0, 0.0], limit=2, where=where, prefilter=False) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("native_async", [True, False])
+    @pytest.mark.parametrize("prefilter", [True, False])
+    async def test_search_async_where(self, tmp_path, dated_chunks, native_async, prefilter):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, native_async=native_async)
+        await store.store_chunks_async(dated_chunks)
+        results = await store.search_async(
+            [1.0, 2.0, 0.0], limit=6, where=chunk_filter(source_uri=["2.txt", "5.txt"]), prefilter=prefilter
+        )
+        assert [r.source_uri for r in results] == ["2.txt", "5.txt"]
+
+    def test_scalar_indexes(self, tmp_path, dated_chunks):
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, scalar_index_policy=ScalarIndexPolicy(min_rows=10))
+        store.store_chunks(dated_chunks)
+        assert store.ensure_scalar_indexes() == []
+        store.store_chunks(_random_chunks(10, dim=3))
+        columns = ["source_uri", "document_id", "node_path", "modality", "created_at"]
+        assert store.missing_scalar_indexes() == columns
+        assert store.ensure_scalar_indexes() == columns
+        assert store.missing_scalar_indexes() == []
+        index_types = {index.columns[0]: index.index_type for index in store.table.list_indices()}
+        assert index_types == {
+            "source_uri": "BTree", "document_id": "BTree", "node_path": "BTree", "modality": "Bitmap", "created_at": "BTree"
+        }
+        results = store.search([1.0, 3.0, 0.0], limit=1, where=chunk_filter(source_uri="3.txt"))
+        assert [r.source_uri for r in results] == ["3.txt"]
+
+    def test_filter_chunks_ingested_by_pipeline(self, tmp_path):
+        paths = []
+        for name in ("a", "b"):
+            path = tmp_path / f"{name}.txt"
+            path.write_text(f"{name} one. {name} two.", encoding="utf-8")
+            paths.append(str(path))
+        store = LanceVectorStore(str(tmp_path / "db"), embedding_dim=3)
+        pipeline = DocumentIngestionPipeline(
+            reader=TextDocumentReader(DefaultContentLoader()),
+            chunker=RegexChunkingStrategy(RegexChunkingStrategy.SENTENCE_PATTERN, units_per_chunk=1),
+            embedder=_ConstantEmbedder(),
+            vector_store=store,
+        )
+        pipeline.ingest_batch(paths)
+
+        results = store.search([1.0, 0.0, 0.0], limit=10, where=chunk_filter(source_uri=paths[1]))
+
+        assert sorted(r.content for r in results) == ["b one.", "b two."]
+        assert {r.source_uri for r in results} == {paths[1]}
+        store.delete_chunks(results[0].document_id)
+        assert store.search([1.0, 0.0, 0.0], limit=10, where=chunk_filter(source_uri=paths[1])) == []
+        assert len(store.search([1.0, 0.0, 0.0], limit=10)) == 2
+
+    def test_maintenance_creates_scalar_indexes(self, tmp_path, dated_chunks):
+        policy = ScalarIndexPolicy(columns={"modality": "BITMAP"}, min_rows=1)
+        store = LanceVectorStore(str(tmp_path), embedding_dim=3, scalar_index_policy=policy)
+        store.store_chunks(dated_chunks)
+        scheduler = LanceMaintenanceScheduler(store, MaintenancePolicy(idle_time=0.0))
+        assert scheduler.is_due()
+        assert scheduler.run().scalar_indexes_created == ["modality"]
+        assert not scheduler.is_due()
@@ -8,21 +8,22 @@ mistral = Mistral(api_key=api_key)
 
 
 class MistralEmbeddingModel:
-    def __init__(self, mistral_client: Mistral = mistral):
+    def __init__(self, mistral_client: Mistral = mistral, model_name: str = "mistral-embed"):
         self._client = mistral_client
+        self.model_name = model_name
 
     def encode(self, text: str) -> list[float]:
-        embedding = self._client.embeddings.create(model="mistral-embed", inputs=[text])
+        embedding = self._client.embeddings.create(model=self.model_name, inputs=[text])
         return embedding.data[0].embedding
 
     async def encode_async(self, text: str) -> list[float]:
-        embedding = await self._client.embeddings.create_async(model="mistral-embed", inputs=[text])
+        embedding = await self._client.embeddings.create_async(model=self.model_name, inputs=[text])
         return embedding.data[0].embedding
 
     def encode_batch(self, batch: list[str]) -> list[list[float]]:
-        embeddings = self._client.embeddings.create(model="mistral-embed", inputs=batch)
+        embeddings = self._client.embeddings.create(model=self.model_name, inputs=batch)
         return list([e.embedding for e in embeddings.data])
 
     async def encode_batch_async(self, batch: list[str]) -> list[list[float]]:
-        embeddings = await self._client.embeddings.create_async(model="mistral-embed", inputs=batch)
+        embeddings = await self._client.embeddings.create_async(model=self.model_name, inputs=batch)
         return list([e.embedding for e in embeddings.data])